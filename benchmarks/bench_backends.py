@@ -0,0 +1,102 @@
+"""Check that every scoring backend gives identical scores, and time them.
+
+Compares the bundled dataset pairs (raw and preprocessed, as frames and as
+Parquet files), a synthetic amazon-shaped pair and a frame pair with
+mismatched dtypes, then times each backend on --rows synthetic rows. Exits
+non-zero if any score differs. Run from the repository root:
+
+    python -m benchmarks.bench_backends --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_dataset
+from dataloD.columnar_io import write_columnar
+from dataloD.data_loader import load_dataset
+from dataprec.data_preprocessing import preprocess_dataset
+from dataquame.backends import BACKENDS, calculate_scores_backend, compare_backends
+
+THRESHOLD_DATE = "2024-06-01"
+PAIRS = [("amazon.csv", "Amazon2.csv"), ("dataset_with_issues.csv", "detail_ds.csv"), ("sample.csv", "second_dataset.csv")]
+CUSTOMER_RULES = {
+    "purchase_amount": {"type": "range", "min": 0, "max": 900},
+    "customer_name": {"type": "not_null"},
+    "email": [{"type": "regex", "pattern": r"[a-z]+@"}, {"type": "length", "min": 5, "max": 30}],
+    "customer_id": {"type": "allowed", "values": [75682867, 66755036]},
+}
+
+def mixed_dtype_frames(rows, seed=1):
+    """A frame and a reference holding the same values under different dtypes."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "count": rng.integers(0, 100, rows),
+        "price": rng.random(rows).round(2),
+        "flag": rng.random(rows) < 0.5,
+        "updated": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 10**7, rows), unit="s"),
+        "label": pd.Series(rng.choice(["a", "b", None], rows)),
+        "kind": pd.Categorical(rng.choice(["x", "y"], rows)),
+    })
+    df.loc[rng.random(rows) < 0.1, "price"] = np.nan
+    df2 = df.iloc[:rows - rows // 100].copy()
+    df2.loc[rng.random(len(df2)) < 0.1, "price"] = np.nan
+    df2 = df2.astype({"count": float, "flag": int, "label": object, "kind": str, "updated": str})
+    return df, df2
+
+def cases(tmp):
+    """Yield ``(label, dataset, reference, rules)`` for the equivalence check."""
+    for name, ref_name in PAIRS:
+        df = load_dataset(os.path.join("Ds'S", name))
+        df2 = load_dataset(os.path.join("Ds'S", ref_name))
+        yield name, df, df2, None
+        if "purchase_date" in df.columns:
+            pre = preprocess_dataset(df.copy(), date_columns=["purchase_date"], numeric_columns=["purchase_amount"],
+                                     categorical_columns=["customer_name"])
+            pre2 = preprocess_dataset(df2.copy(), date_columns=["purchase_date"],
+                                      numeric_columns=["purchase_amount", "customer_id"])
+            yield f"{name} (preprocessed)", pre, pre2, CUSTOMER_RULES
+            paths = [write_columnar(frame, os.path.join(tmp, f"{label}_{name}.parquet"))
+                     for label, frame in (("dataset", pre), ("reference", pre2))]
+            yield f"{name} (parquet)", paths[0], paths[1], CUSTOMER_RULES
+    df, df2 = make_dataset(100_000, 24, null_ratio=0.05, cardinality=0.2)
+    yield "synthetic", df, df2, {"rating": {"type": "range", "min": 2, "max": 4.5},
+                                 "product_id": {"type": "regex", "pattern": "B0+1"}}
+    df, df2 = mixed_dtype_frames(50_000)
+    yield "mixed dtypes", df, df2, {"price": {"type": "allowed", "values": [0.5, np.nan]},
+                                    "count": {"type": "range", "max": 50}}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows for the timing run.")
+    parser.add_argument("--columns", type=int, default=12)
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, dataset, reference, rules in cases(tmp):
+            _, mismatches = compare_backends(dataset, reference, threshold_date=THRESHOLD_DATE, rules=rules)
+            print(f"{label:>45}: {'identical' if not mismatches else f'{len(mismatches)} differences'}")
+            for mismatch in mismatches[:10]:
+                print("    ", mismatch)
+            failures += bool(mismatches)
+
+        df, df2 = make_dataset(args.rows, args.columns)
+        paths = [write_columnar(frame, os.path.join(tmp, f"{name}.parquet")) for name, frame in (("dataset", df), ("reference", df2))]
+        print(f"\n{'backend':>10} {'source':>10} {'seconds':>9}")
+        for backend in BACKENDS:
+            for source, (dataset, reference) in (("frames", (df, df2)), ("parquet", paths)):
+                start = time.perf_counter()
+                calculate_scores_backend(dataset, reference, backend, THRESHOLD_DATE)
+                print(f"{backend:>10} {source:>10} {time.perf_counter() - start:9.3f}")
+
+    if failures:
+        print(f"{failures} cases differ between backends.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the vectorized consistency engine against the legacy per-row loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_consistency --rows 10000 1000000 10000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataquame.data_quality_metrics import consistency_score, consistency_scores
+
+def legacy_consistency_score(df, df2, column1, column2=None):
+    """The original row-by-row implementation, kept as the reference result."""
+    if column2 is None:
+        column2 = column1
+    consistency = 0
+    total = len(df)
+    for i in range(total):
+        val1 = df.iloc[i][column1]
+        val2 = df2.iloc[i][column2]
+        if pd.isna(val1) and pd.isna(val2):
+            consistency += 1
+        elif val1 == val2:
+            consistency += 1
+    return (consistency / total) * 100 if total > 0 else 100
+
+def make_frames(rows, mismatch_rate=0.05, null_rate=0.02, seed=0):
+    """Build a synthetic frame and a perturbed reference copy of it."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "product_id": pd.Series(rng.integers(0, rows, rows)).map("B{:09d}".format),
+        "rating": rng.integers(10, 50, rows) / 10,
+        "rating_count": rng.integers(0, 100000, rows),
+        "category": pd.Categorical(rng.choice(["Electronics", "Home", "Office", "Toys"], rows)),
+    })
+    for col in ("product_id", "rating"):
+        df.loc[rng.random(rows) < null_rate, col] = np.nan
+    df2 = df.copy()
+    flip = rng.random(rows) < mismatch_rate
+    df2.loc[flip, "rating"] = df2.loc[flip, "rating"] + 0.1
+    df2.loc[flip, "rating_count"] = df2.loc[flip, "rating_count"] + 1
+    df2["category"] = df2["category"].cat.add_categories(["Garden"])
+    return df, df2
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--loop-max-rows", type=int, default=20_000,
+                        help="Skip the legacy loop above this size; it is extrapolated instead.")
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'legacy (s)':>12} {'column (s)':>12} {'frame (s)':>12} {'speedup':>10}")
+    for rows in args.rows:
+        df, df2 = make_frames(rows)
+        columns = list(df.columns)
+
+        fast, fast_time = timed(lambda: {col: consistency_score(df, df2, col) for col in columns})
+        frame, frame_time = timed(consistency_scores, df, df2)
+
+        loop_rows = min(rows, args.loop_max_rows)
+        head, ref_head = df.iloc[:loop_rows], df2.iloc[:loop_rows]
+        legacy, legacy_time = timed(lambda: {col: legacy_consistency_score(head, ref_head, col) for col in columns})
+        legacy_time *= rows / loop_rows
+        if loop_rows == rows:
+            for col in columns:
+                assert np.isclose(legacy[col], fast[col]) and np.isclose(legacy[col], frame[col]), col
+
+        label = f"{legacy_time:12.3f}" if loop_rows == rows else f"{legacy_time:11.1f}~"
+        print(f"{rows:>12,} {label} {fast_time:12.3f} {frame_time:12.3f} {legacy_time / frame_time:9.0f}x")
+
+if __name__ == "__main__":
+    main()
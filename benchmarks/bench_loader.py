@@ -0,0 +1,58 @@
+"""Benchmark load_dataset backends on a scaled-up copy of Ds'S/amazon.csv.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_loader --scale 200
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from dataloD.data_loader import ENGINES, load_dataset
+
+SOURCE = os.path.join("Ds'S", "amazon.csv")
+SCORED_COLUMNS = ["product_id", "rating", "rating_count"]
+
+def scale_csv(source, scale, target):
+    """Write ``source`` with its data rows repeated ``scale`` times."""
+    with open(source, encoding="utf-8") as f:
+        header = f.readline()
+        body = f.read()
+    if not body.endswith("\n"):
+        body += "\n"
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(header)
+        for _ in range(scale):
+            f.write(body)
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=200, help="How many times to repeat the data rows.")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "amazon_scaled.csv")
+        scale_csv(SOURCE, args.scale, path)
+        size_mb = os.path.getsize(path) / 1e6
+
+        print(f"{path}: {size_mb:.1f} MB")
+        print(f"{'engine':>8} {'variant':>22} {'rows':>10} {'seconds':>9} {'MB/s':>8}")
+        variants = {
+            "all columns": {},
+            "projected": {"usecols": SCORED_COLUMNS},
+            "projected + inferred": {"usecols": SCORED_COLUMNS, "infer_sample_rows": 10_000},
+        }
+        for engine in args.engines:
+            for variant, options in variants.items():
+                df, seconds = timed(load_dataset, path, engine=engine, **options)
+                print(f"{engine:>8} {variant:>22} {len(df):>10,} {seconds:9.3f} {size_mb / seconds:8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Compare peak memory and time of the legacy report assembly and the streaming writer.
+
+Uses a synthetic profiling report body of --profile-mb megabytes and a
+--columns wide scores table, so ydata_profiling itself is not timed. Run
+from the repository root:
+
+    python -m benchmarks.bench_report_writer --columns 500 --profile-mb 100
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from datadetairep.detailed_report import METRICS, generate_detailed_report, iter_detailed_report
+from dataProfrep.data_profiling_report import write_merged_report
+from dataquaclms.quality_summary import generate_quality_summary, iter_quality_summary
+
+def legacy_write(report_html, detailed_report_content, quality_summary_content, output_path, temp_path):
+    """The original temp-file round trip and f-string assembly."""
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(report_html)
+    del report_html
+    with open(temp_path, "r", encoding="utf-8") as f:
+        report_html = f.read()
+
+    start_body = report_html.find("<body>") + len("<body>")
+    end_body = report_html.find("</body>")
+    profile_body_content = report_html[start_body:end_body]
+
+    custom_sections = f"""
+<link rel="stylesheet" href="dataProfrep\\Dpr.css">
+
+<!-- Navbar -->
+<div class="navbar">
+    <a href="#" onclick="showSection('overview')"><i class="fas fa-chart-pie"></i> Overview</a>
+    <a href="#" onclick="showSection('detailed-report')"><i class="fas fa-list"></i> Detailed Report</a>
+    <a href="#" onclick="showSection('quality-summary')"><i class="fas fa-check-circle"></i> Quality Summary</a>
+</div>
+
+<!-- Sections -->
+<div id="overview" class="section-content active">
+    {profile_body_content}
+</div>
+
+<div id="detailed-report" class="section-content">
+    <h2 class="section-title">Detailed Quality Report</h2>
+    {detailed_report_content}
+</div>
+
+<div id="quality-summary" class="section-content">
+    <h2 class="section-title">Quality Summary</h2>
+    <div class="quality-summary">{quality_summary_content}</div>
+</div>
+
+<script>
+    function showSection(sectionId) {{
+        const sections = document.querySelectorAll('.section-content');
+        sections.forEach(section => section.classList.remove('active'));
+        document.getElementById(sectionId).classList.add('active');
+    }}
+</script>
+
+<script src="https://kit.fontawesome.com/a076d05399.js" crossorigin="anonymous"></script>
+"""
+
+    report_html = report_html[:start_body] + custom_sections + report_html[end_body:]
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(report_html)
+
+def streaming_write(report_html, df, scores_df, overall_score, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        write_merged_report(f, report_html,
+                            iter_detailed_report(df, scores_df, overall_score, chart_format="svg"),
+                            iter_quality_summary(df, scores_df))
+
+def synthetic_inputs(columns, profile_mb, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(columns=[f"column_{i}" for i in range(columns)])
+    scores_df = pd.DataFrame(rng.uniform(0, 100, (columns, len(METRICS))), index=df.columns, columns=METRICS)
+    block = "<div class='row'><span>profile cell</span><span>0.1234</span></div>\n"
+    body = block * (profile_mb * 1_000_000 // len(block))
+    report_html = f"<html><head><title>Profile</title></head><body>{body}</body></html>"
+    return df, scores_df, report_html
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=500)
+    parser.add_argument("--profile-mb", type=int, default=100)
+    args = parser.parse_args()
+
+    df, scores_df, report_html = synthetic_inputs(args.columns, args.profile_mb)
+    overall_score = scores_df.mean().mean()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.html")
+        streamed_path = os.path.join(tmp, "streamed.html")
+
+        def legacy():
+            detailed = generate_detailed_report(df, scores_df, overall_score, chart_format="svg")
+            summary = generate_quality_summary(df, scores_df)
+            legacy_write(report_html, detailed, summary, legacy_path, os.path.join(tmp, "temp_report.html"))
+
+        legacy_time, legacy_peak = measure(legacy)
+        streamed_time, streamed_peak = measure(streaming_write, report_html, df, scores_df, overall_score, streamed_path)
+
+        with open(legacy_path, encoding="utf-8") as a, open(streamed_path, encoding="utf-8") as b:
+            identical = a.read() == b.read()
+        size_mb = os.path.getsize(streamed_path) / 1e6
+
+    print(f"report: {size_mb:.1f} MB, {args.columns} columns, identical output: {identical}")
+    print(f"{'writer':>10} {'seconds':>9} {'peak extra MB':>14}")
+    print(f"{'legacy':>10} {legacy_time:9.3f} {legacy_peak / 1e6:14.1f}")
+    print(f"{'streaming':>10} {streamed_time:9.3f} {streamed_peak / 1e6:14.1f}")
+
+if __name__ == "__main__":
+    main()
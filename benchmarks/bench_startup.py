@@ -0,0 +1,111 @@
+"""Measure CLI start-up time and import cost with ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter; the fastest of --repeat runs is
+kept. Scenarios that only need scores fail if they import a report
+dependency (FORBIDDEN). Pass a previous --output file as --baseline to flag
+scenarios that got slower by more than --tolerance. Run from the repository
+root:
+
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.suite import compare
+
+DATASET = os.path.join("Ds'S", "amazon.csv")
+REFERENCE = os.path.join("Ds'S", "Amazon2.csv")
+
+# Modules the scores-only paths must not import
+FORBIDDEN = ("matplotlib", "seaborn", "ydata_profiling")
+
+def scenarios(output_path):
+    """``{name: (arguments after the interpreter, forbid report imports)}``."""
+    return {
+        "import main": (["-c", "import main"], True),
+        "main --help": (["main.py", "--help"], True),
+        "main scores": (["main.py", "scores", DATASET, REFERENCE, "--output", output_path], True),
+        "import report modules": (["-c", "import datadetairep.detailed_report, dataProfrep.data_profiling_report"], True),
+        "import plotting": (["-c", "import matplotlib.figure, seaborn"], False),
+    }
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into ``{module: (self_us, cumulative_us, depth)}``."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+def run_scenario(args):
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", *args], capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {completed.returncode}:\n{completed.stderr[-2000:]}")
+    return seconds, parse_importtime(completed.stderr)
+
+def summarize(runs, forbid, top):
+    seconds, modules = min(runs, key=lambda run: run[0])
+    # Imports made by the entry point itself and their direct imports, costliest first
+    top_level = sorted(((name, cumulative) for name, (_, cumulative, depth) in modules.items() if depth <= 1),
+                       key=lambda item: -item[1])
+    return {
+        "seconds": seconds,
+        "runs": [run[0] for run in runs],
+        "import_seconds": sum(self_us for self_us, _, _ in modules.values()) / 1e6,
+        "modules": len(modules),
+        "top_imports": [{"module": name, "seconds": cumulative / 1e6} for name, cumulative in top_level[:top]],
+        "forbidden": sorted(name for name in modules if forbid and name in FORBIDDEN),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario; the fastest is kept.")
+    parser.add_argument("--top", type=int, default=10, help="Top-level imports listed per scenario.")
+    parser.add_argument("--output", default="startup_results.json")
+    parser.add_argument("--baseline", help="A previous --output file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before a scenario is flagged.")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="Slowdowns under this many seconds are never flagged.")
+    args = parser.parse_args()
+
+    results = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (command, forbid) in scenarios(os.path.join(tmp, "scores.json")).items():
+            runs = [run_scenario(command) for _ in range(args.repeat)]
+            results[name] = summarize(runs, forbid, args.top)
+            result = results[name]
+            print(f"{name:>24} {result['seconds']:8.3f}s  imports {result['import_seconds']:6.3f}s "
+                  f"({result['modules']} modules)")
+            for item in result["top_imports"][:5]:
+                print(f"{'':>26}{item['module']:<40} {item['seconds']:6.3f}s")
+            if result["forbidden"]:
+                failures.append(name)
+                print(f"{'':>26}imports report dependencies: {', '.join(result['forbidden'])}")
+
+    record = {"meta": {"created_at": time.time(), "python": sys.version.split()[0], "repeat": args.repeat},
+              "results": results}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures += compare(results, baseline, args.tolerance, args.min_delta)
+    if failures:
+        print(f"Start-up checks failed: {', '.join(failures)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
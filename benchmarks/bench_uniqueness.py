@@ -0,0 +1,54 @@
+"""Report HyperLogLog error and speedup against exact nunique().
+
+Covers every column of the bundled datasets plus a synthetic high-cardinality
+column. Run from the repository root:
+
+    python -m benchmarks.bench_uniqueness --precision 12 14 16 --rows 1000000
+"""
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataloD.data_loader import load_dataset
+from dataquame.sketches import HyperLogLog
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def compare(label, column, precision):
+    exact, exact_time = timed(column.nunique)
+    sketch, sketch_time = timed(HyperLogLog.from_values, column, precision)
+    estimate = sketch.count()
+    error = abs(estimate - exact) / exact * 100 if exact else 0.0
+    print(f"{label:>45} {precision:>4} {exact:>11,} {estimate:>13,.0f} {error:>7.2f}% "
+          f"{exact_time:>9.4f} {sketch_time:>9.4f} {exact_time / sketch_time:>7.2f}x")
+    return error
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--precision", type=int, nargs="+", default=[14])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows of the synthetic review-id column.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    synthetic = pd.Series(rng.integers(0, args.rows, args.rows)).map("R{:013d}".format)
+
+    print(f"{'column':>45} {'p':>4} {'exact':>11} {'estimate':>13} {'error':>8} "
+          f"{'exact (s)':>9} {'hll (s)':>9} {'speedup':>8}")
+    for precision in args.precision:
+        errors = []
+        for path in sorted(glob.glob(os.path.join("Ds'S", "*.csv"))):
+            df = load_dataset(path)
+            for col in df.columns:
+                errors.append(compare(f"{os.path.basename(path)}:{col}"[-45:], df[col], precision))
+        errors.append(compare(f"synthetic review_id ({args.rows:,} rows)", synthetic, precision))
+        print(f"{'mean error':>45} {precision:>4} {'':>11} {'':>13} {np.mean(errors):>7.2f}%\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Time every scoring function, the loader, preprocessing and the report generators on synthetic data.
+
+Results are written as a JSON baseline; pass a previous one with --baseline
+to flag cases that got slower by more than --tolerance. Run from the
+repository root:
+
+    python -m benchmarks.suite --rows 200000 --output bench.json
+    python -m benchmarks.suite --rows 200000 --baseline bench.json --output bench_new.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_dataset, write_dataset
+from dataloD.data_loader import load_dataset, load_dataset_chunks
+from dataprec.data_preprocessing import preprocess_dataset
+from dataquame import data_quality_metrics as dqm
+
+def scoring_cases(df, df2, dated):
+    """Cases for the functions of dataquame/data_quality_metrics.py."""
+    column = df["product_id"]
+    return {
+        "completeness_score": lambda: dqm.completeness_score(column),
+        "uniqueness_score": lambda: dqm.uniqueness_score(column),
+        "validity_score": lambda: dqm.validity_score(df["rating"]),
+        "validity_score[rules]": lambda: dqm.validity_score(df["rating"], rules=[{"type": "range", "min": 1, "max": 5}]),
+        "timeliness_score": lambda: dqm.timeliness_score(dated, "2024-01-01"),
+        "accuracy_score": lambda: dqm.accuracy_score(df, df2, "product_id"),
+        "consistency_score": lambda: dqm.consistency_score(df, df2, "product_id"),
+        "consistency_scores": lambda: dqm.consistency_scores(df, df2),
+        "calculate_scores": lambda: dqm.calculate_scores(df, df2),
+        "calculate_scores[thread]": lambda: dqm.calculate_scores(df, df2, executor="thread"),
+        "calculate_scores[approx]": lambda: dqm.calculate_scores(df, df2, uniqueness="approx"),
+        "calculate_scores[keyed]": lambda: dqm.calculate_scores(df, df2, key_columns=["review_id"]),
+        "align_reference": lambda: dqm.align_reference(df, df2, ["review_id"]),
+        "overall_quality_score": lambda: dqm.overall_quality_score(dqm.calculate_scores(df, df2)),
+    }
+
+def io_cases(df, df2, path, ref_path):
+    """Cases for loading and preprocessing."""
+    chunksize = max(1, len(df) // 4)
+    return {
+        "load_dataset": lambda: load_dataset(path),
+        "load_dataset_chunks": lambda: sum(len(chunk) for chunk in load_dataset_chunks(path, chunksize, dtype=str)),
+        "calculate_scores_chunked": lambda: dqm.calculate_scores_chunked(
+            load_dataset_chunks(path, chunksize, dtype=str), load_dataset_chunks(ref_path, chunksize, dtype=str)),
+        "preprocess_dataset": lambda: preprocess_dataset(df.copy(), numeric_columns=["rating"],
+                                                         text_columns=["product_name"], categorical_columns=["category"]),
+        "preprocess_dataset[optimize_memory]": lambda: preprocess_dataset(df.copy(), optimize_memory=True),
+    }
+
+def report_cases(df, df2, output_path):
+    """Cases for the report generators; the profiling overview runs with profile_mode="off"."""
+    from datadetairep.detailed_report import generate_detailed_report
+    from dataquaclms.quality_summary import generate_quality_summary
+    from dataProfrep.data_profiling_report import generate_ydata_profiling_report
+
+    scores_df = dqm.calculate_scores(df, df2)
+    overall = dqm.overall_quality_score(scores_df)
+    return {
+        "generate_detailed_report[png]": lambda: generate_detailed_report(df, scores_df, overall, chart_cache_dir=None),
+        "generate_detailed_report[svg]": lambda: generate_detailed_report(df, scores_df, overall, chart_format="svg"),
+        "generate_quality_summary": lambda: generate_quality_summary(df, scores_df),
+        "generate_ydata_profiling_report[off]": lambda: generate_ydata_profiling_report(
+            df, generate_detailed_report(df, scores_df, overall, chart_format="svg"),
+            generate_quality_summary(df, scores_df), output_path, profile_mode="off"),
+    }
+
+def run_case(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"seconds": min(times), "runs": times}
+
+def compare(results, baseline, tolerance, min_delta):
+    """Print each case against the baseline; return the names of regressed cases.
+
+    A case regresses when it is more than ``tolerance`` slower and at least
+    ``min_delta`` seconds slower, so timer noise on tiny cases is not flagged.
+    """
+    regressions = []
+    print(f"{'case':>40} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"{name:>40} {'-':>10} {result['seconds']:10.4f} {'new':>7}")
+            continue
+        ratio = result["seconds"] / previous["seconds"] if previous["seconds"] else float("inf")
+        slower = result["seconds"] - previous["seconds"]
+        flag = " REGRESSION" if ratio > 1 + tolerance and slower >= min_delta else ""
+        print(f"{name:>40} {previous['seconds']:10.4f} {result['seconds']:10.4f} {ratio:6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--null-ratio", type=float, default=0.02)
+    parser.add_argument("--cardinality", type=float, default=0.5)
+    parser.add_argument("--mismatch-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is kept.")
+    parser.add_argument("--groups", nargs="+", default=["scoring", "io", "reports"], choices=["scoring", "io", "reports"])
+    parser.add_argument("--cases", nargs="+", help="Only run the cases with these names.")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="A previous --output file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before a case is flagged.")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="Slowdowns under this many seconds are never flagged.")
+    args = parser.parse_args()
+
+    params = {key: getattr(args, key) for key in ("rows", "columns", "null_ratio", "cardinality", "mismatch_rate", "seed")}
+    df, df2 = make_dataset(**params)
+    dated = pd.Series(pd.Timestamp("2023-01-01") + pd.to_timedelta(np.arange(len(df)) % 1000, unit="D"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(df, os.path.join(tmp, "synthetic.csv"))
+        ref_path = write_dataset(df2, os.path.join(tmp, "synthetic_reference.csv"))
+        cases = {}
+        if "scoring" in args.groups:
+            cases.update(scoring_cases(df, df2, dated))
+        if "io" in args.groups:
+            cases.update(io_cases(df, df2, path, ref_path))
+        if "reports" in args.groups:
+            cases.update(report_cases(df, df2, os.path.join(tmp, "report.html")))
+        if args.cases:
+            cases = {name: func for name, func in cases.items() if name in args.cases}
+
+        results = {}
+        for name, func in cases.items():
+            results[name] = run_case(func, args.repeat)
+            print(f"{name:>40} {results[name]['seconds']:10.4f}s")
+
+    record = {
+        "meta": {
+            "created_at": time.time(),
+            "python": sys.version.split()[0],
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+            **params,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if {key: baseline["meta"].get(key) for key in params} != params:
+            print("Warning: the baseline was recorded with different data parameters.")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} cases regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Generate amazon.csv-shaped frames, with a perturbed reference copy, for benchmarks.
+
+Run from the repository root to write a dataset/reference CSV pair:
+
+    python -m benchmarks.synthetic --rows 1000000 --columns 24 --out /tmp/synthetic
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# The columns of Ds'S/amazon.csv, in order; wider frames repeat them with a numeric suffix
+AMAZON_COLUMNS = ["product_id", "product_name", "category", "discounted_price", "actual_price",
+                  "discount_percentage", "rating", "rating_count", "review_id", "review_title",
+                  "img_link", "product_link"]
+
+CATEGORIES = [
+    "Computers&Accessories|Accessories&Peripherals|Cables&Accessories|Cables|USBCables",
+    "Electronics|WearableTechnology|SmartWatches",
+    "Electronics|Mobiles&Accessories|Smartphones&BasicMobiles|Smartphones",
+    "Electronics|HomeTheater,TV&Video|Televisions|SmartTelevisions",
+    "Home&Kitchen|Kitchen&HomeAppliances|SmallKitchenAppliances|MixerGrinders",
+    "OfficeProducts|OfficePaperProducts|Paper|Stationery|Pens,Pencils&WritingSupplies",
+]
+WORDS = np.array(["Wayona", "Nylon", "Braided", "USB", "Fast", "Charging", "Cable", "Compatible", "iPhone",
+                  "Type", "Smart", "Watch", "Black", "Grey", "Pack", "Data", "Sync", "Pro", "Mini", "Air"])
+REVIEW_TITLES = np.array(["Satisfied", "Charging is really fast", "Value for money", "Good quality",
+                          "Worth it", "Not bad", "Stopped working", "Excellent product"])
+
+def _pool(kind, size, rng):
+    """``size`` distinct values in the textual format amazon.csv uses for a column."""
+    ids = np.arange(size)
+    if kind == "product_id":
+        return np.char.add("B0", np.char.zfill(np.char.upper(np.char.mod("%x", ids)), 8))
+    if kind == "product_name":
+        words = WORDS[rng.integers(0, len(WORDS), (size, 6))]
+        return np.char.add(np.array([" ".join(row) for row in words]), np.char.mod(" (%d)", ids))
+    if kind == "category":
+        return np.array(CATEGORIES)[ids % len(CATEGORIES)]
+    if kind in ("discounted_price", "actual_price"):
+        return np.array([f"₹{price:,}" for price in ids + 99])
+    if kind == "discount_percentage":
+        return np.char.add((ids % 100).astype(str), "%")
+    if kind == "rating":
+        return np.char.mod("%.1f", 1 + (ids % 41) / 10)
+    if kind == "rating_count":
+        return np.array([f"{count:,}" for count in ids])
+    if kind == "review_id":
+        return np.char.add("R", np.char.upper(np.char.mod("%012x", ids * 7919)))
+    if kind == "review_title":
+        return np.char.add(REVIEW_TITLES[ids % len(REVIEW_TITLES)], np.char.mod(",%d", ids))
+    if kind == "img_link":
+        return np.char.add(np.char.add("https://m.media-amazon.com/images/I/", ids.astype(str)), ".jpg")
+    return np.char.add("https://www.amazon.in/dp/B0", ids.astype(str))
+
+def make_dataset(rows, columns=len(AMAZON_COLUMNS), null_ratio=0.02, cardinality=0.5, mismatch_rate=0.05, seed=0):
+    """Build an amazon.csv-shaped frame and a reference frame that differs from it.
+
+    Args:
+        rows (int): Rows of both frames.
+        columns (int): Number of columns; past the 12 amazon columns they repeat as ``rating_2`` etc.
+        null_ratio (float): Share of cells set to NaN in every column.
+        cardinality (float): Distinct values per column as a share of ``rows`` (the
+            category column is capped at its few real values).
+        mismatch_rate (float): Share of cells whose reference value differs.
+        seed (int): Random seed; the same arguments always give the same frames.
+
+    Returns:
+        tuple: ``(df, df2)``, both with string columns as ``load_dataset`` reads them.
+    """
+    rng = np.random.default_rng(seed)
+    distinct = max(1, int(rows * cardinality))
+    data, reference, pools = {}, {}, {}
+    for i in range(columns):
+        kind = AMAZON_COLUMNS[i % len(AMAZON_COLUMNS)]
+        name = kind if i < len(AMAZON_COLUMNS) else f"{kind}_{i // len(AMAZON_COLUMNS) + 1}"
+        if kind not in pools:
+            pools[kind] = _pool(kind, distinct + 1, rng)
+        pool = pools[kind]
+        codes = rng.integers(0, distinct, rows)
+        values = pool[codes].astype(object)
+        values[rng.random(rows) < null_ratio] = np.nan
+        ref_values = values.copy()
+        # Mismatched cells take a value outside the frame's own pool
+        ref_values[rng.random(rows) < mismatch_rate] = pool[distinct]
+        data[name] = values
+        reference[name] = ref_values
+    return pd.DataFrame(data), pd.DataFrame(reference)
+
+def write_dataset(df, path):
+    df.to_csv(path, index=False)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=len(AMAZON_COLUMNS))
+    parser.add_argument("--null-ratio", type=float, default=0.02)
+    parser.add_argument("--cardinality", type=float, default=0.5)
+    parser.add_argument("--mismatch-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=".", help="Directory receiving synthetic.csv and synthetic_reference.csv.")
+    args = parser.parse_args()
+
+    df, df2 = make_dataset(args.rows, args.columns, args.null_ratio, args.cardinality, args.mismatch_rate, args.seed)
+    os.makedirs(args.out, exist_ok=True)
+    for frame, name in ((df, "synthetic.csv"), (df2, "synthetic_reference.csv")):
+        print(write_dataset(frame, os.path.join(args.out, name)))
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,14 @@
-from ydata_profiling import ProfileReport
+import html
+import os
+import tempfile
+import time
 
-def generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path="ydata_profiling_report.html"):
-    try:
-        # Generate the YData Profiling report
-        profile = ProfileReport(df, title="YData Profiling Report", explorative=True)
-
-        # Save the profiling report to a temporary file
-        temp_path = "temp_report.html"
-        profile.to_file(temp_path)
-
-        with open(temp_path, "r", encoding="utf-8") as f:
-            report_html = f.read()
+PROFILE_MODES = ("off", "minimal", "sampled", "full")
 
-        # Extract just the body content of the YData Profiling report
-        start_body = report_html.find("<body>") + len("<body>")
-        end_body = report_html.find("</body>")
-        profile_body_content = report_html[start_body:end_body]
+# Large strings are written in slices of this many characters, so no full-size copy is made
+WRITE_BLOCK_SIZE = 1 << 20
 
-        custom_sections = f"""
+NAVBAR = """
 <link rel="stylesheet" href="dataProfrep\\Dpr.css">
 
 <!-- Navbar -->
@@ -29,36 +20,171 @@ def generate_ydata_profiling_report(df, detailed_report_content, quality_summary
 
 <!-- Sections -->
 <div id="overview" class="section-content active">
-    {profile_body_content}
+    """
+
+DETAILED_REPORT_OPEN = """
 </div>
 
 <div id="detailed-report" class="section-content">
     <h2 class="section-title">Detailed Quality Report</h2>
-    {detailed_report_content}
+    """
+
+QUALITY_SUMMARY_OPEN = """
 </div>
 
 <div id="quality-summary" class="section-content">
     <h2 class="section-title">Quality Summary</h2>
-    <div class="quality-summary">{quality_summary_content}</div>
+    <div class="quality-summary">"""
+
+SECTIONS_CLOSE = """</div>
 </div>
 
 <script>
-    function showSection(sectionId) {{
+    function showSection(sectionId) {
         const sections = document.querySelectorAll('.section-content');
         sections.forEach(section => section.classList.remove('active'));
         document.getElementById(sectionId).classList.add('active');
-    }}
+    }
 </script>
 
 <script src="https://kit.fontawesome.com/a076d05399.js" crossorigin="anonymous"></script>
 """
 
-        # Replace <body> tag to include the custom sections
-        report_html = report_html[:start_body] + custom_sections + report_html[end_body:]
+def _write_slice(f, text, start, end):
+    for offset in range(start, end, WRITE_BLOCK_SIZE):
+        f.write(text[offset:min(offset + WRITE_BLOCK_SIZE, end)])
+
+def _write_content(f, content):
+    """Write a section given as one string or as an iterable of HTML pieces."""
+    if isinstance(content, str):
+        _write_slice(f, content, 0, len(content))
+        return
+    first = True
+    for piece in content:
+        if not first:
+            f.write("\n")
+        f.write(piece)
+        first = False
+
+def write_merged_report(f, report_html, detailed_report_content, quality_summary_content):
+    """Stream the profiling report with the custom sections spliced into its body.
+
+    ``report_html`` is the full profiling report; it is written to ``f`` in
+    slices around the navbar and section wrappers rather than rebuilt as a new
+    string. The detailed report and quality summary may be strings or
+    iterables of HTML pieces (e.g. ``iter_detailed_report``), in which case
+    they are written as they are generated.
+    """
+    start_body = report_html.find("<body>")
+    start_body = 0 if start_body < 0 else start_body + len("<body>")
+    end_body = report_html.find("</body>", start_body)
+    end_body = len(report_html) if end_body < 0 else end_body
+
+    _write_slice(f, report_html, 0, start_body)
+    f.write(NAVBAR)
+    _write_slice(f, report_html, start_body, end_body)
+    f.write(DETAILED_REPORT_OPEN)
+    _write_content(f, detailed_report_content)
+    f.write(QUALITY_SUMMARY_OPEN)
+    _write_content(f, quality_summary_content)
+    f.write(SECTIONS_CLOSE)
+    _write_slice(f, report_html, end_body, len(report_html))
+
+def sample_for_profiling(df, sample_rows, stratify_by=None, random_state=0):
+    """Draw a uniform random sample of about ``sample_rows`` rows.
+
+    With ``stratify_by``, every value of that column keeps its share of the
+    rows in the sample. Frames no larger than ``sample_rows`` are returned as is.
+    """
+    if len(df) <= sample_rows:
+        return df
+    if stratify_by is None:
+        return df.sample(n=sample_rows, random_state=random_state)
+    fraction = sample_rows / len(df)
+    return df.groupby(stratify_by, group_keys=False, dropna=False).sample(frac=fraction, random_state=random_state)
+
+def build_overview_html(df, title="Dataset Overview"):
+    """A lightweight overview page computed with pandas alone, for ``profile_mode="off"``."""
+    rows, columns = df.shape
+    missing = int(df.isna().sum().sum())
+    cells = rows * columns
+    stats = [
+        ("Number of rows", f"{rows:,}"),
+        ("Number of columns", f"{columns:,}"),
+        ("Missing cells", f"{missing:,} ({missing / cells * 100 if cells else 0:.2f}%)"),
+        ("Duplicate rows", f"{int(df.duplicated().sum()):,}"),
+        ("Memory size", f"{df.memory_usage(deep=True).sum() / 1e6:.2f} MB"),
+    ]
+    parts = [f"<html><head><title>{html.escape(title)}</title></head><body>", f"<h1>{html.escape(title)}</h1>", "<table>"]
+    parts += [f"<tr><th>{name}</th><td>{value}</td></tr>" for name, value in stats]
+    parts += ["</table>", "<table>", "<tr><th>Column</th><th>Type</th><th>Missing</th><th>Distinct</th></tr>"]
+    for col in df.columns:
+        column = df[col]
+        parts.append(f"<tr><td>{html.escape(str(col))}</td><td>{column.dtype}</td>"
+                     f"<td>{int(column.isna().sum()):,}</td><td>{int(column.nunique()):,}</td></tr>")
+    parts += ["</table>", "</body></html>"]
+    return "\n".join(parts)
+
+def generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path="ydata_profiling_report.html",
+                                    profile_mode="full", sample_rows=10_000, stratify_by=None, raise_errors=False):
+    """Write the merged report and return the time spent in each stage.
+
+    ``profile_mode`` trades overview depth for latency:
+        "full"     ydata profiling of the whole frame, with correlations and interactions
+        "sampled"  the same on a random sample of ``sample_rows`` rows (stratified by
+                   ``stratify_by`` if given)
+        "minimal"  ydata's minimal mode on the whole frame
+        "off"      a pandas-only summary table, without ydata profiling
+
+    Errors are printed and the output left as it was; with ``raise_errors``
+    they are raised instead, for callers that report failures themselves.
+    """
+    if profile_mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{profile_mode}'. Expected one of {PROFILE_MODES}.")
+
+    timings = {}
+    try:
+        start = time.perf_counter()
+        profiled = df
+        title = "YData Profiling Report"
+        if profile_mode == "sampled":
+            profiled = sample_for_profiling(df, sample_rows, stratify_by)
+            title = f"YData Profiling Report (sample of {len(profiled):,} of {len(df):,} rows)"
+        timings["sample"] = time.perf_counter() - start
+
+        # Generate the profiling overview
+        start = time.perf_counter()
+        if profile_mode == "off":
+            report_html = build_overview_html(df)
+        else:
+            # ydata_profiling takes seconds to import, so it is only imported when a profile is built
+            from ydata_profiling import ProfileReport
+
+            profile = ProfileReport(profiled, title=title, explorative=profile_mode != "minimal",
+                                    minimal=profile_mode == "minimal")
+            # Render the report in memory instead of round-tripping through a temporary file
+            report_html = profile.to_html()
+        timings["profile"] = time.perf_counter() - start
+
+        # Stream the final report, with the custom sections in its body, to a temporary file next
+        # to the output, which only replaces a previous report once every section is written
+        start = time.perf_counter()
+        fd, temp_path = tempfile.mkstemp(suffix=".html.tmp", dir=os.path.dirname(os.path.abspath(output_path)))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                write_merged_report(f, report_html, detailed_report_content, quality_summary_content)
+            # mkstemp creates the file readable by its owner only
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        timings["write"] = time.perf_counter() - start
 
-        # Write the final report to the output file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(report_html)
         print(f"Report saved successfully to {output_path}")
+        print("Profiling stage timings: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"Error generating YData profiling report: {e}")
+    return timings
@@ -0,0 +1,197 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from dataloD.columnar_io import write_column_statistics, write_scores
+from dataloD.data_loader import load_dataset
+from datainstr.instrumentation import RunRecorder, peak_rss_bytes
+from dataquame.data_quality_metrics import calculate_scores, overall_quality_score
+
+def load_manifest(path):
+    """Read a batch manifest: a JSON list of jobs, or an object with a ``jobs`` list.
+
+    Each job needs ``dataset`` and ``reference`` paths and may set ``name``,
+    ``rules`` (validation rule specs per column), ``key_columns``,
+    ``threshold_date``, ``uniqueness``, ``output`` (report path; omit it for a
+    scores-only job), ``profile_mode``, ``chart_format``, and ``scores_output`` / ``stats_output``
+    (Parquet or Arrow IPC paths for the scores and per-column statistics).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    jobs = manifest["jobs"] if isinstance(manifest, dict) else manifest
+    for i, job in enumerate(jobs):
+        missing = [key for key in ("dataset", "reference") if key not in job]
+        if missing:
+            raise ValueError(f"Job {i} in '{path}' is missing {missing}.")
+        job.setdefault("name", os.path.splitext(os.path.basename(job["dataset"]))[0])
+    return jobs
+
+class ReferenceCache:
+    """Loads each reference dataset once and shares the frame across jobs.
+
+    Reference frames are only read by the scoring code, never modified, so the
+    same object is safe to hand to concurrent jobs. With ``max_entries``, the
+    least recently used frames beyond that many are dropped; frames fetched
+    with ``pin=True`` are kept until they are discarded and do not count.
+    """
+
+    def __init__(self, load=load_dataset, max_entries=None):
+        self._load = load
+        self._lock = threading.Lock()
+        self._frames = OrderedDict()
+        self._pinned = set()
+        self.max_entries = max_entries
+
+    def get(self, path, pin=False):
+        with self._lock:
+            if pin:
+                self._pinned.add(path)
+            entry = self._frames.get(path)
+            if entry is None:
+                entry = self._frames[path] = {"ready": threading.Event(), "frame": None, "error": None}
+                owner = True
+                self._evict()
+            else:
+                self._frames.move_to_end(path)
+                owner = False
+        if owner:
+            try:
+                entry["frame"] = self._load(path)
+            except Exception as e:
+                entry["error"] = e
+            entry["ready"].set()
+        entry["ready"].wait()
+        if entry["error"] is not None:
+            raise entry["error"]
+        return entry["frame"]
+
+    def _evict(self):
+        # Called with the lock held; jobs already holding an evicted frame keep using it
+        if self.max_entries is None:
+            return
+        unpinned = [path for path in self._frames if path not in self._pinned]
+        for path in unpinned[:max(0, len(unpinned) - self.max_entries)]:
+            del self._frames[path]
+
+    def loaded(self):
+        """``{path: frame}`` of the references loaded so far."""
+        with self._lock:
+            entries = list(self._frames.items())
+        return {path: entry["frame"] for path, entry in entries if entry["ready"].is_set() and entry["error"] is None}
+
+    def discard(self, path):
+        """Forget (and unpin) ``path`` so its next ``get`` reads the file again."""
+        with self._lock:
+            self._frames.pop(path, None)
+            self._pinned.discard(path)
+
+def _timed_load(path, load):
+    start = time.perf_counter()
+    df = load(path)
+    return df, time.perf_counter() - start
+
+def _render_report(job, df, scores_df, overall_score):
+    # Report dependencies are heavy, so they are only imported when a job asks for a report
+    from datadetairep.detailed_report import iter_detailed_report
+    from dataquaclms.quality_summary import iter_quality_summary
+    from dataProfrep.data_profiling_report import generate_ydata_profiling_report
+
+    output_dir = os.path.dirname(job["output"])
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    generate_ydata_profiling_report(
+        df,
+        iter_detailed_report(df, scores_df, overall_score, chart_format=job.get("chart_format", "png"), chart_workers=1),
+        iter_quality_summary(df, scores_df),
+        job["output"],
+        profile_mode=job.get("profile_mode", "minimal"),
+        raise_errors=True,
+    )
+
+def run_job(job, load_future, references):
+    """Score (and optionally report) one job; always returns its status record."""
+    record = {
+        "name": job["name"],
+        "dataset": job["dataset"],
+        "reference": job["reference"],
+        "status": "ok",
+        "error": None,
+    }
+    recorder = RunRecorder(job["name"])
+    started = time.perf_counter()
+    try:
+        # The dataset was read on the loader thread; its stage time is the read itself
+        df, load_seconds = load_future.result()
+        recorder.add_stage("load", load_seconds)
+
+        with recorder.stage("reference"):
+            df2 = references.get(job["reference"])
+
+        with recorder.stage("score"):
+            scores_df = calculate_scores(df, df2, threshold_date=job.get("threshold_date"), key_columns=job.get("key_columns"),
+                                         rules=job.get("rules"), uniqueness=job.get("uniqueness", "exact"), recorder=recorder)
+            overall_score = overall_quality_score(scores_df)
+        # NaN when no column scores; written as null so the status file stays valid JSON
+        record.update(rows=len(df), columns=len(df.columns),
+                      overall_score=None if math.isnan(overall_score) else float(overall_score),
+                      scores=json.loads(scores_df.to_json(orient="index")))
+
+        if job.get("scores_output") or job.get("stats_output"):
+            with recorder.stage("write"):
+                if job.get("scores_output"):
+                    record["scores_output"] = write_scores(scores_df, job["scores_output"])
+                if job.get("stats_output"):
+                    record["stats_output"] = write_column_statistics(df, job["stats_output"])
+
+        if job.get("output"):
+            with recorder.stage("report"):
+                _render_report(job, df, scores_df, overall_score)
+            record["output"] = job["output"]
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["timings"] = recorder.stage_seconds()
+    record["timings"]["total"] = time.perf_counter() - started
+    record["metric_timings"] = recorder.metric_totals()
+    record["peak_rss_bytes"] = peak_rss_bytes()
+    return record
+
+def run_batch(jobs, max_workers=4, prefetch=1, status_path=None, load=load_dataset):
+    """Run many validation jobs with a bounded worker pool.
+
+    ``max_workers`` jobs are scored and reported at once while a separate
+    loader thread reads up to ``prefetch`` further datasets ahead of them, so
+    loading the next job overlaps with scoring the current ones. Each
+    reference dataset is loaded once and shared by every job that names it.
+
+    Status records are returned in manifest order and, if ``status_path`` is
+    given, appended to it as JSON lines as soon as each job finishes.
+    """
+    references = ReferenceCache(load)
+    # Bounds the number of loaded-but-unfinished datasets held in memory
+    slots = threading.BoundedSemaphore(max_workers + prefetch)
+    status_lock = threading.Lock()
+
+    def finish(job, load_future):
+        try:
+            record = run_job(job, load_future, references)
+        finally:
+            slots.release()
+        if status_path:
+            with status_lock, open(status_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        print(f"[{record['status']}] {record['name']} in {record['timings']['total']:.2f}s"
+              + (f": {record['error']}" if record["error"] else ""))
+        return record
+
+    with ThreadPoolExecutor(max_workers=1) as loader, ThreadPoolExecutor(max_workers=max_workers) as workers:
+        futures = []
+        for job in jobs:
+            slots.acquire()
+            load_future = loader.submit(_timed_load, job["dataset"], load)
+            futures.append(workers.submit(finish, job, load_future))
+        return [future.result() for future in futures]
@@ -1,8 +1,23 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import io
+import os
+import json
 import base64
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+METRICS = ['Completeness', 'Timeliness', 'Validity', 'Accuracy', 'Uniqueness', 'Consistency']
+
+CHART_FORMATS = ("png", "svg")
+
+# Rendered PNG charts are cached here, keyed by a hash of the column's score vector
+CHART_CACHE_DIR = ".chart_cache"
+
+# Cached chart files kept; the least recently used are removed beyond this
+CHART_CACHE_MAX_ENTRIES = 512
+
+# Bump when the look of the charts changes, so stale cache entries are ignored
+CHART_STYLE_VERSION = 1
 
 # def generate_detailed_report(df, detailed_scores_df, overall_score):
 #     try:
@@ -131,105 +146,260 @@ import base64
 #         print(f"Error generating report: {e}")
 #         return ""
 
-def generate_detailed_report(df, detailed_scores_df, overall_score):
+def _figure_to_base64(fig):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    buffer = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buffer)
+    encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    buffer.close()
+    return encoded
+
+def render_charts(col, values, metrics=METRICS):
+    """Render the bar chart and heatmap of one column as base64 PNGs.
+
+    Uses standalone Figure objects rather than the pyplot state machine, so it
+    is safe to call from several worker processes at once.
+    """
+    # matplotlib and seaborn are imported on first render, since SVG charts and
+    # cached PNGs never need them and they take most of a second to import
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    # Generate Bar Chart
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
+    ax.bar(metrics, values, color='#3498db')
+    ax.set_title(f"{col}")
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    bar_chart = _figure_to_base64(fig)
+
+    # Generate Heatmap
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
+    sns.heatmap(np.array(values).reshape(1, -1), annot=True, fmt=".2f", cmap="coolwarm", cbar=False, xticklabels=metrics, yticklabels=[col], ax=ax)
+    ax.set_title(f"{col}")
+    fig.tight_layout()
+    heatmap = _figure_to_base64(fig)
+
+    return {'bar_chart': bar_chart, 'heatmap': heatmap}
+
+def _chart_cache_key(col, values, metrics):
+    payload = json.dumps([CHART_STYLE_VERSION, str(col), list(metrics), [round(float(v), 6) for v in values]])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _load_cached_charts(cache_dir, key):
+    path = os.path.join(cache_dir, f"{key}.json")
     try:
-        # Define the metrics list in the specified order
-        metrics = ['Completeness', 'Timeliness', 'Validity', 'Accuracy', 'Uniqueness', 'Consistency']
-
-        html_content = []
-
-        # Link the external CSS file
-        html_content.append("""<link rel="stylesheet" type="text/css" href="datadetairep\\Gde.css">""")
-
-        # Start of Content
-        html_content.append("<div class='container'>")
-
-        # Overall Score Section
-        html_content.append(f"<div class='overall-score'>Overall Data Quality Score: {overall_score:.2f}%</div>")
-
-        # Column-wise Detailed Scores
-        html_content.append("<table>")
-        html_content.append("<tr><th>Column</th>" + "".join(f"<th>{metric}</th>" for metric in metrics) + "</tr>")
-        for col, scores in detailed_scores_df.iterrows():
-            html_content.append("<tr>" + f"<td>{col}</td>" + "".join(f"<td>{scores.get(metric, 0):.2f}%</td>" for metric in metrics) + "</tr>")
-        html_content.append("</table>")
-
-        # Add a note above the average quality scores table
-        if overall_score >= 80:
-            quality_message = "<div class='note' style='color: green;'>NOTE : The overall data quality is considered good as it is above 80%.</div>"
-        else:
-            quality_message = "<div class='note' style='color: red; align-items: center;'>The overall data quality is below 80%, indicating potential issues.</div>"
-
-        html_content.append(quality_message)
-
-        # Overall Quality Metrics Table
-        html_content.append("<h4>Average Quality Scores</h4>")
-        html_content.append("<table>")
-        html_content.append("<tr><th>Metric</th><th>Average Score (%)</th></tr>")
-        for metric in metrics:
-            overall_metric_score = detailed_scores_df[metric].mean()
-            html_content.append(f"<tr><td>{metric}</td><td>{overall_metric_score:.2f}%</td></tr>")
-        html_content.append("</table>")
+        with open(path, "r", encoding="utf-8") as f:
+            charts = json.load(f)
+        os.utime(path)  # Marks the entry as recently used for _prune_chart_cache
+        return charts
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_charts(cache_dir, key, charts):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.json")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(charts, f)
+    os.replace(f"{path}.tmp", path)  # Atomic, so concurrent runs never read half a file
+
+def _prune_chart_cache(cache_dir, max_entries):
+    """Remove the least recently used cached charts beyond ``max_entries``."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".json"):
+            path = os.path.join(cache_dir, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:  # Removed by a concurrent run
+                pass
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - max_entries)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def render_all_charts(column_values, metrics=METRICS, cache_dir=CHART_CACHE_DIR, max_workers=None,
+                      max_cache_entries=CHART_CACHE_MAX_ENTRIES):
+    """Render PNG charts for ``{column: score values}``, reusing cached renders.
+
+    Columns whose score vector was rendered before are read from ``cache_dir``
+    (``None`` disables the cache); the rest are rendered in a process pool of
+    ``max_workers`` processes (``1`` renders in this process). The cache keeps
+    at most ``max_cache_entries`` charts, dropping the least recently used.
+    """
+    charts_data = {}
+    keys = {col: _chart_cache_key(col, values, metrics) for col, values in column_values.items()}
+    if cache_dir:
+        for col, key in keys.items():
+            cached = _load_cached_charts(cache_dir, key)
+            if cached is not None:
+                charts_data[col] = cached
+
+    pending = [col for col in column_values if col not in charts_data]
+    if max_workers == 1 or len(pending) <= 1:
+        rendered = [render_charts(col, column_values[col], metrics) for col in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rendered = list(pool.map(render_charts, pending, [column_values[col] for col in pending],
+                                     [metrics] * len(pending)))
+
+    for col, charts in zip(pending, rendered):
+        charts_data[col] = charts
+        if cache_dir:
+            _store_cached_charts(cache_dir, keys[col], charts)
+    if cache_dir and pending:
+        _prune_chart_cache(cache_dir, max_cache_entries)
+    return {col: charts_data[col] for col in column_values}
+
+def _svg_color(value, low, high):
+    """Blue-white-red colour of ``value`` on a ``low``..``high`` scale, like the coolwarm map."""
+    t = 0.5 if high <= low else (value - low) / (high - low)
+    blue, white, red = (59, 76, 192), (221, 221, 221), (180, 4, 38)
+    start, end, t = (blue, white, t * 2) if t < 0.5 else (white, red, (t - 0.5) * 2)
+    return "#" + "".join(f"{round(a + (b - a) * t):02x}" for a, b in zip(start, end))
+
+def render_svg_charts(col, values, metrics=METRICS):
+    """Build lightweight inline SVG versions of the bar chart and heatmap.
+
+    The browser draws them, so no figures are rasterized or base64-encoded.
+    """
+    width, height, left, bottom = 480, 300, 40, 80
+    step = (width - left) / len(metrics)
+    peak = max(100.0, *values) or 1.0
+    bars = []
+    for i, (metric, value) in enumerate(zip(metrics, values)):
+        x = left + i * step + step * 0.15
+        bar_height = (height - bottom - 20) * value / peak
+        y = height - bottom - bar_height
+        bars.append(f"<rect x='{x:.1f}' y='{y:.1f}' width='{step * 0.7:.1f}' height='{bar_height:.1f}' fill='#3498db'><title>{metric}: {value:.2f}%</title></rect>"
+                    f"<text x='{x + step * 0.35:.1f}' y='{height - bottom + 12}' font-size='11' text-anchor='end' transform='rotate(-45 {x + step * 0.35:.1f} {height - bottom + 12})'>{metric}</text>")
+    bar_chart = (f"<svg viewBox='0 0 {width} {height}' xmlns='http://www.w3.org/2000/svg' role='img' aria-label='{col} Bar Chart'>"
+                 f"<text x='{width / 2}' y='14' font-size='13' text-anchor='middle'>{col}</text>"
+                 f"<line x1='{left}' y1='{height - bottom}' x2='{width}' y2='{height - bottom}' stroke='#333'/>"
+                 + "".join(bars) + "</svg>")
+
+    low, high = min(values), max(values)
+    cell = (width - left) / len(metrics)
+    cells = []
+    for i, (metric, value) in enumerate(zip(metrics, values)):
+        x = left + i * cell
+        cells.append(f"<rect x='{x:.1f}' y='24' width='{cell:.1f}' height='60' fill='{_svg_color(value, low, high)}'/>"
+                     f"<text x='{x + cell / 2:.1f}' y='58' font-size='12' text-anchor='middle'>{value:.2f}</text>"
+                     f"<text x='{x + cell / 2:.1f}' y='100' font-size='10' text-anchor='middle'>{metric}</text>")
+    heatmap = (f"<svg viewBox='0 0 {width} 110' xmlns='http://www.w3.org/2000/svg' role='img' aria-label='{col} Heatmap'>"
+               f"<text x='{width / 2}' y='14' font-size='13' text-anchor='middle'>{col}</text>"
+               + "".join(cells) + "</svg>")
+    return {'bar_chart': bar_chart, 'heatmap': heatmap}
+
+def generate_detailed_report(df, detailed_scores_df, overall_score, chart_format="png",
+                             chart_workers=None, chart_cache_dir=CHART_CACHE_DIR):
+    """Build the detailed report HTML.
+
+    ``chart_format="png"`` embeds matplotlib renders (rendered in parallel and
+    cached, see ``render_all_charts``); ``"svg"`` embeds inline SVG charts drawn
+    by the browser instead.
+    """
+    try:
+        return "\n".join(iter_detailed_report(df, detailed_scores_df, overall_score, chart_format,
+                                              chart_workers, chart_cache_dir))
+    except Exception as e:
+        print(f"Error generating report: {e}")
+        return ""
 
-        # Dropdown for Charts
-        html_content.append("""<h4>Select a Column to View Visualizations</h4>
+def iter_detailed_report(df, detailed_scores_df, overall_score, chart_format="png",
+                         chart_workers=None, chart_cache_dir=CHART_CACHE_DIR):
+    """Yield the detailed report HTML piece by piece (see ``generate_detailed_report``).
+
+    Each column's charts are yielded one at a time, so a report writer can
+    stream the section without building the whole document as one string.
+    """
+    if chart_format not in CHART_FORMATS:
+        raise ValueError(f"Unknown chart format '{chart_format}'. Expected one of {CHART_FORMATS}.")
+
+    # Define the metrics list in the specified order
+    metrics = METRICS
+
+    # Link the external CSS file
+    yield """<link rel="stylesheet" type="text/css" href="datadetairep\\Gde.css">"""
+
+    # Start of Content
+    yield "<div class='container'>"
+
+    # Overall Score Section
+    yield f"<div class='overall-score'>Overall Data Quality Score: {overall_score:.2f}%</div>"
+
+    # Column-wise Detailed Scores
+    yield "<table>"
+    yield "<tr><th>Column</th>" + "".join(f"<th>{metric}</th>" for metric in metrics) + "</tr>"
+    for col, scores in detailed_scores_df.iterrows():
+        yield "<tr>" + f"<td>{col}</td>" + "".join(f"<td>{scores.get(metric, 0):.2f}%</td>" for metric in metrics) + "</tr>"
+    yield "</table>"
+
+    # Add a note above the average quality scores table
+    if overall_score >= 80:
+        quality_message = "<div class='note' style='color: green;'>NOTE : The overall data quality is considered good as it is above 80%.</div>"
+    else:
+        quality_message = "<div class='note' style='color: red; align-items: center;'>The overall data quality is below 80%, indicating potential issues.</div>"
+
+    yield quality_message
+
+    # Overall Quality Metrics Table
+    yield "<h4>Average Quality Scores</h4>"
+    yield "<table>"
+    yield "<tr><th>Metric</th><th>Average Score (%)</th></tr>"
+    for metric in metrics:
+        overall_metric_score = detailed_scores_df[metric].mean()
+        yield f"<tr><td>{metric}</td><td>{overall_metric_score:.2f}%</td></tr>"
+    yield "</table>"
+
+    # Dropdown for Charts
+    yield """<h4>Select a Column to View Visualizations</h4>
         <select id="column-select" onchange="showChart(this.value)">
             <option value="">Select a Column</option>
-        """)
-
-        charts_data = {}
-        for col, scores in detailed_scores_df.iterrows():
-            html_content.append(f"<option value='{col}'>{col}</option>")
-            values = [scores.get(metric, 0) for metric in metrics]
-
-            # Generate Bar Chart
-            plt.figure(figsize=(8, 6))
-            plt.bar(metrics, values, color='#3498db')
-            plt.title(f"{col}")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=100)
-            buffer.seek(0)
-            bar_chart = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            buffer.close()
-            plt.close()
-
-            # Generate Heatmap
-            plt.figure(figsize=(8, 6))
-            sns.heatmap(np.array(values).reshape(1, -1), annot=True, fmt=".2f", cmap="coolwarm", cbar=False, xticklabels=metrics, yticklabels=[col])
-            plt.title(f"{col}")
-            plt.tight_layout()
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=100)
-            buffer.seek(0)
-            heatmap = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            buffer.close()
-            plt.close()
-
-            charts_data[col] = {'bar_chart': bar_chart, 'heatmap': heatmap}
-
-        html_content.append("</select>")
-
-        # Charts Section
-        html_content.append("<div class='chart-container' id='chart-container'>")
-        for col, charts in charts_data.items():
-            html_content.append(f"""
+        """
+
+    column_values = {}
+    for col, scores in detailed_scores_df.iterrows():
+        yield f"<option value='{col}'>{col}</option>"
+        column_values[col] = [float(scores.get(metric, 0)) for metric in metrics]
+
+    if chart_format == "svg":
+        charts_data = {col: render_svg_charts(col, values, metrics) for col, values in column_values.items()}
+    else:
+        charts_data = render_all_charts(column_values, metrics, chart_cache_dir, chart_workers)
+
+    yield "</select>"
+
+    # Charts Section
+    yield "<div class='chart-container' id='chart-container'>"
+    for col in column_values:
+        charts = charts_data.pop(col)
+        if chart_format == "svg":
+            bar_chart, heatmap = charts['bar_chart'], charts['heatmap']
+        else:
+            bar_chart = f"<img src='data:image/png;base64,{charts['bar_chart']}' alt='{col} Bar Chart'>"
+            heatmap = f"<img src='data:image/png;base64,{charts['heatmap']}' alt='{col} Heatmap'>"
+        yield f"""
             <div id="{col}-charts" style="display:none;" class="charts-side-by-side">
                 <div class="chart">
                     <h3>Bar Chart</h3>
-                    <img src='data:image/png;base64,{charts['bar_chart']}' alt='{col} Bar Chart'>
+                    {bar_chart}
                 </div>
                 <div class="chart">
                     <h3>Heatmap</h3>
-                    <img src='data:image/png;base64,{charts['heatmap']}' alt='{col} Heatmap'>
+                    {heatmap}
                 </div>
             </div>
-            """)
-        html_content.append("</div>")  # End Chart Container
+            """
+    yield "</div>"  # End Chart Container
 
-        # JavaScript for Interactivity
-        html_content.append("""
+    # JavaScript for Interactivity
+    yield """
         <script>
             function showChart(column) {
                 const charts = document.querySelectorAll("[id$='-charts']");
@@ -244,13 +414,7 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
                 }
             }
         </script>
-        """)
-
-        # End of Container
-        html_content.append("</div>")
-
-        return "\n".join(html_content)
+        """
 
-    except Exception as e:
-        print(f"Error generating report: {e}")
-        return ""
+    # End of Container
+    yield "</div>"
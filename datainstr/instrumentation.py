@@ -0,0 +1,173 @@
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module; peak RSS is then not reported
+    resource = None
+
+def peak_rss_bytes(children=False):
+    """Peak resident set size of this process (or of its finished child processes), or ``None``."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+def add_metric_time(timings, col, metric, seconds):
+    column_timings = timings.setdefault(col, {})
+    column_timings[metric] = column_timings.get(metric, 0.0) + seconds
+
+def merge_metric_timings(timings, other):
+    """Add the ``{column: {metric: seconds}}`` timings of ``other`` into ``timings``."""
+    for col, metrics in other.items():
+        for metric, seconds in metrics.items():
+            add_metric_time(timings, col, metric, seconds)
+    return timings
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+class RunRecorder:
+    """Collects stage timings, per-metric/per-column timings and memory use of one run.
+
+    Wrap each pipeline step in ``with recorder.stage("load"):`` and pass the
+    recorder to ``calculate_scores`` for metric timings. With ``trace_memory``,
+    tracemalloc runs for the recorder's lifetime and each stage also records
+    its traced peak and its ``top_allocations`` largest allocation sites.
+
+    tracemalloc is process-wide, so keep ``trace_memory`` off when several
+    recorders run at once (e.g. batch jobs on threads).
+    """
+
+    def __init__(self, name="data_quality_run", trace_memory=False, top_allocations=10):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.top_allocations = top_allocations
+        self.started_at = time.time()
+        self.stages = {}
+        self.metric_timings = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def stage(self, name):
+        """Time a pipeline stage; the stage is recorded even if it raises."""
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {"seconds": time.perf_counter() - start, "peak_rss_bytes": peak_rss_bytes()}
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record["traced_current_bytes"] = current
+                record["traced_peak_bytes"] = peak
+                record["top_allocations"] = self._top_allocations()
+            with self._lock:
+                self.stages[name] = record
+
+    def add_stage(self, name, seconds):
+        """Record a stage timed elsewhere (e.g. on another thread)."""
+        with self._lock:
+            self.stages[name] = {"seconds": seconds}
+
+    def _top_allocations(self):
+        statistics = tracemalloc.take_snapshot().statistics("lineno")[:self.top_allocations]
+        return [{"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 "size_bytes": stat.size, "count": stat.count} for stat in statistics]
+
+    def add_metric_timings(self, timings):
+        """Add ``{column: {metric: seconds}}`` timings (as collected by ``calculate_scores``)."""
+        with self._lock:
+            merge_metric_timings(self.metric_timings, timings)
+
+    def stage_seconds(self):
+        return {name: stage["seconds"] for name, stage in self.stages.items()}
+
+    def metric_totals(self):
+        """Seconds spent on each metric, summed over all columns."""
+        totals = {}
+        for metrics in self.metric_timings.values():
+            for metric, seconds in metrics.items():
+                totals[metric] = totals.get(metric, 0.0) + seconds
+        return totals
+
+    def close(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def to_dict(self):
+        """The JSON run record."""
+        return {
+            "run": self.name,
+            "started_at": self.started_at,
+            "python": sys.version.split()[0],
+            "stages": self.stages,
+            "metric_totals": self.metric_totals(),
+            "metric_timings": self.metric_timings,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "peak_rss_children_bytes": peak_rss_bytes(children=True),
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_prometheus(self):
+        """The run record in the Prometheus text exposition format (e.g. for the node exporter textfile collector)."""
+        lines = [
+            "# HELP dq_stage_seconds Wall time of a pipeline stage.",
+            "# TYPE dq_stage_seconds gauge",
+        ]
+        lines += [f"dq_stage_seconds{_labels(run=self.name, stage=name)} {stage['seconds']:.6f}"
+                  for name, stage in self.stages.items()]
+        lines += [
+            "# HELP dq_metric_seconds Time spent computing a metric, summed over columns.",
+            "# TYPE dq_metric_seconds gauge",
+        ]
+        lines += [f"dq_metric_seconds{_labels(run=self.name, metric=metric)} {seconds:.6f}"
+                  for metric, seconds in self.metric_totals().items()]
+        lines += [
+            "# HELP dq_column_metric_seconds Time spent computing a metric for one column.",
+            "# TYPE dq_column_metric_seconds gauge",
+        ]
+        lines += [f"dq_column_metric_seconds{_labels(run=self.name, column=col, metric=metric)} {seconds:.6f}"
+                  for col, metrics in self.metric_timings.items() for metric, seconds in metrics.items()]
+        traced = {name: stage["traced_peak_bytes"] for name, stage in self.stages.items() if "traced_peak_bytes" in stage}
+        if traced:
+            lines += [
+                "# HELP dq_stage_traced_peak_bytes Peak Python heap allocations traced during a stage.",
+                "# TYPE dq_stage_traced_peak_bytes gauge",
+            ]
+            lines += [f"dq_stage_traced_peak_bytes{_labels(run=self.name, stage=name)} {peak}" for name, peak in traced.items()]
+        peak = peak_rss_bytes()
+        if peak is not None:
+            lines += [
+                "# HELP dq_peak_rss_bytes Peak resident set size of the run.",
+                "# TYPE dq_peak_rss_bytes gauge",
+                f"dq_peak_rss_bytes{_labels(run=self.name)} {peak}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
@@ -0,0 +1,119 @@
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+# File extensions read and written as columnar files, and their pyarrow dataset format
+COLUMNAR_FORMATS = {".parquet": "parquet", ".pq": "parquet", ".feather": "ipc", ".arrow": "ipc", ".ipc": "ipc"}
+
+# Rows per Parquet row group; smaller groups let filters skip more of a file
+ROW_GROUP_SIZE = 128 * 1024
+
+def columnar_format(path):
+    """The pyarrow format of a columnar file ("parquet" or "ipc"), or ``None`` for other files."""
+    return COLUMNAR_FORMATS.get(os.path.splitext(str(path))[1].lower())
+
+def _require_pyarrow(path):
+    if pa is None:
+        raise ImportError(f"pyarrow is required to read or write '{path}'. Install it with 'pip install pyarrow'.")
+
+def _to_pandas(table):
+    # split_blocks keeps one block per column, so columns without nulls can share Arrow's buffers;
+    # dates become datetime64 columns rather than objects, so they are scored for timeliness
+    return table.to_pandas(split_blocks=True, date_as_object=False)
+
+def read_columnar(path, columns=None, filters=None, memory_map=True):
+    """Read a Parquet or Arrow IPC (Feather) file into a DataFrame.
+
+    Only ``columns`` are read. ``filters`` are row predicates in the
+    ``pyarrow.parquet`` form, e.g. ``[("rating", ">=", 4)]`` or a list of such
+    lists (OR of ANDs); Parquet row groups whose statistics rule them out are
+    skipped without being decoded.
+
+    Uncompressed Arrow IPC files are memory-mapped, so the operating system
+    pages the reference data in on demand and shares it between processes
+    reading the same file.
+    """
+    file_format = columnar_format(path)
+    if file_format is None:
+        raise ValueError(f"'{path}' is not a Parquet or Arrow IPC file. Expected one of {sorted(COLUMNAR_FORMATS)}.")
+    _require_pyarrow(path)
+
+    if file_format == "ipc" and filters is None:
+        source = pa.memory_map(str(path), "r") if memory_map else pa.OSFile(str(path), "rb")
+        table = pa.ipc.open_file(source).read_all()
+        return _to_pandas(table.select(columns) if columns is not None else table)
+
+    dataset = ds.dataset(path, format=file_format)
+    expression = pq.filters_to_expression(filters) if filters is not None else None
+    return _to_pandas(dataset.to_table(columns=columns, filter=expression))
+
+def column_names(path):
+    """Column names of a Parquet or Arrow IPC file, read from its schema without loading any data."""
+    _require_pyarrow(path)
+    return ds.dataset(path, format=columnar_format(path)).schema.names
+
+def write_columnar(df, path, index=False):
+    """Write a DataFrame as Parquet or Arrow IPC, according to the extension of ``path``.
+
+    IPC files are written uncompressed so ``read_columnar`` can memory-map them;
+    Parquet files use ``ROW_GROUP_SIZE`` row groups with statistics for pruning.
+    """
+    file_format = columnar_format(path)
+    if file_format is None:
+        raise ValueError(f"'{path}' is not a Parquet or Arrow IPC path. Expected one of {sorted(COLUMNAR_FORMATS)}.")
+    _require_pyarrow(path)
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    if file_format == "ipc":
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema,
+                                                                  options=pa.ipc.IpcWriteOptions(compression=None)) as writer:
+            writer.write_table(table)
+    else:
+        pq.write_table(table, path, row_group_size=ROW_GROUP_SIZE)
+    return path
+
+def convert_to_columnar(csv_path, path, **load_options):
+    """Parse a CSV once with ``load_dataset`` and store it as Parquet or Arrow IPC for later runs."""
+    from dataloD.data_loader import load_dataset
+
+    return write_columnar(load_dataset(csv_path, **load_options), path)
+
+def column_statistics(df):
+    """Per-column statistics of a DataFrame: dtype, row, null and distinct counts, and min/max/mean.
+
+    Min and max are stored as text so columns of any type fit one table;
+    mean is only set for numeric columns.
+    """
+    rows = []
+    for col in df.columns:
+        column = df[col]
+        numeric = pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+        orderable = numeric or pd.api.types.is_datetime64_any_dtype(column)
+        non_null = column.dropna()
+        rows.append({
+            "column": str(col),
+            "dtype": str(column.dtype),
+            "rows": len(column),
+            "nulls": int(len(column) - len(non_null)),
+            "distinct": int(non_null.nunique()),
+            "min": str(non_null.min()) if orderable and len(non_null) else None,
+            "max": str(non_null.max()) if orderable and len(non_null) else None,
+            "mean": float(non_null.mean()) if numeric and len(non_null) else None,
+        })
+    return pd.DataFrame(rows, columns=["column", "dtype", "rows", "nulls", "distinct", "min", "max", "mean"])
+
+def write_scores(scores_df, path):
+    """Write ``scores_df`` as Parquet (or Arrow IPC), one row per column with a ``column`` field."""
+    scores = scores_df.astype(float).rename_axis("column").reset_index()
+    scores["column"] = scores["column"].astype(str)
+    return write_columnar(scores, path)
+
+def write_column_statistics(df, path):
+    """Write ``column_statistics(df)`` as Parquet (or Arrow IPC)."""
+    return write_columnar(column_statistics(df), path)
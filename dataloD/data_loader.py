@@ -1,10 +1,162 @@
+import warnings
+
 import pandas as pd
 
+from dataloD.columnar_io import columnar_format, read_columnar
+
+ENGINES = ("python", "c", "pyarrow")
+
+# Leading rows load_dataset_chunks infers column types from
+INFER_SAMPLE_ROWS = 10_000
+
+def _bad_line_options(engine, skipped):
+    """``read_csv`` options that skip malformed lines while counting them into ``skipped``."""
+    def skip(bad_line):
+        skipped.append(bad_line)
+        return "skip" if engine == "pyarrow" else None
+
+    if engine == "c":
+        # The C parser only supports string policies; its warnings are counted instead
+        return {"on_bad_lines": "warn"}
+    return {"on_bad_lines": skip}
+
+def _count_skipped_lines(caught):
+    return sum(str(w.message).count("Skipping line") for w in caught if issubclass(w.category, pd.errors.ParserWarning))
+
+def _raw_column_names(path, names):
+    """Map stripped column names back to the names as written in the CSV header."""
+    header = pd.read_csv(path, nrows=0, encoding="utf-8").columns
+    raw = {col.strip(): col for col in header}
+    missing = [name for name in names if name not in raw]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in '{path}'.")
+    return raw
+
+def infer_dtypes(path, sample_rows=INFER_SAMPLE_ROWS, usecols=None):
+    """Infer a ``read_csv`` dtype map from the first ``sample_rows`` rows of a CSV.
+
+    Integer and boolean columns map to their nullable types, since nulls may
+    appear after the sample; text columns are pinned to ``str``.
+    """
+    sample = pd.read_csv(path, nrows=sample_rows, usecols=usecols, on_bad_lines="skip", encoding="utf-8")
+    dtypes = {}
+    for col, dtype in sample.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            dtypes[col] = "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[col] = "Int64"
+        elif pd.api.types.is_float_dtype(dtype):
+            dtypes[col] = "float64"
+        elif not pd.api.types.is_datetime64_any_dtype(dtype):
+            dtypes[col] = str
+    return dtypes
+
+def _read_csv(path, engine, usecols, dtype):
+    skipped = []
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", pd.errors.ParserWarning)
+        df = pd.read_csv(path, engine=engine, usecols=usecols, dtype=dtype or None, encoding="utf-8",
+                         **_bad_line_options(engine, skipped))
+    return df, len(skipped) + _count_skipped_lines(caught)
+
+def _load_columnar(path, usecols, dtype, filters):
+    df = read_columnar(path, columns=usecols, filters=filters)
+    if dtype:
+        df = df.astype(dtype)
+    df.columns = df.columns.str.strip()  # Strip column names
+    df.attrs["skipped_bad_lines"] = 0
+    return df
+
 # Load dataset
-def load_dataset(path):
+def load_dataset(path, engine="python", usecols=None, dtype=None, infer_sample_rows=None, filters=None):
+    """Load a CSV dataset, skipping malformed lines.
+
+    Parquet and Arrow IPC (Feather) files, recognised by their extension (see
+    ``dataloD.columnar_io``), are read with pyarrow instead: only ``usecols``
+    are decoded, ``filters`` prune rows and row groups, and IPC files are
+    memory-mapped. ``engine`` and ``infer_sample_rows`` apply to CSV only.
+
+    Args:
+        path (str): Path of the CSV, Parquet or Arrow IPC file.
+        engine (str, optional): Parser backend, one of ``ENGINES``. Defaults to the python
+            parser, which ``load_dataset_chunks`` also uses: rows with too many fields are
+            skipped and short rows are padded with nulls. The C parser is faster and reads
+            rows the same way; pyarrow also skips short rows.
+        usecols (list, optional): Only parse these columns (names as they appear after stripping).
+        dtype (dict, optional): Explicit column dtypes, keyed by stripped column name.
+        infer_sample_rows (int, optional): Infer dtypes from this many leading rows for
+            columns not listed in ``dtype``. If the full file does not fit the sampled
+            types, it is re-read with full inference.
+        filters (list, optional): Row filters for Parquet/IPC files, in the
+            ``pyarrow.parquet`` form, e.g. ``[("rating", ">=", 4)]``.
+
+    Returns:
+        pd.DataFrame: The dataset; ``df.attrs["skipped_bad_lines"]`` holds the number of
+        malformed lines that were skipped.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+
     try:
-        df = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8")
+        if columnar_format(path) is not None:
+            return _load_columnar(path, usecols, dtype, filters)
+        if filters is not None:
+            raise ValueError("Row filters are only supported for Parquet and Arrow IPC files.")
+
+        names = list(usecols or []) + list(dtype or {})
+        raw = _raw_column_names(path, names) if names else {}
+        raw_usecols = [raw[col] for col in usecols] if usecols else None
+        dtypes = {raw[col]: col_dtype for col, col_dtype in (dtype or {}).items()}
+
+        inferred = {}
+        if infer_sample_rows:
+            inferred = infer_dtypes(path, infer_sample_rows, raw_usecols)
+            inferred = {col: col_dtype for col, col_dtype in inferred.items() if col not in dtypes}
+
+        try:
+            df, skipped = _read_csv(path, engine, raw_usecols, {**inferred, **dtypes})
+        except (ValueError, TypeError):
+            if not inferred:
+                raise
+            # A value past the sample did not fit the inferred types
+            df, skipped = _read_csv(path, engine, raw_usecols, dtypes)
+
         df.columns = df.columns.str.strip()  # Strip column names
+        df.attrs["skipped_bad_lines"] = skipped
         return df
     except Exception as e:
         raise ValueError(f"Error reading the file: {e}")
+
+# Load dataset in chunks
+def load_dataset_chunks(path, chunksize=100_000, dtype=None, infer_sample_rows=INFER_SAMPLE_ROWS):
+    """Yield the dataset as DataFrames of at most ``chunksize`` rows.
+
+    Column types are inferred once, from the first ``infer_sample_rows`` rows
+    (see ``infer_dtypes``), and every chunk is read with them, so a column
+    does not come back numeric in one chunk and text in another. Columns
+    listed in ``dtype`` (raw header names, or one dtype for every column) are
+    read as given; ``infer_sample_rows=None`` infers types per chunk as
+    ``read_csv`` does. A value past the sample that does not fit its column's
+    inferred type raises ``ValueError``; pass ``dtype`` for that column.
+
+    Malformed lines are skipped and counted as in ``load_dataset``; each
+    chunk's ``attrs["skipped_bad_lines"]`` holds the lines skipped so far, so
+    the last chunk holds the total for the file. The python engine is used,
+    since the C engine misses malformed lines that start a chunk.
+    """
+    skipped = []
+    inferred = {}
+    try:
+        if infer_sample_rows and (dtype is None or isinstance(dtype, dict)):
+            inferred = {col: col_dtype for col, col_dtype in infer_dtypes(path, infer_sample_rows).items()
+                        if col not in (dtype or {})}
+            dtype = {**inferred, **(dtype or {})}
+        reader = pd.read_csv(path, engine="python", encoding="utf-8", chunksize=chunksize, dtype=dtype,
+                             **_bad_line_options("python", skipped))
+        for chunk in reader:
+            chunk.columns = chunk.columns.str.strip()  # Strip column names
+            chunk.attrs["skipped_bad_lines"] = len(skipped)
+            yield chunk
+    except Exception as e:
+        hint = f" (types inferred from the first {infer_sample_rows:,} rows; pass dtype for this column)" if inferred else ""
+        raise ValueError(f"Error reading the file: {e}{hint}")
@@ -1,20 +1,172 @@
+import re
+import warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    # Arrow-backed strings are stored in contiguous buffers instead of one Python object per value;
+    # missing values stay NaN, as in object columns, so comparisons and isna behave the same
+    try:
+        STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        STRING_DTYPE = pd.StringDtype("pyarrow_numpy")
+except ImportError:
+    pa = pc = None
+    STRING_DTYPE = None
+
+# Values sampled to detect the format of a date column
+DATE_SAMPLE_ROWS = 1000
+# Rows per chunk when a date column is parsed on several processes
+DATE_CHUNK_ROWS = 1_000_000
+
+# Date formats detected by preprocess_dataset, keyed by (dataset, column)
+DATE_FORMAT_CACHE = {}
+
+def detect_date_format(column, sample_rows=DATE_SAMPLE_ROWS, min_share=0.9):
+    """
+    Detects the strftime format of a column of date strings from a sample of its values.
+
+    Formats are guessed (month-first and day-first) for values spread evenly
+    over the column, and the guess that parses the most sampled values wins.
+
+    Args:
+        column (pd.Series): The column of date strings.
+        sample_rows (int, optional): Number of non-null values sampled. Defaults to 1000.
+        min_share (float, optional): Share of the sample the format must parse. Defaults to 0.9.
+
+    Returns:
+        str or None: The detected format, or None if the column does not hold
+        strings or no format parses enough of the sample.
+    """
+    sample = column.dropna()
+    if not len(sample) or not (pd.api.types.is_string_dtype(sample) or sample.dtype == object):
+        return None
+    sample = sample.iloc[::max(1, len(sample) // sample_rows)].iloc[:sample_rows].astype(str)
+
+    candidates = Counter()
+    with warnings.catch_warnings():
+        # guess_datetime_format warns about day-first ambiguity; both orders are tried below
+        warnings.simplefilter("ignore")
+        for value in sample.unique():
+            for dayfirst in (False, True):
+                candidates[guess_datetime_format(value, dayfirst=dayfirst)] += 1
+    candidates.pop(None, None)
+
+    best_format, best_parsed = None, 0
+    for date_format, _ in candidates.most_common():
+        parsed = int(pd.to_datetime(sample, format=date_format, errors="coerce").notna().sum())
+        if parsed > best_parsed:
+            best_format, best_parsed = date_format, parsed
+    return best_format if best_parsed >= min_share * len(sample) else None
 
-def preprocess_column(column, dtype, date_format=None, errors='coerce'):
+# The resolution pandas gives parsed date strings (it differs between pandas versions)
+PARSED_DATE_DTYPE = pd.to_datetime(pd.Series(["2000-01-01"]), format="%Y-%m-%d").dtype
+
+# strftime directives Arrow's vectorized strptime parses like pandas (numeric fields, no time zones)
+ARROW_DATE_DIRECTIVES = set("YymdHMS%")
+
+def _arrow_parse_dates(column, date_format):
+    """Parse with Arrow's vectorized strptime, or return None if Arrow cannot take the column.
+
+    Arrow rolls impossible dates and times over (Feb 30 becomes Mar 1, second
+    60 the next minute), takes years with too few digits ("24" for %Y, "4" for
+    %y) and skips surrounding spaces, where pandas gives NaT. Values that may
+    have rolled over (parsed day <= 3 or second <= 1), that may have had a
+    short year (year < 1000 for %Y, year % 100 < 10 for %y) or that carry
+    surrounding whitespace are checked by formatting them back; the values
+    that do not match their input are parsed by pandas instead.
+    """
+    directives = set(re.findall(r"%(.)", date_format))
+    if pa is None or not directives <= ARROW_DATE_DIRECTIVES:
+        return None
+    try:
+        values = pa.array(column, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    parsed = pc.strptime(values, format=date_format, unit="s", error_is_null=True)
+
+    suspect = pc.not_equal(pc.utf8_trim_whitespace(values), values)
+    if "d" in directives:
+        suspect = pc.or_(suspect, pc.less_equal(pc.day(parsed), 3))
+    if "S" in directives:
+        suspect = pc.or_(suspect, pc.less_equal(pc.second(parsed), 1))
+    if "Y" in directives:
+        suspect = pc.or_(suspect, pc.less(pc.year(parsed), 1000))
+    if "y" in directives:
+        year = pc.year(parsed)
+        suspect = pc.or_(suspect, pc.less(pc.subtract(year, pc.multiply(pc.divide(year, 100), 100)), 10))
+    suspect = suspect.fill_null(False).to_numpy(zero_copy_only=False)
+    exact = np.ones(len(column), dtype=bool)
+    if suspect.any():
+        positions = np.flatnonzero(suspect)
+        formatted = pc.strftime(parsed.take(positions), format=date_format)
+        exact[positions] = pc.equal(formatted, values.take(positions)).fill_null(False).to_numpy(zero_copy_only=False)
+
+    result = pd.Series(parsed.to_numpy(zero_copy_only=False), index=column.index).astype(PARSED_DATE_DTYPE)
+    redo = ~exact & column.notna().to_numpy()
+    if redo.any():
+        result[redo] = pd.to_datetime(column[redo], format=date_format, errors="coerce")
+    return result
+
+def _parse_date_chunk(column, date_format, errors):
+    if date_format is not None and errors == "coerce":
+        parsed = _arrow_parse_dates(column, date_format)
+        if parsed is not None:
+            return parsed
+    return pd.to_datetime(column, format=date_format, errors=errors)
+
+def parse_dates(column, date_format=None, errors='coerce', workers=1, chunk_rows=DATE_CHUNK_ROWS):
+    """
+    Parses a column of date strings, in chunks on ``workers`` processes when it is large.
+
+    With a ``date_format`` and pyarrow installed, plain day/month/year/time
+    formats are parsed with Arrow's vectorized strptime. Chunks are only parsed
+    in parallel with an explicit ``date_format``, so every chunk is read the
+    same way.
+
+    Args:
+        column (pd.Series): The column to parse.
+        date_format (str, optional): strftime format of the values. Defaults to None (inferred).
+        errors (str, optional): How to handle values that do not parse. Defaults to 'coerce'.
+        workers (int, optional): Processes used for columns longer than ``chunk_rows``. Defaults to 1.
+        chunk_rows (int, optional): Rows per parallel chunk. Defaults to 1,000,000.
+
+    Returns:
+        pd.Series: The parsed datetime column.
+    """
+    parse = partial(_parse_date_chunk, date_format=date_format, errors=errors)
+    if workers <= 1 or date_format is None or len(column) <= chunk_rows:
+        return parse(column)
+    chunks = [column.iloc[start:start + chunk_rows] for start in range(0, len(column), chunk_rows)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return pd.concat(pool.map(parse, chunks))
+
+def preprocess_column(column, dtype, date_format=None, errors='coerce', date_workers=1):
     """
     Preprocesses a single column based on its data type.
 
     Args:
         column (pd.Series): The column to preprocess.
         dtype (str): The desired data type ('date', 'numeric', 'text', 'category').
-        date_format (str, optional): Date format string (e.g., '%Y-%m-%d'). Defaults to None.
+        date_format (str, optional): Date format string (e.g., '%Y-%m-%d'). Defaults to None,
+            in which case it is detected from a sample (see ``detect_date_format``).
         errors (str, optional): How to handle conversion errors ('coerce', 'raise', 'ignore'). Defaults to 'coerce'.
+        date_workers (int, optional): Processes used to parse large date columns. Defaults to 1.
 
     Returns:
         pd.Series: The preprocessed column.
     """
     if dtype == "date":
-        return pd.to_datetime(column, format=date_format, errors=errors)
+        if date_format is None:
+            date_format = detect_date_format(column)
+        return parse_dates(column, date_format, errors, workers=date_workers)
     elif dtype == "numeric":
         return pd.to_numeric(column, errors=errors)
     elif dtype == "text":
@@ -24,29 +176,121 @@ def preprocess_column(column, dtype, date_format=None, errors='coerce'):
     else:
         return column
 
+def optimize_column(column, category_threshold=0.5):
+    """
+    Converts a column to the smallest dtype that holds the same values.
+
+    Integers are downcast to the narrowest (unsigned if non-negative) integer
+    type, floats to float32 only when no value changes, low-cardinality
+    strings to categoricals and other object columns of strings to
+    Arrow-backed strings (when pyarrow is installed). Columns that already
+    have a pandas string dtype (the default ``str`` on pandas 3) and other
+    columns are returned unchanged.
+
+    Args:
+        column (pd.Series): The column to convert.
+        category_threshold (float, optional): Largest share of distinct values
+            for which a string column becomes a categorical. Defaults to 0.5.
+
+    Returns:
+        pd.Series: The converted column.
+    """
+    if pd.api.types.is_bool_dtype(column) or isinstance(column.dtype, pd.CategoricalDtype):
+        return column
+    if pd.api.types.is_integer_dtype(column):
+        non_negative = len(column) > 0 and column.min() >= 0
+        return pd.to_numeric(column, downcast="unsigned" if non_negative else "integer")
+    if pd.api.types.is_float_dtype(column):
+        narrow = column.astype(np.float32)
+        lossless = (narrow.astype(column.dtype) == column) | column.isna()
+        return narrow if lossless.all() else column
+    if pd.api.types.is_string_dtype(column) or column.dtype == object:
+        non_null = column.dropna()
+        if not len(non_null) or not all(isinstance(value, str) for value in non_null.iloc[:1000]):
+            return column
+        if non_null.nunique() <= category_threshold * len(column):
+            return column.astype("category")
+        if STRING_DTYPE is not None and column.dtype == object:
+            return column.astype(STRING_DTYPE)
+    return column
+
 def preprocess_dataset(df, date_columns=None, numeric_columns=None, text_columns=None, 
-                        date_formats=None, categorical_columns=None):
-    
+                        date_formats=None, categorical_columns=None, optimize_memory=False,
+                        category_threshold=0.5, dataset=None, date_workers=1):
+    """
+    Preprocesses the listed columns of a DataFrame and, optionally, shrinks its memory footprint.
+
+    The converted columns are collected first and written back to ``df`` in
+    one batched assignment.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to preprocess; it is updated in place.
+        date_columns, numeric_columns, text_columns, categorical_columns (list, optional):
+            Columns converted with ``preprocess_column`` (in that order).
+        date_formats (dict, optional): Date format string per date column. Formats of
+            other date columns are detected from a sample of their values.
+        optimize_memory (bool, optional): Also pick the smallest lossless dtype for
+            every column (see ``optimize_column``) and store a before/after
+            ``df.attrs["memory_report"]``. Defaults to False.
+        category_threshold (float, optional): With ``optimize_memory``, string columns
+            whose distinct values are at most this share of the rows become
+            categoricals. Defaults to 0.5.
+        dataset (str, optional): Name of the dataset; detected date formats are
+            cached in ``DATE_FORMAT_CACHE`` under ``(dataset, column)`` and reused
+            by later calls with the same name. Defaults to None (no caching).
+        date_workers (int, optional): Processes used to parse large date columns. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: The preprocessed DataFrame.
+    """
     date_columns = date_columns or []
     numeric_columns = numeric_columns or []
     text_columns = text_columns or []
     date_formats = date_formats or {}
     categorical_columns = categorical_columns or []
 
-    for col in date_columns:
+    converted = {}
+    def convert(col, dtype, **options):
         if col in df.columns:
-            df[col] = preprocess_column(df[col], "date", date_format=date_formats.get(col))
+            converted[col] = preprocess_column(converted.get(col, df[col]), dtype, **options)
+
+    for col in date_columns:
+        date_format = date_formats.get(col)
+        if date_format is None and dataset is not None and col in df.columns:
+            key = (dataset, col)
+            if key not in DATE_FORMAT_CACHE:
+                DATE_FORMAT_CACHE[key] = detect_date_format(converted.get(col, df[col]))
+            date_format = DATE_FORMAT_CACHE[key]
+        convert(col, "date", date_format=date_format, date_workers=date_workers)
 
     for col in numeric_columns:
-        if col in df.columns:
-            df[col] = preprocess_column(df[col], "numeric")
+        convert(col, "numeric")
 
     for col in text_columns:
-        if col in df.columns:
-            df[col] = preprocess_column(df[col], "text")
+        convert(col, "text")
 
     for col in categorical_columns:
-        if col in df.columns:
-            df[col] = preprocess_column(df[col], "category")
+        convert(col, "category")
+
+    if optimize_memory:
+        before = df.memory_usage(deep=True, index=False)
+        dtypes_before = df.dtypes.astype(str)
+        for col in df.columns:
+            converted[col] = optimize_column(converted.get(col, df[col]), category_threshold)
+
+    if converted:
+        df[list(converted)] = pd.DataFrame(converted, index=df.index)
+
+    if optimize_memory:
+        after = df.memory_usage(deep=True, index=False)
+        df.attrs["memory_report"] = {
+            "before_bytes": int(before.sum()),
+            "after_bytes": int(after.sum()),
+            "columns": {
+                col: {"dtype_before": dtypes_before[col], "dtype_after": str(df[col].dtype),
+                      "before_bytes": int(before[col]), "after_bytes": int(after[col])}
+                for col in df.columns
+            },
+        }
 
-    return df
\ No newline at end of file
+    return df
@@ -1,44 +1,45 @@
 def generate_quality_summary(df, scores_df):
     try:
-        # Initialize the HTML content with a link to the external CSS
-        html_content = []
-        html_content.append("""
+        return "\n".join(iter_quality_summary(df, scores_df))
+
+    except Exception as e:
+        print(f"Error generating quality summary report: {e}")
+        return ""
+
+def iter_quality_summary(df, scores_df):
+    """Yield the quality summary HTML one metric card at a time."""
+    # Start the HTML content with a link to the external CSS
+    yield """
         <link rel="stylesheet" href="dataquaclms\\Gqcls.css">
 
         <div class="container">
             <h1>Quality Summary Report</h1>
             <div class="metrics-container">
-        """)
+        """
 
-        # Generate HTML content for each metric card
-        for metric in scores_df.columns:
-            columns_passing = scores_df[scores_df[metric] >= 80].index.tolist()
-            passing_percentage = (len(columns_passing) / len(scores_df)) * 100
+    # Generate HTML content for each metric card
+    for metric in scores_df.columns:
+        columns_passing = scores_df[scores_df[metric] >= 80].index.tolist()
+        passing_percentage = (len(columns_passing) / len(scores_df)) * 100
 
-            html_content.append(f"""
+        yield f"""
             <div class="metric-card">
                 <div class="metric-title">{metric}</div>
                 <div class="passing-percentage">{passing_percentage:.2f}% Passing</div>
-            """)
+            """
 
-            if columns_passing:
-                html_content.append("<ul class='columns-list'>")
-                for col in columns_passing:
-                    html_content.append(f"<li>{col}</li>")
-                html_content.append("</ul>")
-            else:
-                html_content.append("<p class='no-columns'>No columns are passing 80% or above</p>")
+        if columns_passing:
+            yield "<ul class='columns-list'>"
+            for col in columns_passing:
+                yield f"<li>{col}</li>"
+            yield "</ul>"
+        else:
+            yield "<p class='no-columns'>No columns are passing 80% or above</p>"
 
-            html_content.append("</div>")  # Closing metric-card
+        yield "</div>"  # Closing metric-card
 
-        # Close containers
-        html_content.append("""
+    # Close containers
+    yield """
             </div> <!-- Closing metrics-container -->
         </div> <!-- Closing container -->
-        """)
-
-        return "\n".join(html_content)
-
-    except Exception as e:
-        print(f"Error generating quality summary report: {e}")
-        return ""
+        """
@@ -0,0 +1,391 @@
+import numpy as np
+import pandas as pd
+
+from dataloD.columnar_io import column_names, columnar_format
+from dataloD.data_loader import load_dataset
+from dataquame.data_quality_metrics import frame_aggregates, scores_from_aggregates, scoring_plan
+from dataquame.validation_rules import compile_rule, describe_rule
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+BACKENDS = ("pandas", "duckdb")
+
+class ScoringBackend:
+    """Computes the per-column aggregates behind every metric (see ``merge_aggregates``).
+
+    A backend receives the dataset and reference (DataFrames or file paths)
+    and a scoring plan, and returns ``{column: aggregates}``; percentages are
+    always derived from those counts by ``scores_from_aggregates``, so
+    backends that count the same rows produce identical scores.
+    """
+
+    name = None
+
+    def aggregates(self, dataset, reference, plan):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class PandasBackend(ScoringBackend):
+    """The in-memory pandas engine of ``calculate_scores``; file paths are read with ``load_dataset``."""
+
+    name = "pandas"
+
+    def __init__(self, block_size=64):
+        self.block_size = block_size
+
+    def aggregates(self, dataset, reference, plan):
+        df = dataset if isinstance(dataset, pd.DataFrame) else load_dataset(dataset)
+        df2 = reference if isinstance(reference, pd.DataFrame) else load_dataset(reference)
+        return frame_aggregates(df, df2, self.block_size, plan)
+
+# Row-position column added to every DuckDB source, so rows are compared by position as in pandas
+ROW = "__dq_row"
+
+INTEGER_TYPES = {"TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT", "UINTEGER",
+                 "UBIGINT", "UHUGEINT"}
+FLOAT_TYPES = {"FLOAT", "DOUBLE"}
+TIMESTAMP_TYPES = {"DATE", "TIMESTAMP", "TIMESTAMP_S", "TIMESTAMP_MS", "TIMESTAMP_NS", "TIMESTAMP WITH TIME ZONE"}
+
+# Types DuckDB's CSV sniffer may pick; dates stay text, as ``load_dataset`` leaves them
+CSV_TYPES = ["BOOLEAN", "BIGINT", "DOUBLE", "VARCHAR"]
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
+
+def _type_class(sql_type):
+    """Group a DuckDB type the way pandas compares it: numeric, float, text, timestamp or other."""
+    sql_type = sql_type.upper()
+    if sql_type in FLOAT_TYPES:
+        return "float"
+    if sql_type in INTEGER_TYPES or sql_type == "BOOLEAN" or sql_type.startswith("DECIMAL"):
+        return "numeric"
+    if sql_type == "VARCHAR" or sql_type.startswith("ENUM"):
+        return "text"
+    if sql_type in TIMESTAMP_TYPES:
+        return "timestamp"
+    return "other"
+
+class _Column:
+    """SQL expressions for one column of a DuckDB source, with pandas' NaN-is-null semantics."""
+
+    def __init__(self, alias, name, sql_type, source=None):
+        self.ref = f"{alias}.{_quote(name)}"
+        self.name = name
+        self.source = source
+        self.sql_type = sql_type.upper()
+        self.kind = _type_class(sql_type)
+        self.tz = self.sql_type == "TIMESTAMP WITH TIME ZONE"
+
+    @property
+    def value(self):
+        # DuckDB treats NaN as a value equal to itself; pandas treats it as missing
+        return f"(CASE WHEN isnan({self.ref}) THEN NULL ELSE {self.ref} END)" if self.kind == "float" else self.ref
+
+    @property
+    def is_null(self):
+        return f"({self.ref} IS NULL OR isnan({self.ref}))" if self.kind == "float" else f"({self.ref} IS NULL)"
+
+    @property
+    def timestamp(self):
+        # Timezone-aware values are compared with the naive threshold in UTC, as ``_timely_mask`` does
+        value = f"timezone('UTC', {self.ref})" if self.tz else self.ref
+        return f"CAST({value} AS TIMESTAMP_NS)"
+
+    @property
+    def text(self):
+        """The column as pandas' ``astype(str)`` renders it for rules on text.
+
+        Missing values stay missing, booleans become "True" or "False", integer
+        columns with missing values, which pandas holds as floats, are rendered
+        as floats, and timestamps that are all at midnight as bare dates.
+        """
+        if self.kind == "text":
+            return f"CAST({self.ref} AS VARCHAR)"
+        if self.sql_type == "BOOLEAN":
+            return f"(CASE WHEN {self.ref} THEN 'True' WHEN NOT {self.ref} THEN 'False' END)"
+        if self.source is None:
+            return f"CAST({self.value} AS VARCHAR)"
+        column = _quote(self.name)
+        if self.kind == "numeric":
+            condition = f"EXISTS (SELECT 1 FROM {self.source} WHERE {column} IS NULL)"
+            whole, other = f"CAST(CAST({self.ref} AS DOUBLE) AS VARCHAR)", f"CAST({self.ref} AS VARCHAR)"
+        elif self.kind == "timestamp" and self.sql_type != "DATE" and not self.tz:
+            condition = f"EXISTS (SELECT 1 FROM {self.source} WHERE {column} <> date_trunc('day', {column}))"
+            whole, other = f"CAST({self.ref} AS VARCHAR)", f"strftime({self.ref}, '%Y-%m-%d')"
+        else:
+            return f"CAST({self.value} AS VARCHAR)"
+        return f"(CASE WHEN {condition} THEN {whole} ELSE {other} END)"
+
+def _equal(left, right):
+    """Equality as ``_values_equal`` computes it: numbers by value, text with text, timestamps with timestamps.
+
+    Both sides numeric: compared directly if the types match, else as DOUBLE
+    (numpy's promotion). Text and timestamps compare with their own kind (text
+    is parsed when compared with a timestamp, as pandas does); any other pair
+    is never equal.
+    """
+    numeric = ("numeric", "float")
+    if left.kind in numeric and right.kind in numeric:
+        if left.sql_type == right.sql_type:
+            expression = f"{left.value} = {right.value}"
+        else:
+            expression = f"CAST({left.value} AS DOUBLE) = CAST({right.value} AS DOUBLE)"
+    elif left.kind == right.kind == "text":
+        expression = f"CAST({left.ref} AS VARCHAR) = CAST({right.ref} AS VARCHAR)"
+    elif left.kind == right.kind == "timestamp":
+        if left.tz != right.tz:
+            # pandas never finds a timezone-aware value equal to a naive one
+            return "FALSE"
+        expression = f"{left.ref} = {right.ref}"
+    elif {left.kind, right.kind} == {"text", "timestamp"}:
+        text, stamp = (left, right) if left.kind == "text" else (right, left)
+        expression = f"TRY_CAST({text.ref} AS {stamp.sql_type}) = {stamp.ref}"
+    else:
+        return "FALSE"
+    return f"COALESCE({expression}, FALSE)"
+
+def _rule_condition(column, rule):
+    """Translate a compiled validation rule into a SQL condition on ``column``.
+
+    Regex, length and date rules see the column as text, as ``ColumnViews.text``
+    does, so they also run on numeric columns (e.g. an all-missing text column
+    that the CSV sniffer typed as DOUBLE).
+    """
+    rule_type, options = describe_rule(rule)
+
+    if rule_type == "regex":
+        pattern = options["pattern"]
+        flags = "(?i)" if pattern.flags & 2 else ""  # re.IGNORECASE
+        # re.match anchors at the start of the value only
+        return f"COALESCE(regexp_matches({column.text}, {_literal(flags + '^(?:' + pattern.pattern + ')')}), FALSE)"
+    if rule_type in ("range", "length"):
+        if rule_type == "range":
+            value = column.value if column.kind in ("numeric", "float") else f"TRY_CAST({column.ref} AS DOUBLE)"
+        else:
+            value = f"length({column.text})"
+        bounds = [f"{value} IS NOT NULL"]
+        if options["minimum"] is not None:
+            bounds.append(f"{value} >= {_literal(options['minimum'])}")
+        if options["maximum"] is not None:
+            bounds.append(f"{value} <= {_literal(options['maximum'])}")
+        return "COALESCE(" + " AND ".join(bounds) + ", FALSE)"
+    if rule_type == "allowed":
+        values = options["values"]
+        if column.kind == "text":
+            listed = [value for value in values if isinstance(value, str)]
+        elif column.kind in ("numeric", "float"):
+            listed = [value for value in values if isinstance(value, (int, float)) and not pd.isna(value)]
+        else:
+            raise ValueError(f"The duckdb backend does not run allowed-value rules on {column.sql_type} columns.")
+        conditions = [f"{column.value} IN ({', '.join(_literal(value) for value in listed)})"] if listed else []
+        if any(value is None or (isinstance(value, float) and np.isnan(value)) for value in values):
+            conditions.append(column.is_null)
+        return "COALESCE(" + (" OR ".join(conditions) or "FALSE") + ", FALSE)"
+    if rule_type == "date":
+        return f"(try_strptime({column.text}, {_literal(options['date_format'])}) IS NOT NULL)"
+    if rule_type == "not_null":
+        return f"(NOT {column.is_null})"
+    raise ValueError(f"Validation rule {rule!r} cannot be translated to SQL; use the pandas backend.")
+
+class DuckDBBackend(ScoringBackend):
+    """Scores with an embedded DuckDB database, in one multi-threaded aggregate query.
+
+    Sources may be DataFrames, Parquet files (read by DuckDB itself, so they
+    need not fit in memory), Arrow IPC files (memory-mapped) or CSV files
+    (typed by DuckDB's CSV sniffer, which may differ from ``load_dataset``).
+    ``memory_limit`` and ``temp_directory`` let DuckDB spill joins and
+    distinct counts to disk.
+
+    Counts match the pandas backend exactly for typed columns. Regex, length
+    and date rules on non-text columns see pandas' text rendering of the
+    values, which agrees for numbers and booleans but not for every timestamp;
+    custom callable rules or approximate uniqueness are not supported.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, threads=None, memory_limit=None, temp_directory=None, database=":memory:"):
+        if duckdb is None:
+            raise ImportError("The duckdb backend requires duckdb. Install it with 'pip install duckdb'.")
+        config = {key: value for key, value in
+                  {"threads": threads, "memory_limit": memory_limit, "temp_directory": temp_directory}.items()
+                  if value is not None}
+        self.connection = duckdb.connect(database, config=config)
+        self._sources = 0
+
+    @staticmethod
+    def _frame_table(frame):
+        # DuckDB scans object columns value by value through Python; converting them to
+        # Arrow once is several times faster. Columns Arrow cannot type (mixed objects)
+        # leave the frame to DuckDB's own conversion.
+        positions = np.arange(len(frame))
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                # Object columns of dates are plain values to pandas (no timeliness), so keep them as text
+                for i, field in enumerate(table.schema):
+                    if pa.types.is_date(field.type):
+                        table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+                return table.append_column(ROW, pa.array(positions))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+        return frame.assign(**{ROW: positions})
+
+    def _register(self, source):
+        """Expose ``source`` as a view with a ``ROW`` position column and return the view name."""
+        self._sources += 1
+        name = f"dq_source_{self._sources}"
+        if isinstance(source, pd.DataFrame):
+            frame = source.set_axis([str(col) for col in source.columns], axis=1)
+            self.connection.register(f"{name}_frame", self._frame_table(frame))
+            self.connection.execute(f"CREATE OR REPLACE TEMP VIEW {name} AS SELECT * FROM {name}_frame")
+            return name
+
+        path = str(source)
+        file_format = columnar_format(path)
+        if file_format == "parquet":
+            self.connection.execute(f"CREATE OR REPLACE TEMP VIEW {name} AS SELECT * EXCLUDE (file_row_number), "
+                                    f"file_row_number AS {ROW} FROM read_parquet({_literal(path)}, file_row_number = true)")
+        elif file_format == "ipc":
+            if pa is None:
+                raise ImportError(f"pyarrow is required to read '{path}'.")
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+            self.connection.register(f"{name}_frame", table.append_column(ROW, pa.array(np.arange(table.num_rows))))
+            self.connection.execute(f"CREATE OR REPLACE TEMP VIEW {name} AS SELECT * FROM {name}_frame")
+        else:
+            # A table keeps the file's row order in its rowid
+            types = ", ".join(_literal(sql_type) for sql_type in CSV_TYPES)
+            self.connection.execute(f"CREATE OR REPLACE TEMP TABLE {name}_table AS SELECT * FROM "
+                                    f"read_csv({_literal(path)}, auto_type_candidates = [{types}])")
+            self.connection.execute(f"CREATE OR REPLACE TEMP VIEW {name} AS SELECT *, rowid AS {ROW} FROM {name}_table")
+        return name
+
+    def _columns(self, view):
+        rows = self.connection.execute(f"DESCRIBE SELECT * FROM {view}").fetchall()
+        return {row[0]: row[1] for row in rows if row[0] != ROW}
+
+    def aggregates(self, dataset, reference, plan):
+        if plan["sketches"]:
+            raise ValueError("The duckdb backend only computes exact uniqueness.")
+        dataset_view, reference_view = self._register(dataset), self._register(reference)
+        dataset_types, reference_types = self._columns(dataset_view), self._columns(reference_view)
+        missing = [col for col in dataset_types if col not in reference_types]
+        if missing:
+            raise ValueError(f"Columns {missing} are not found in both DataFrames.")
+
+        threshold = pd.to_datetime(plan["threshold_date"]).tz_localize(None).as_unit("ns").isoformat(sep=" ")
+        rules = {str(col): column_rules for col, column_rules in plan["rules"].items()}
+        selects = ["COUNT(*)"]
+        layout = []
+        for col, sql_type in dataset_types.items():
+            left, right = _Column("d", col, sql_type, dataset_view), _Column("r", col, reference_types[col])
+            equal = _equal(left, right)
+            both_null = f"({left.is_null} AND r.{ROW} IS NOT NULL AND {right.is_null})"
+            fields = {
+                "nulls": f"COUNT(*) FILTER (WHERE {left.is_null})",
+                "distinct": f"COUNT(DISTINCT {left.value})",
+                "accurate": f"COUNT(*) FILTER (WHERE {equal})",
+                "consistent": f"COUNT(*) FILTER (WHERE {equal} OR {both_null})",
+            }
+            if col in rules:
+                conditions = [_rule_condition(left, compile_rule(rule)) for rule in rules[col]]
+                fields["valid"] = f"COUNT(*) FILTER (WHERE {' AND '.join(conditions) or 'TRUE'})"
+            if left.kind == "timestamp":
+                fields["timely"] = f"COUNT(*) FILTER (WHERE {left.timestamp} >= TIMESTAMP_NS {_literal(threshold)})"
+            layout.append((col, list(fields)))
+            selects.extend(fields.values())
+
+        query = (f"SELECT {', '.join(selects)} FROM {dataset_view} AS d "
+                 f"LEFT JOIN {reference_view} AS r ON d.{ROW} = r.{ROW}")
+        values = iter(self.connection.execute(query).fetchone())
+        rows = int(next(values))
+        aggregates = {}
+        for col, fields in layout:
+            counts = {field: int(next(values)) for field in fields}
+            aggregates[col] = {
+                "rows": rows,
+                "nulls": counts["nulls"],
+                "distinct": counts["distinct"],
+                "valid": counts.get("valid"),
+                "timely": counts.get("timely"),
+                "accurate": counts["accurate"],
+                "consistent": counts["consistent"],
+            }
+        return aggregates
+
+    def close(self):
+        self.connection.close()
+
+def get_backend(name, **options):
+    """Create the backend called ``name`` (one of ``BACKENDS``) with its options."""
+    backends = {"pandas": PandasBackend, "duckdb": DuckDBBackend}
+    if name not in backends:
+        raise ValueError(f"Unknown backend '{name}'. Expected one of {BACKENDS}.")
+    return backends[name](**options)
+
+def _column_names(source):
+    """Column names of a DataFrame or file, read from the header or schema only."""
+    if isinstance(source, pd.DataFrame):
+        return list(source.columns)
+    if columnar_format(source) is not None:
+        return column_names(source)
+    return list(pd.read_csv(source, nrows=0, encoding="utf-8").columns.str.strip())
+
+def calculate_scores_backend(dataset, reference, backend="pandas", threshold_date=None, rules=None, **backend_options):
+    """Calculates ``calculate_scores`` on a pluggable compute backend.
+
+    ``dataset`` and ``reference`` may be DataFrames or file paths; rows are
+    compared by position. ``backend`` is a name from ``BACKENDS`` (created with
+    ``backend_options``) or a ``ScoringBackend`` instance.
+    """
+    if threshold_date is None:
+        threshold_date = pd.to_datetime("today")
+    owned = isinstance(backend, str)
+    engine = get_backend(backend, **backend_options) if owned else backend
+    try:
+        plan = scoring_plan(_column_names(dataset), threshold_date, rules)
+        return scores_from_aggregates(engine.aggregates(dataset, reference, plan))
+    finally:
+        if owned:
+            engine.close()
+
+def compare_backends(dataset, reference, backends=BACKENDS, threshold_date=None, rules=None):
+    """Score the same inputs on several backends and report any differences.
+
+    Returns:
+        tuple: ``{backend: scores_df}`` and a list of ``(backend, column, metric,
+        expected, actual)`` mismatches against the first backend (empty when all agree).
+    """
+    if threshold_date is None:
+        threshold_date = pd.to_datetime("today")
+    results = {name: calculate_scores_backend(dataset, reference, name, threshold_date, rules) for name in backends}
+    expected = results[backends[0]]
+    mismatches = []
+    for name in backends[1:]:
+        actual = results[name].reindex(index=expected.index, columns=expected.columns)
+        for col in expected.index:
+            for metric in expected.columns:
+                if not expected.at[col, metric] == actual.at[col, metric]:
+                    mismatches.append((name, col, metric, expected.at[col, metric], actual.at[col, metric]))
+    return results, mismatches
@@ -1,5 +1,16 @@
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
-import re
+
+from datainstr.instrumentation import add_metric_time, merge_metric_timings
+from dataquame.failure_bitmaps import FailureBitmaps
+from dataquame.sketches import HyperLogLog
+from dataquame.validation_rules import compile_rules, default_rules, validity_mask
 
 def completeness_score(column):
     """Calculate the completeness score of a column."""
@@ -13,11 +24,18 @@ def uniqueness_score(column):
         return 0.0  # Return 0% if the column is empty
     return column.nunique() / len(column) * 100
 
-def validity_score(column, validation_function=None):
-    """Calculate the validity score of a column based on a validation function."""
+def validity_score(column, validation_function=None, rules=None):
+    """Calculate the validity score of a column based on a validation function.
+
+    ``rules`` (see ``dataquame.validation_rules``) are evaluated with vectorized
+    column operations and take precedence over ``validation_function``.
+    """
     if len(column) == 0:
         return 0.0  # Return 0% if the column is empty
 
+    if rules is not None:
+        return validity_mask(column, rules).sum() / len(column) * 100
+
     if validation_function is None:
         if pd.api.types.is_numeric_dtype(column):
             validation_function = lambda x: not pd.isna(x)
@@ -35,9 +53,7 @@ def timeliness_score(column, threshold_date):
         if threshold_date is None:
             raise ValueError("Threshold date must be provided and cannot be None.")
         
-        threshold_date = pd.to_datetime(threshold_date).tz_localize(None)
-        timely_entries = (column >= threshold_date).sum()
-        return timely_entries / len(column) * 100
+        return _timely_count(column, threshold_date) / len(column) * 100
 
     return 100.0  # If not a datetime column, assume 100% timeliness
 
@@ -63,6 +79,41 @@ def accuracy_score(df, df2, column_name, threshold=None):
     accuracy_percentage = (correct_entries / total_valid_entries) * 100 if total_valid_entries > 0 else 100
     return accuracy_percentage
 
+def _comparable(column):
+    """Return the column with a plain (non-categorical) dtype and a positional index."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return pd.Series(np.asarray(column), name=column.name)
+    return column.reset_index(drop=True)
+
+def _values_equal(column1, column2):
+    """Element-wise equality of two equally long columns, compared by position.
+
+    NaN never equals NaN here, matching ``val1 == val2`` on scalars.
+    """
+    column1 = _comparable(column1)
+    column2 = _comparable(column2)
+    try:
+        equal = column1 == column2
+    except TypeError:
+        # Incomparable dtypes (e.g. mixed extension types): fall back to object comparison
+        equal = pd.Series(column1.to_numpy(dtype=object) == column2.to_numpy(dtype=object))
+    return equal.to_numpy(dtype=bool, na_value=False)
+
+def _consistent_mask(column1, column2):
+    """Positional mask of rows where both values are equal or both are NaN.
+
+    Rows of ``column1`` beyond the length of ``column2`` are inconsistent.
+    """
+    total = len(column1)
+    overlap = min(total, len(column2))
+    mask = np.zeros(total, dtype=bool)
+    if overlap:
+        head1 = column1.iloc[:overlap]
+        head2 = column2.iloc[:overlap]
+        both_nan = head1.isna().to_numpy() & head2.isna().to_numpy()
+        mask[:overlap] = both_nan | _values_equal(head1, head2)
+    return mask
+
 def consistency_score(df, df2, column1, column2=None):
     """Calculates the consistency score by comparing two columns."""
     
@@ -73,61 +124,501 @@ def consistency_score(df, df2, column1, column2=None):
     if column1 not in df.columns or column2 not in df2.columns:
         raise ValueError(f"Columns '{column1}' or '{column2}' are not found in their respective DataFrames.")
 
-    # Compare the two columns row by row
-    consistency = 0
+    # Compare the two columns position by position: equal values and NaN/NaN pairs are consistent
     total = len(df)
-
-    for i in range(total):
-        val1 = df.iloc[i][column1]
-        val2 = df2.iloc[i][column2]
-
-        # If both values are NaN, consider them consistent
-        if pd.isna(val1) and pd.isna(val2):
-            consistency += 1
-        # If both values are the same (non-NaN), consider them consistent
-        elif val1 == val2:
-            consistency += 1
-        # If one value is NaN and the other is not, consider it inconsistent
-        elif pd.isna(val1) or pd.isna(val2):
-            consistency += 0
-        # If values are different (and neither are NaN), consider it inconsistent
-        else:
-            consistency += 0
+    consistency = _consistent_mask(df[column1], df2[column2]).sum()
 
     # Calculate consistency percentage
     consistency_percentage = (consistency / total) * 100 if total > 0 else 100
     return consistency_percentage
 
-def calculate_scores(df,df2, threshold_date=None, reference_columns=None):
-    """Calculates data quality scores for each column in a DataFrame."""
+def consistency_scores(df, df2, columns=None):
+    """Calculates the consistency score of every column in a single columnar pass."""
+    columns = list(df.columns) if columns is None else list(columns)
+
+    missing = [col for col in columns if col not in df.columns or col not in df2.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} are not found in both DataFrames.")
+
+    total = len(df)
+    overlap = min(total, len(df2))
+    if total == 0:
+        return {col: 100 for col in columns}
+
+    # Null masks for all columns are computed once, up front
+    head = df[columns].iloc[:overlap]
+    ref_head = df2[columns].iloc[:overlap]
+    both_nan = head.isna().to_numpy() & ref_head.isna().to_numpy()
+
+    scores = {}
+    for i, col in enumerate(columns):
+        consistency = (both_nan[:, i] | _values_equal(head[col], ref_head[col])).sum()
+        scores[col] = consistency / total * 100
+    return scores
+
+METRICS = ["Completeness", "Timeliness", "Validity", "Accuracy", "Uniqueness", "Consistency"]
+
+def _timely_mask(column, threshold_date):
+    """Row mask of the entries of a datetime column on or after the threshold date.
+
+    Timezone-naive columns are compared as their int64 epoch values, without
+    building a boolean Series; NaT is the smallest int64 and never counts.
+    Timezone-aware columns are compared in UTC.
+    """
+    threshold_date = pd.to_datetime(threshold_date).tz_localize(None)
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        column = column.dt.tz_convert(None)
+    if not isinstance(column.dtype, np.dtype):
+        return (column >= threshold_date).to_numpy(dtype=bool)
+    values = column.to_numpy()
+    unit, count = np.datetime_data(values.dtype)
+    ticks_per_unit = np.timedelta64(count, unit) // np.timedelta64(1, "ns")
+    # Round the threshold up to the column's unit, so truncation never lets earlier values through
+    threshold = -(-threshold_date.as_unit("ns").value // ticks_per_unit)
+    return values.view("i8") >= threshold
+
+def _timely_count(column, threshold_date):
+    """Number of entries of a datetime column on or after the threshold date."""
+    return int(np.count_nonzero(_timely_mask(column, threshold_date)))
+
+def _percentage(count, total, empty=0.0):
+    return count / total * 100 if total > 0 else empty
+
+UNIQUENESS_MODES = ("exact", "approx")
+
+def _distinct_state(column, col, plan):
+    """Distinct-count state of a column: a sketch, an exact set of values, or an exact count."""
+    if col in plan["sketches"]:
+        return HyperLogLog.from_values(column, plan["sketches"][col])
+    if plan["distinct_values"]:
+        return set(column.dropna().unique().tolist())
+    return int(column.nunique())
+
+def _measure(timings, col, metric, func):
+    """Call ``func``, adding its wall time to ``timings[col][metric]`` when timings are collected."""
+    if timings is None:
+        return func()
+    start = time.perf_counter()
+    result = func()
+    add_metric_time(timings, col, metric, time.perf_counter() - start)
+    return result
+
+def _spread_time(timings, columns, metric, seconds):
+    """Share the time of a whole-block step evenly among the block's columns."""
+    if timings is not None and len(columns):
+        for col in columns:
+            add_metric_time(timings, col, metric, seconds / len(columns))
+
+def _padded(mask, rows):
+    """Extend a mask over the overlap with the reference to all ``rows``, as False."""
+    return mask if len(mask) == rows else np.concatenate([mask, np.zeros(rows - len(mask), dtype=bool)])
+
+def _record_failures(failures, col, column, null_mask, equal, consistent, valid, timely):
+    """Add the failing rows of every metric of a column to a ``FailureBitmaps``.
+
+    Each mask marks the rows the score counts against: missing values, values
+    that differ from the reference (accuracy is scored over the non-missing
+    rows, so missing ones are marked too but only count through completeness),
+    rows that are neither equal to nor missing alongside the reference, failed
+    rules, entries before the threshold date, and missing values and repeats
+    of earlier values.
+    """
+    rows = len(column)
+    failures.add(col, "Completeness", null_mask)
+    failures.add(col, "Accuracy", ~_padded(equal, rows))
+    failures.add(col, "Consistency", ~_padded(consistent, rows))
+    failures.add(col, "Uniqueness", column.duplicated().to_numpy() | null_mask)
+    if valid is not None:
+        failures.add(col, "Validity", ~valid)
+    if timely is not None:
+        failures.add(col, "Timeliness", ~timely)
+
+def _block_aggregates(block, ref_block, null_mask, plan, timings=None, failures=None):
+    """Collect the raw counts behind every metric for one block of columns.
+
+    ``null_mask`` is the block's ``isna()`` array; it is shared by completeness,
+    accuracy and consistency so each column is only null-scanned once. Columns
+    without validation rules in the ``plan`` score 100% validity.
+
+    If ``timings`` is a dict, the time spent on each metric of each column is
+    added to it as ``{column: {metric: seconds}}``. If ``failures`` is a
+    ``FailureBitmaps``, the rows failing each metric are added to it.
+    """
+    rows = len(block)
+    overlap = min(rows, len(ref_block))
+    null_counts = null_mask.sum(axis=0)
+    rules = plan["rules"]
+    start = time.perf_counter()
+    ref_null_mask = ref_block.iloc[:overlap].isna().to_numpy()
+    _spread_time(timings, block.columns, "Consistency", time.perf_counter() - start)
+
+    aggregates = {}
+    for i, col in enumerate(block.columns):
+        column = block.iloc[:, i]
+        equal = _measure(timings, col, "Accuracy", lambda: _values_equal(column.iloc[:overlap], ref_block.iloc[:overlap, i]))
+        valid = _measure(timings, col, "Validity", lambda: validity_mask(column, rules[col])) if col in rules else None
+        timely = (_measure(timings, col, "Timeliness", lambda: _timely_mask(column, plan["threshold_date"]))
+                  if pd.api.types.is_datetime64_any_dtype(column) else None)
+        consistent = _measure(timings, col, "Consistency", lambda: equal | (null_mask[:overlap, i] & ref_null_mask[:, i]))
+        aggregates[col] = {
+            "rows": rows,
+            "nulls": int(null_counts[i]),
+            "distinct": _measure(timings, col, "Uniqueness", lambda: _distinct_state(column, col, plan)),
+            "valid": None if valid is None else int(np.count_nonzero(valid)),
+            "timely": None if timely is None else int(np.count_nonzero(timely)),
+            "accurate": int(equal.sum()),
+            "consistent": int(np.count_nonzero(consistent)),
+        }
+        if failures is not None:
+            _record_failures(failures, col, column, null_mask[:, i], equal, consistent, valid, timely)
+    return aggregates
+
+def scoring_plan(columns, threshold_date, rules, uniqueness="exact", precision=14, distinct_values=False):
+    """Resolve the per-call scoring options once, before any column is scanned.
+
+    The plan holds the threshold date, the compiled validation rules, the
+    HyperLogLog precision of every column scored in approximate uniqueness
+    mode, and whether exact distinct values are kept (as sets) for merging.
+    With ``frame_aggregates``, ``merge_aggregates`` and ``scores_from_aggregates``
+    it is what other scoring engines (``dataquame.backends``,
+    ``dataquame.stats_store``) build on.
+    """
     if threshold_date is None:
         threshold_date = pd.to_datetime("today")
 
-    detailed_scores = {}
-
-    for col in df.columns:
-        column_data = df[col]
-
-        # Calculate scores for each column
-        column_scores = {
-            "Completeness": completeness_score(column_data),
-            "Timeliness": timeliness_score(column_data, threshold_date) if pd.api.types.is_datetime64_any_dtype(column_data) else 100,
-            "Validity": validity_score(
-                column_data,
-                lambda x: bool(
-                    re.match(
-                        r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$", str(x)
-                    )
-                ),
-            ) if "email" in col.lower() else 100,
-            "Accuracy": accuracy_score(df, df2, col,threshold=None),
-            "Uniqueness": uniqueness_score(column_data),
-            "Consistency": consistency_score(df,df2, col)
+    if isinstance(uniqueness, str):
+        uniqueness = {col: uniqueness for col in columns}
+    unknown = set(uniqueness.values()) - set(UNIQUENESS_MODES)
+    if unknown:
+        raise ValueError(f"Unknown uniqueness modes {sorted(unknown)}. Expected one of {UNIQUENESS_MODES}.")
+
+    return {
+        "threshold_date": threshold_date,
+        "rules": compile_rules(default_rules(columns) if rules is None else rules),
+        "sketches": {col: precision for col, mode in uniqueness.items() if mode == "approx"},
+        "distinct_values": distinct_values,
+    }
+
+def frame_aggregates(df, df2, block_size, plan, timings=None, failures=None):
+    """Aggregate every column of ``df`` against ``df2``, one block of columns at a time."""
+    missing = [col for col in df.columns if col not in df2.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} are not found in both DataFrames.")
+
+    aggregates = {}
+    for start in range(0, len(df.columns), block_size):
+        columns = df.columns[start:start + block_size]
+        block = df.iloc[:, start:start + block_size]
+        null_started = time.perf_counter()
+        null_mask = block.isna().to_numpy()
+        _spread_time(timings, columns, "Completeness", time.perf_counter() - null_started)
+        aggregates.update(_block_aggregates(block, df2[columns], null_mask, plan, timings, failures))
+    return aggregates
+
+def _merge_optional_count(count, other, rows, other_rows):
+    """Merge counts of metrics that may not apply (``None`` scores 100%, i.e. all rows)."""
+    if count is None and other is None:
+        return None
+    return (rows if count is None else count) + (other_rows if other is None else other)
+
+def merge_aggregates(aggregates, other):
+    """Merge the per-column partial aggregates of two row ranges of the same dataset."""
+    merged = dict(aggregates)
+    for col, theirs in other.items():
+        ours = merged.get(col)
+        if ours is None:
+            merged[col] = theirs
+            continue
+        distinct = ours["distinct"]
+        if isinstance(distinct, set):
+            distinct |= theirs["distinct"]
+        elif isinstance(distinct, HyperLogLog):
+            distinct.merge(theirs["distinct"])
+        else:
+            raise ValueError(f"Exact distinct counts of column '{col}' cannot be merged; keep distinct values or sketches.")
+        merged[col] = {
+            "rows": ours["rows"] + theirs["rows"],
+            "nulls": ours["nulls"] + theirs["nulls"],
+            "distinct": distinct,
+            "valid": _merge_optional_count(ours["valid"], theirs["valid"], ours["rows"], theirs["rows"]),
+            "timely": _merge_optional_count(ours["timely"], theirs["timely"], ours["rows"], theirs["rows"]),
+            "accurate": ours["accurate"] + theirs["accurate"],
+            "consistent": ours["consistent"] + theirs["consistent"],
         }
+    return merged
+
+def _distinct_count(distinct):
+    return len(distinct) if isinstance(distinct, (set, HyperLogLog)) else distinct
+
+def _scores_from_aggregates(aggregates):
+    """Turn the per-column counts into the percentage layout of ``scores_df``."""
+    rows = aggregates["rows"]
+    non_null = rows - aggregates["nulls"]
+    return {
+        "Completeness": _percentage(non_null, rows),
+        "Timeliness": 100 if aggregates["timely"] is None else _percentage(aggregates["timely"], rows),
+        "Validity": 100 if aggregates["valid"] is None else _percentage(aggregates["valid"], rows),
+        "Accuracy": _percentage(aggregates["accurate"], non_null, empty=100),
+        "Uniqueness": _percentage(_distinct_count(aggregates["distinct"]), rows),
+        "Consistency": _percentage(aggregates["consistent"], rows, empty=100),
+    }
+
+def _key_index(df, key_columns):
+    if len(key_columns) == 1:
+        return pd.Index(df[key_columns[0]])
+    return pd.MultiIndex.from_frame(df[key_columns])
+
+def align_reference(df, df2, key_columns):
+    """Reorder the rows of ``df2`` to line up with ``df`` by key instead of by position.
+
+    A hash index is built once over the key columns of ``df2``; every row of
+    ``df`` is looked up in it, without sorting either frame. Rows of ``df``
+    without a reference row get an all-NaN row, and only the first reference
+    row of a duplicated key is used.
+
+    Returns:
+        tuple: The aligned reference frame (same length and index as ``df``) and
+        a report dict with the unmatched and duplicate key counts.
+    """
+    key_columns = [key_columns] if isinstance(key_columns, str) else list(key_columns)
+    missing = [col for col in key_columns if col not in df.columns or col not in df2.columns]
+    if missing:
+        raise ValueError(f"Key columns {missing} are not found in both DataFrames.")
+
+    ref_keys = _key_index(df2, key_columns)
+    duplicated = ref_keys.duplicated()
+    unique_ref = df2[~duplicated].reset_index(drop=True)
+    positions = ref_keys[~duplicated].get_indexer(_key_index(df, key_columns))
+
+    # -1 (no match) is not a label of the RangeIndex, so those rows come back as NaN
+    aligned = unique_ref.reindex(positions).set_axis(df.index)
+    matched = positions >= 0
+    report = {
+        "key_columns": key_columns,
+        "matched_rows": int(matched.sum()),
+        "unmatched_rows": int((~matched).sum()),
+        "unmatched_reference_rows": int(len(unique_ref) - len(np.unique(positions[matched]))),
+        "duplicate_keys": int(_key_index(df, key_columns).duplicated().sum()),
+        "duplicate_reference_keys": int(duplicated.sum()),
+    }
+    return aligned, report
+
+EXECUTORS = ("serial", "thread", "process")
+
+# Frames shared with process-pool workers, set once per worker by _init_worker
+_worker_frames = {}
+
+def _init_worker(df, df2, plan):
+    _worker_frames.update(df=df, df2=df2, plan=plan)
+
+def _worker_aggregates(start, stop, timed=False, failing=False):
+    df = _worker_frames["df"]
+    timings = {} if timed else None
+    failures = FailureBitmaps(len(df)) if failing else None
+    aggregates = frame_aggregates(df.iloc[:, start:stop], _worker_frames["df2"], stop - start, _worker_frames["plan"],
+                                   timings, failures)
+    return aggregates, timings, failures
+
+def _process_pool(df, df2, plan, max_workers):
+    """A process pool whose workers receive both frames once, at start-up.
+
+    Where ``fork`` is available the workers inherit the frames from the parent
+    without any pickling; elsewhere they are pickled once per worker, never per task.
+    """
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                               initializer=_init_worker, initargs=(df, df2, plan))
+
+def _parallel_aggregates(df, df2, block_size, plan, executor, max_workers, timings=None, failures=None):
+    """Spread column groups over a thread or process pool and merge the aggregates in column order."""
+    missing = [col for col in df.columns if col not in df2.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} are not found in both DataFrames.")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    n_columns = len(df.columns)
+    # A couple of groups per worker keeps the pool busy when column costs differ
+    group_size = max(1, min(block_size, -(-n_columns // (max_workers * 2))))
+    groups = [(start, min(start + group_size, n_columns)) for start in range(0, n_columns, group_size)]
+
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        def task(start, stop, timed, failing):
+            group_timings = {} if timed else None
+            group_failures = FailureBitmaps(len(df)) if failing else None
+            group_aggregates = frame_aggregates(df.iloc[:, start:stop], df2, stop - start, plan, group_timings, group_failures)
+            return group_aggregates, group_timings, group_failures
+    else:
+        pool = _process_pool(df, df2, plan, max_workers)
+        task = _worker_aggregates
+
+    aggregates = {}
+    with pool:
+        futures = [pool.submit(task, start, stop, timings is not None, failures is not None) for start, stop in groups]
+        for future in futures:
+            group_aggregates, group_timings, group_failures = future.result()
+            aggregates.update(group_aggregates)
+            if timings is not None:
+                merge_metric_timings(timings, group_timings)
+            if failures is not None:
+                failures.update(group_failures)
+    return aggregates
+
+def calculate_scores(df,df2, threshold_date=None, reference_columns=None, block_size=64,
+                     executor="serial", max_workers=None, key_columns=None, rules=None,
+                     uniqueness="exact", hll_precision=14, recorder=None, near_duplicates=None, drift=None,
+                     failures=None):
+    """Calculates data quality scores for each column in a DataFrame.
+
+    All metrics are computed together, one block of ``block_size`` columns at a
+    time, so each column is scanned once and shared intermediates (null masks,
+    equality against ``df2``) are reused across metrics. With ``executor`` set
+    to ``"thread"`` or ``"process"``, column groups are scored concurrently on
+    ``max_workers`` workers (default: one per CPU).
+
+    By default ``df2`` is compared with ``df`` by row position. Pass
+    ``key_columns`` to match rows by key instead (see ``align_reference``); the
+    alignment report is stored in ``scores_df.attrs["alignment"]``.
+
+    ``rules`` maps column names to validation rules (specs or compiled, see
+    ``dataquame.validation_rules``); by default columns whose name mentions
+    "email" must hold an email address. Rules are compiled once per call.
+
+    ``uniqueness`` is ``"exact"`` (``nunique``), ``"approx"`` (a HyperLogLog
+    sketch with ``2 ** hll_precision`` registers) or a ``{column: mode}``
+    mapping; columns missing from the mapping are counted exactly.
+
+    With a ``recorder`` (see ``datainstr.instrumentation.RunRecorder``), the
+    time spent on each metric of each column is added to its metric timings.
+
+    ``near_duplicates`` adds the row-level uniqueness of ``df``: ``True`` or a
+    dict of ``dataquame.near_duplicates.duplicate_clusters`` options (text and
+    key columns, threshold, ...). The summary of ``near_duplicate_report``,
+    without the cluster table, is stored in ``scores_df.attrs["near_duplicates"]``.
+
+    ``drift`` adds distribution drift scores (see ``dataquame.drift.drift_scores``)
+    as ``scores_df.attrs["drift"]``, ``{column: {...}}`` with missing scores as
+    ``None``: ``True`` compares ``df`` with ``df2`` as a whole (before any key
+    alignment), while a saved ``DatasetProfile`` (or its path) compares ``df``
+    with that profile instead.
+
+    ``failures`` is an optional ``dataquame.failure_bitmaps.FailureBitmaps``
+    that receives the rows of ``df`` failing each metric of each column, one
+    bit per row, so failing rows can be looked up later without rescanning.
+    Uniqueness failures are the missing values and repeats of an earlier
+    value, counted exactly even when ``uniqueness`` is approximate.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}'. Expected one of {EXECUTORS}.")
+
+    plan = scoring_plan(df.columns, threshold_date, rules, uniqueness, hll_precision)
+
+    reference = df2
+    alignment = None
+    if key_columns is not None:
+        df2, alignment = align_reference(df, df2, key_columns)
+
+    timings = {} if recorder is not None else None
+    if executor == "serial" or len(df.columns) <= 1:
+        aggregates = frame_aggregates(df, df2, block_size, plan, timings, failures)
+    else:
+        aggregates = _parallel_aggregates(df, df2, block_size, plan, executor, max_workers, timings, failures)
+    if recorder is not None:
+        recorder.add_metric_timings(timings)
+
+    scores_df = scores_from_aggregates(aggregates)
+    if alignment is not None:
+        scores_df.attrs["alignment"] = alignment
+    if near_duplicates:
+        from dataquame.near_duplicates import near_duplicate_report
+
+        options = near_duplicates if isinstance(near_duplicates, dict) else {}
+        report = near_duplicate_report(df, **options)
+        report.pop("duplicate_clusters")
+        scores_df.attrs["near_duplicates"] = report
+    if drift is not None and drift is not False:
+        from dataquame.drift import drift_records, drift_scores
+
+        scores_df.attrs["drift"] = drift_records(drift_scores(df, reference if drift is True else drift))
+    return scores_df
+
+def scores_from_aggregates(aggregates):
+    """Build ``scores_df`` from per-column aggregates (see ``merge_aggregates``)."""
+    detailed_scores = {col: _scores_from_aggregates(column_aggregates) for col, column_aggregates in aggregates.items()}
+    scores_df = pd.DataFrame(detailed_scores, index=METRICS).T
+    return scores_df
+
+def _take_rows(chunks, pending, rows):
+    """Pop exactly ``rows`` rows from a chunk iterator, buffering any remainder in ``pending``."""
+    parts = []
+    while rows > 0:
+        if not pending:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            pending.append(chunk)
+        head = pending.pop(0)
+        parts.append(head.iloc[:rows])
+        if len(head) > rows:
+            pending.insert(0, head.iloc[rows:])
+        rows -= len(parts[-1])
+    if not parts:
+        return None
+    return pd.concat(parts) if len(parts) > 1 else parts[0]
+
+def calculate_scores_chunked(chunks, ref_chunks, threshold_date=None, block_size=64, rules=None,
+                             uniqueness="exact", hll_precision=14, recorder=None, near_duplicates=None, drift=None):
+    """Calculates ``calculate_scores`` over streams of DataFrame chunks.
+
+    ``chunks`` and ``ref_chunks`` are iterables of DataFrames (e.g. from
+    ``load_dataset_chunks``); the reference stream is re-cut to line up with
+    each chunk by row position, so the two may use different chunk sizes.
+    Only one chunk of each stream and the merged per-column aggregates are held
+    in memory. Exact uniqueness keeps the set of distinct values of a column;
+    use ``uniqueness="approx"`` to bound it to a fixed-size sketch instead.
+
+    ``near_duplicates`` is not supported here: clustering compares rows
+    across the whole dataset, so use ``calculate_scores`` for it. ``drift``
+    works as in ``calculate_scores``; with ``True`` both streams are profiled
+    as they are read, including reference rows beyond the end of the dataset.
+    """
+    if near_duplicates:
+        raise ValueError("Near-duplicate detection needs the whole dataset; use calculate_scores instead of "
+                         "calculate_scores_chunked.")
+    ref_chunks = iter(ref_chunks)
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return scores_from_aggregates({})
+    plan = scoring_plan(first.columns, threshold_date, rules, uniqueness, hll_precision, distinct_values=True)
+    profile = reference_profile = None
+    if drift is not None and drift is not False:
+        from dataquame.drift import DatasetProfile, drift_records, drift_scores
 
-        detailed_scores[col] = column_scores
+        profile = DatasetProfile()
+        reference_profile = DatasetProfile() if drift is True else None
+    pending = []
+    aggregates = {}
+    timings = {} if recorder is not None else None
+    for chunk in itertools.chain([first], chunks):
+        ref_chunk = _take_rows(ref_chunks, pending, len(chunk))
+        if profile is not None:
+            profile.add(chunk)
+            if reference_profile is not None and ref_chunk is not None:
+                reference_profile.add(ref_chunk)
+        if ref_chunk is None:
+            ref_chunk = pd.DataFrame(columns=chunk.columns)
+        chunk_aggregates = frame_aggregates(chunk, ref_chunk, block_size, plan, timings)
+        aggregates = merge_aggregates(aggregates, chunk_aggregates)
+    if recorder is not None:
+        recorder.add_metric_timings(timings)
 
-    scores_df = pd.DataFrame(detailed_scores).T
+    scores_df = scores_from_aggregates(aggregates)
+    if profile is not None:
+        if reference_profile is not None:
+            for ref_chunk in itertools.chain(pending, ref_chunks):
+                reference_profile.add(ref_chunk)
+        scores_df.attrs["drift"] = drift_records(drift_scores(profile, reference_profile or drift))
     return scores_df
 
 def overall_quality_score(scores_df):
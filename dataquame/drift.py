@@ -0,0 +1,221 @@
+import copy
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataquame.sketches import KLLSketch, MisraGries
+
+# Columns with a population stability index above this are flagged as drifted
+DRIFT_PSI = 0.2
+
+# Reference quantiles bounding the bins of the numeric PSI
+PSI_QUANTILES = np.linspace(0.1, 0.9, 9)
+
+# Floor of bin shares in the PSI, so empty bins do not give infinite scores
+PSI_EPSILON = 1e-4
+
+def column_kind(column):
+    """How a column is sketched: "numeric" (quantiles) or "categorical" (frequent values)."""
+    if pd.api.types.is_bool_dtype(column):
+        return "categorical"
+    if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_datetime64_any_dtype(column):
+        return "numeric"
+    return "categorical"
+
+def _numeric_values(column):
+    if pd.api.types.is_datetime64_any_dtype(column):
+        # Datetimes are sketched as nanoseconds since the epoch
+        return column.dropna().dt.as_unit("ns").astype("int64").to_numpy()
+    return column
+
+class DatasetProfile:
+    """Mergeable sketches of every column of a dataset, for drift scoring.
+
+    Numeric and datetime columns get a ``KLLSketch``, other columns a
+    ``MisraGries`` summary, both built in one pass over the rows; ``add``
+    can be called once per chunk. Profiles are saved as JSON so a later run
+    can compare a dataset with them without reloading the reference data.
+    """
+
+    def __init__(self, quantile_k=200, top_k=100):
+        self.quantile_k = quantile_k
+        self.top_k = top_k
+        self.rows = 0
+        self.columns = {}
+
+    @classmethod
+    def from_frames(cls, frames, **options):
+        """Profile a DataFrame, or an iterable of chunks such as ``load_dataset_chunks``."""
+        profile = cls(**options)
+        for chunk in [frames] if isinstance(frames, pd.DataFrame) else frames:
+            profile.add(chunk)
+        return profile
+
+    def _sketch(self, kind):
+        return KLLSketch(self.quantile_k) if kind == "numeric" else MisraGries(self.top_k)
+
+    def add(self, df):
+        """Add a DataFrame (or a chunk of one) to the profile.
+
+        A column's kind is fixed by the first chunk holding any of its values;
+        until then (e.g. a sparse text column that a CSV reader typed as float
+        in an all-missing chunk) it is only counted as missing.
+        """
+        self.rows += len(df)
+        for col in df.columns:
+            column = df[col]
+            nulls = int(column.isna().sum())
+            entry = self.columns.get(str(col))
+            if entry is None:
+                # Columns first seen in a later chunk count the earlier rows as missing
+                entry = self.columns[str(col)] = {"kind": None, "nulls": self.rows - len(df), "sketch": None}
+            entry["nulls"] += nulls
+            if nulls == len(column):
+                continue
+            if entry["kind"] is None:
+                entry["kind"] = column_kind(column)
+                entry["sketch"] = self._sketch(entry["kind"])
+            elif entry["kind"] == "numeric" and column_kind(column) != "numeric":
+                raise ValueError(f"Column '{col}' was numeric in earlier chunks but is {column.dtype} here. "
+                                 "Load the chunks with a fixed dtype.")
+            entry["sketch"].add(_numeric_values(column) if entry["kind"] == "numeric" else column)
+
+    def merge(self, other):
+        """Merge ``other`` into this profile in place and return it."""
+        for col, other_entry in other.columns.items():
+            entry = self.columns.get(col)
+            if entry is None:
+                self.columns[col] = {"kind": other_entry["kind"], "nulls": other_entry["nulls"] + self.rows,
+                                     "sketch": copy.deepcopy(other_entry["sketch"])}
+                continue
+            entry["nulls"] += other_entry["nulls"]
+            if other_entry["kind"] is None:
+                continue
+            if entry["kind"] is None:
+                entry["kind"], entry["sketch"] = other_entry["kind"], copy.deepcopy(other_entry["sketch"])
+            elif entry["kind"] != other_entry["kind"]:
+                raise ValueError(f"Column '{col}' is {entry['kind']} in one profile and {other_entry['kind']} in the other.")
+            else:
+                entry["sketch"].merge(other_entry["sketch"])
+        for col, entry in self.columns.items():
+            if col not in other.columns:
+                entry["nulls"] += other.rows
+        self.rows += other.rows
+        return self
+
+    def to_dict(self):
+        return {
+            "quantile_k": self.quantile_k,
+            "top_k": self.top_k,
+            "rows": self.rows,
+            "columns": {col: {"kind": entry["kind"], "nulls": entry["nulls"],
+                              "sketch": None if entry["sketch"] is None else entry["sketch"].to_dict()}
+                        for col, entry in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls(data["quantile_k"], data["top_k"])
+        profile.rows = data["rows"]
+        for col, entry in data["columns"].items():
+            sketch_type = KLLSketch if entry["kind"] == "numeric" else MisraGries
+            profile.columns[col] = {"kind": entry["kind"], "nulls": entry["nulls"],
+                                    "sketch": None if entry["sketch"] is None else sketch_type.from_dict(entry["sketch"])}
+        return profile
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+def _psi(actual, expected):
+    actual = np.maximum(actual, PSI_EPSILON)
+    expected = np.maximum(expected, PSI_EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+def _bin_shares(sketch, edges):
+    return np.diff(np.concatenate([[0.0], sketch.cdf(edges), [1.0]]))
+
+def numeric_drift(sketch, reference):
+    """PSI over reference-decile bins and the Kolmogorov-Smirnov distance of two ``KLLSketch``es."""
+    if sketch.n == 0 or reference.n == 0:
+        return np.nan, np.nan
+    edges = np.unique(reference.quantile(PSI_QUANTILES))
+    # Both step functions only change at kept items, so the largest gap is found at one of them
+    points = np.union1d(sketch.items(), reference.items())
+    distance = float(np.max(np.abs(sketch.cdf(points) - reference.cdf(points))))
+    return _psi(_bin_shares(sketch, edges), _bin_shares(reference, edges)), distance
+
+def categorical_drift(summary, reference):
+    """PSI and total variation distance of the value shares of two ``MisraGries`` summaries.
+
+    Only values whose share is above the error bound of both summaries are
+    compared; rarer values, whose estimates depend on the order the rows were
+    seen in, are pooled into one "other" bin with the counts the summaries shed.
+    """
+    if summary.n == 0 or reference.n == 0:
+        return np.nan, np.nan
+    shares = pd.concat([summary.frequencies(), reference.frequencies()], axis=1).fillna(0.0)
+    shares = shares[shares.max(axis=1) > max(summary.error(), reference.error())].to_numpy()
+    shares = np.vstack([shares, np.maximum(1 - shares.sum(axis=0), 0.0)])
+    return _psi(shares[:, 0], shares[:, 1]), float(np.abs(shares[:, 0] - shares[:, 1]).sum() / 2)
+
+def _profile(source, **options):
+    if isinstance(source, DatasetProfile):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        return DatasetProfile.load(source)
+    return DatasetProfile.from_frames(source, **options)
+
+def drift_scores(dataset, reference, psi_threshold=DRIFT_PSI, **profile_options):
+    """Score the distribution drift of every column shared by ``dataset`` and ``reference``.
+
+    Either side may be a DataFrame, an iterable of chunks, a ``DatasetProfile``
+    or the path of a saved profile; frames are profiled in a single pass.
+    Numeric columns are compared through quantile sketches (``distance`` is the
+    Kolmogorov-Smirnov statistic), other columns through their frequent values
+    (``distance`` is the total variation distance). Both range from 0 (same
+    distribution) up; ``drifted`` flags a PSI above ``psi_threshold``.
+
+    Returns:
+        pd.DataFrame: One row per column with ``kind``, ``psi``, ``distance``,
+        ``null_rate``, ``reference_null_rate`` and ``drifted``.
+    """
+    profile = _profile(dataset, **profile_options)
+    reference = _profile(reference, **profile_options)
+
+    rows = {}
+    for col, entry in profile.columns.items():
+        ref_entry = reference.columns.get(col)
+        if ref_entry is None:
+            continue
+        if entry["kind"] is None or ref_entry["kind"] is None:
+            # A column without any values on one side has no distribution to compare
+            kind, psi, distance = entry["kind"] or ref_entry["kind"] or "empty", np.nan, np.nan
+        elif entry["kind"] != ref_entry["kind"]:
+            kind, psi, distance = f"{entry['kind']}/{ref_entry['kind']}", np.nan, np.nan
+        elif entry["kind"] == "numeric":
+            kind, (psi, distance) = "numeric", numeric_drift(entry["sketch"], ref_entry["sketch"])
+        else:
+            kind, (psi, distance) = "categorical", categorical_drift(entry["sketch"], ref_entry["sketch"])
+        rows[col] = {
+            "kind": kind,
+            "psi": psi,
+            "distance": distance,
+            "null_rate": entry["nulls"] / profile.rows if profile.rows else np.nan,
+            "reference_null_rate": ref_entry["nulls"] / reference.rows if reference.rows else np.nan,
+            "drifted": bool(psi > psi_threshold),
+        }
+    return pd.DataFrame.from_dict(rows, orient="index",
+                                  columns=["kind", "psi", "distance", "null_rate", "reference_null_rate", "drifted"])
+
+def drift_records(drift_df):
+    """``{column: {...}}`` records of a ``drift_scores`` frame, with missing scores as ``None`` (JSON null)."""
+    return drift_df.astype(object).where(drift_df.notna(), None).to_dict(orient="index")
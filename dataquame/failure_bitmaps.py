@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+class FailureBitmaps:
+    """The rows failing each metric of each column, kept as packed bitmaps.
+
+    Pass an instance as ``calculate_scores(..., failures=bitmaps)`` and it
+    receives, for every ``(column, metric)`` of ``scores_df``, a mask of the
+    rows that count against the score, packed to one bit per row with
+    ``np.packbits`` (``rows / 8`` bytes per metric, whatever the column
+    holds). Rows are identified by position in the scored DataFrame; use
+    ``df.index[rows]`` for their labels. Metrics that do not apply to a
+    column (no validation rules, not a datetime column) keep no bitmap and
+    have no failing rows.
+    """
+
+    def __init__(self, rows=None):
+        self.rows = rows
+        self.bitmaps = {}
+
+    def add(self, column, metric, failed):
+        """Store the boolean mask of the rows of ``column`` failing ``metric``."""
+        failed = np.asarray(failed, dtype=bool)
+        if self.rows is None:
+            self.rows = len(failed)
+        elif len(failed) != self.rows:
+            raise ValueError(f"Expected a mask of {self.rows} rows for '{column}' {metric}, got {len(failed)}.")
+        self.bitmaps[(column, metric)] = np.packbits(failed)
+
+    def update(self, other):
+        """Add the bitmaps of ``other``, collected over the same rows (e.g. by another worker)."""
+        if other.rows is not None and self.rows is not None and other.rows != self.rows:
+            raise ValueError(f"Cannot combine bitmaps over {self.rows} and {other.rows} rows.")
+        if self.rows is None:
+            self.rows = other.rows
+        self.bitmaps.update(other.bitmaps)
+        return self
+
+    def _bitmap(self, column, metric):
+        bitmap = self.bitmaps.get((column, metric))
+        if bitmap is None:
+            return np.zeros(-(-(self.rows or 0) // 8), dtype=np.uint8)
+        return bitmap
+
+    def _positions(self, bitmap):
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.rows or 0))
+
+    def mask(self, column, metric):
+        """The rows of ``column`` failing ``metric``, as a boolean array."""
+        return np.unpackbits(self._bitmap(column, metric), count=self.rows or 0).astype(bool)
+
+    def failing_rows(self, column, metric):
+        """Positions of the rows of ``column`` failing ``metric``, in ascending order."""
+        return self._positions(self._bitmap(column, metric))
+
+    def count(self, column, metric):
+        """Number of rows of ``column`` failing ``metric``."""
+        return int(np.unpackbits(self._bitmap(column, metric)).sum())
+
+    def intersect(self, pairs):
+        """Positions of the rows failing every ``(column, metric)`` pair, combined without unpacking."""
+        pairs = list(pairs)
+        if not pairs:
+            raise ValueError("At least one (column, metric) pair is needed.")
+        return self._positions(np.bitwise_and.reduce([self._bitmap(*pair) for pair in pairs]))
+
+    def union(self, pairs):
+        """Positions of the rows failing any ``(column, metric)`` pair."""
+        pairs = list(pairs)
+        if not pairs:
+            return np.empty(0, dtype=np.intp)
+        return self._positions(np.bitwise_or.reduce([self._bitmap(*pair) for pair in pairs]))
+
+    def summary(self):
+        """Failing row counts as a DataFrame laid out like ``scores_df`` (columns by metrics)."""
+        from dataquame.data_quality_metrics import METRICS
+
+        counts = {}
+        for (column, metric), bitmap in self.bitmaps.items():
+            counts.setdefault(column, {})[metric] = int(np.unpackbits(bitmap).sum())
+        # Metrics that keep no bitmap for a column have no failing rows
+        return pd.DataFrame.from_dict(counts, orient="index", columns=METRICS).fillna(0).astype("int64")
+
+    @property
+    def nbytes(self):
+        return sum(bitmap.nbytes for bitmap in self.bitmaps.values())
+
+    def save(self, path):
+        """Save the bitmaps to a compressed ``.npz`` file, e.g. next to the scores."""
+        keys = list(self.bitmaps)
+        np.savez_compressed(path, rows=np.int64(self.rows or 0),
+                            columns=np.array([str(column) for column, _ in keys], dtype=str),
+                            metrics=np.array([metric for _, metric in keys], dtype=str),
+                            **{f"bitmap_{i}": self.bitmaps[key] for i, key in enumerate(keys)})
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Load bitmaps saved by ``save``; column names come back as strings."""
+        with np.load(path) as data:
+            bitmaps = cls(int(data["rows"]))
+            for i, (column, metric) in enumerate(zip(data["columns"].tolist(), data["metrics"].tolist())):
+                bitmaps.bitmaps[(column, metric)] = data[f"bitmap_{i}"]
+        return bitmaps
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+
+from dataprec.data_preprocessing import preprocess_column
+
+# Multiplier of the polynomial hash over the bytes of a shingle
+SHINGLE_BASE = np.uint64(1099511628211)
+
+# Rows shingled and MinHashed at a time; bounds the temporary per-byte arrays
+BATCH_ROWS = 10_000
+
+# Joins the text columns of a row, so a shingle spanning two fields is not mistaken for text within one field
+FIELD_SEPARATOR = "\x1f"
+
+def _mix64(x):
+    """SplitMix64 finalizer: spreads the bits of 64-bit integers so nearby inputs hash far apart."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def normalize_text(column):
+    """Normalize a column as ``preprocess_column(column, "text")`` does (stripped, lower case).
+
+    Runs of whitespace are also collapsed to one space, and missing values
+    become empty strings rather than "nan".
+    """
+    text = preprocess_column(column, "text").str.replace(r"\s+", " ", regex=True)
+    return text.where(column.notna(), "")
+
+def row_texts(df, text_columns):
+    """The normalized text fields of each row, joined into one string per row."""
+    texts = None
+    for col in text_columns:
+        text = normalize_text(df[col])
+        texts = text if texts is None else texts + FIELD_SEPARATOR + text
+    return texts
+
+def _shingle_hashes(texts, shingle_size):
+    """Hashes of every ``shingle_size``-byte substring of each text, and the number of shingles per text."""
+    # Shorter texts are padded so that every text has at least one shingle
+    encoded = [text.encode("utf-8").ljust(shingle_size, b"\0") for text in texts]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+
+    positions = len(data) - shingle_size + 1
+    hashes = np.zeros(positions, dtype=np.uint64)
+    for offset in range(shingle_size):
+        hashes = hashes * SHINGLE_BASE + data[offset:offset + positions]
+
+    # Keep the shingles that start and end inside the same text
+    counts = lengths - shingle_size + 1
+    text_starts = np.cumsum(lengths) - lengths
+    first = np.cumsum(counts) - counts
+    index = np.arange(counts.sum()) - np.repeat(first - text_starts, counts)
+    return _mix64(hashes[index]), counts
+
+def minhash_signatures(texts, num_perm=64, shingle_size=5, batch_rows=BATCH_ROWS, seed=0):
+    """MinHash signatures of the byte shingles of each text.
+
+    Row ``i`` of the result holds, for each of ``num_perm`` hash functions,
+    the minimum hash over the shingles of ``texts[i]``; two texts agree on a
+    position with probability equal to the Jaccard similarity of their
+    shingle sets. Signatures keep 32 bits per hash function, so they take
+    ``4 * num_perm`` bytes per row.
+    """
+    texts = list(texts)
+    rng = np.random.default_rng(seed)
+    # Multiply-add hash functions (a * h + b) over the mixed shingle hashes; odd multipliers are bijective
+    multipliers = rng.integers(0, 2**63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    increments = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for start in range(0, len(texts), batch_rows):
+        hashes, counts = _shingle_hashes(texts[start:start + batch_rows], shingle_size)
+        firsts = np.cumsum(counts) - counts
+        for i in range(num_perm):
+            permuted = hashes * multipliers[i] + increments[i]
+            signatures[start:start + len(counts), i] = np.minimum.reduceat(permuted, firsts) >> np.uint64(32)
+    return signatures
+
+def _equal_neighbours(keys):
+    """Pairs of positions with equal keys, linking each to the next one in row order (not all pairs)."""
+    order = np.argsort(keys, kind="stable")
+    same = keys[order[1:]] == keys[order[:-1]]
+    return order[:-1][same], order[1:][same]
+
+def lsh_candidate_pairs(signatures, bands=16):
+    """Candidate near-duplicate pairs: rows whose signatures agree on every row of some band.
+
+    The ``num_perm`` signature columns are cut into ``bands`` bands; rows are
+    bucketed by the hash of each band, and the members of a bucket are linked
+    in a chain, so the number of pairs grows linearly with the rows instead
+    of with the square of the bucket size. Pairs appear once, with the
+    smaller position first.
+    """
+    num_perm = signatures.shape[1]
+    if num_perm % bands:
+        raise ValueError(f"The {num_perm} hash functions cannot be split into {bands} equal bands.")
+    rows_per_band = num_perm // bands
+
+    pairs = []
+    for band in range(bands):
+        keys = np.full(len(signatures), band, dtype=np.uint64)
+        for col in range(band * rows_per_band, (band + 1) * rows_per_band):
+            keys = _mix64(keys ^ signatures[:, col].astype(np.uint64))
+        left, right = _equal_neighbours(keys)
+        pairs.append(np.minimum(left, right).astype(np.int64) * len(signatures) + np.maximum(left, right))
+    pairs = np.unique(np.concatenate(pairs)) if pairs else np.empty(0, dtype=np.int64)
+    return pairs // len(signatures), pairs % len(signatures)
+
+def connected_components(n, left, right):
+    """Label each of ``n`` items with the smallest item it is linked to through ``(left, right)`` edges.
+
+    A vectorized union-find: every edge hooks the root of the larger label
+    under the smaller one, then paths are compressed by pointer jumping,
+    until both ends of every edge share a root.
+    """
+    parent = np.arange(n)
+    left = np.asarray(left, dtype=np.intp)
+    right = np.asarray(right, dtype=np.intp)
+    while True:
+        root_left, root_right = parent[left], parent[right]
+        if np.array_equal(root_left, root_right):
+            return parent
+        low = np.minimum(root_left, root_right)
+        np.minimum.at(parent, root_left, low)
+        np.minimum.at(parent, root_right, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+def duplicate_clusters(df, text_columns=None, key_columns=None, threshold=0.8, num_perm=64, bands=16,
+                       shingle_size=5, batch_rows=BATCH_ROWS, seed=0):
+    """Group the rows of ``df`` into clusters of duplicates, without comparing all pairs.
+
+    Two rows are duplicates when they hold the same values in all
+    ``key_columns`` (rows with a missing key never match by key), or when
+    their normalized ``text_columns`` (see ``normalize_text``) are near
+    duplicates: their MinHash signatures share an LSH band and agree on at
+    least ``threshold`` of the hash functions, i.e. the estimated Jaccard
+    similarity of their byte ``shingle_size``-grams is at least
+    ``threshold``. Rows whose text fields are all empty are only matched by
+    key. Duplicates are transitive, so a cluster is a connected component.
+
+    Args:
+        text_columns (list, optional): Columns compared approximately. Defaults to
+            every text column that is not a key column; pass ``[]`` to match by key only.
+        key_columns (list, optional): Columns compared exactly.
+        num_perm (int, optional): MinHash functions; more give a finer similarity estimate.
+        bands (int, optional): LSH bands; ``num_perm`` must be a multiple of it. Rows
+            with similarity around ``(1 / bands) ** (bands / num_perm)`` and above
+            (0.5 by default) become candidates.
+
+    Returns:
+        pd.Series: For each row (indexed like ``df``), the position of the first
+        row of its cluster; rows without duplicates are their own cluster.
+    """
+    key_columns = [key_columns] if isinstance(key_columns, str) else list(key_columns or [])
+    if text_columns is None:
+        text_columns = [col for col in df.columns if col not in key_columns
+                        and (pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]))]
+    missing = [col for col in list(text_columns) + key_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} are not found in the DataFrame.")
+
+    edges = []
+    if key_columns:
+        keys = df[key_columns]
+        present = np.flatnonzero(keys.notna().all(axis=1).to_numpy())
+        hashes = pd.util.hash_pandas_object(keys.iloc[present], index=False).to_numpy()
+        left, right = _equal_neighbours(hashes)
+        edges.append((present[left], present[right]))
+
+    if len(text_columns):
+        texts = row_texts(df, text_columns)
+        present = np.flatnonzero((texts.str.replace(FIELD_SEPARATOR, "", regex=False) != "").to_numpy())
+        signatures = minhash_signatures(texts.iloc[present], num_perm, shingle_size, batch_rows, seed)
+        left, right = lsh_candidate_pairs(signatures, bands)
+        # Verify each candidate with its estimated similarity
+        similar = (signatures[left] == signatures[right]).mean(axis=1) >= threshold
+        edges.append((present[left[similar]], present[right[similar]]))
+
+    left = np.concatenate([edge[0] for edge in edges]) if edges else np.empty(0, dtype=np.intp)
+    right = np.concatenate([edge[1] for edge in edges]) if edges else np.empty(0, dtype=np.intp)
+    return pd.Series(connected_components(len(df), left, right), index=df.index, name="cluster")
+
+def row_uniqueness_score(clusters):
+    """Percentage of rows that are not a duplicate of another row: clusters over rows (100 for no rows)."""
+    if len(clusters) == 0:
+        return 100.0
+    return clusters.nunique() / len(clusters) * 100
+
+def near_duplicate_report(df, **options):
+    """Cluster the rows of ``df`` (see ``duplicate_clusters``) and summarize the duplicates.
+
+    Returns:
+        dict: ``row_uniqueness`` (see ``row_uniqueness_score``), ``rows``,
+        ``clusters``, ``duplicate_rows`` (rows beyond the first of their cluster),
+        ``largest_cluster`` and ``duplicate_clusters``, a DataFrame with the
+        ``cluster``, ``size`` and index labels (``rows``) of every cluster of
+        two or more rows, largest first.
+    """
+    clusters = duplicate_clusters(df, **options)
+    sizes = clusters.value_counts()
+    groups = sizes[sizes > 1]
+    members = clusters[clusters.isin(groups.index)]
+    rows = members.groupby(members).groups
+    table = pd.DataFrame({
+        "cluster": groups.index.to_numpy(),
+        "size": groups.to_numpy(),
+        "rows": [list(rows[cluster]) for cluster in groups.index],
+    })
+    return {
+        "row_uniqueness": row_uniqueness_score(clusters),
+        "rows": len(clusters),
+        "clusters": int(len(sizes)),
+        "duplicate_rows": int(len(clusters) - len(sizes)),
+        "largest_cluster": int(sizes.max()) if len(sizes) else 0,
+        "duplicate_clusters": table,
+    }
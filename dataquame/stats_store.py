@@ -0,0 +1,265 @@
+import datetime
+import decimal
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from dataloD.data_loader import load_dataset
+from dataquame.data_quality_metrics import (align_reference, frame_aggregates, merge_aggregates, scores_from_aggregates,
+                                            scoring_plan)
+from dataquame.sketches import HyperLogLog
+
+DAY_NS = 86_400 * 10**9
+
+def _encode_value(value):
+    """A JSON form of a distinct value; values JSON cannot hold are tagged ``[type, text]``."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, str, int)):
+        return value
+    if isinstance(value, float):
+        return value if math.isfinite(value) else ["float", repr(value)]
+    if isinstance(value, datetime.datetime):
+        return ["timestamp", pd.Timestamp(value).isoformat()]
+    if isinstance(value, datetime.date):
+        return ["date", value.isoformat()]
+    if isinstance(value, datetime.timedelta):
+        return ["timedelta", pd.Timedelta(value).value]
+    if isinstance(value, decimal.Decimal):
+        return ["decimal", str(value)]
+    raise ValueError(f"Distinct values of type {type(value).__name__} cannot be stored; use uniqueness=\"approx\".")
+
+def _decode_value(value):
+    if not isinstance(value, list):
+        return value
+    kind, text = value
+    decoders = {"float": float, "timestamp": pd.Timestamp, "date": datetime.date.fromisoformat,
+                "timedelta": pd.Timedelta, "decimal": decimal.Decimal}
+    return decoders[kind](text)
+
+def _encode_distinct(distinct):
+    if isinstance(distinct, HyperLogLog):
+        return {"sketch": distinct.to_dict()}
+    return {"values": [_encode_value(value) for value in distinct]}
+
+def _decode_distinct(distinct):
+    if "sketch" in distinct:
+        return HyperLogLog.from_dict(distinct["sketch"])
+    return {_decode_value(value) for value in distinct["values"]}
+
+def _epoch_ns(column):
+    """Non-missing values of a datetime column as int64 nanoseconds, timezone-aware ones in UTC."""
+    values = column.dropna()
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert(None)
+    return values.astype("datetime64[ns]").to_numpy().view("i8")
+
+def day_histogram(column):
+    """Counts of the values of a datetime column per UTC day, as ``{"days": [...], "counts": [...]}``.
+
+    Days are numbered from the epoch. Timeliness for any threshold at midnight
+    is the count of the days on or after the threshold's day.
+    """
+    days, counts = np.unique(_epoch_ns(column) // DAY_NS, return_counts=True)
+    return {"days": days.tolist(), "counts": counts.tolist()}
+
+def timely_from_histogram(histogram, threshold_date):
+    """Entries on or after ``threshold_date`` counted from a ``day_histogram``.
+
+    Returns ``None`` if the threshold has a time of day and falls on a day
+    holding values, whose entries cannot be split without the values.
+    """
+    threshold = pd.to_datetime(threshold_date).tz_localize(None).as_unit("ns").value
+    day, time_of_day = divmod(threshold, DAY_NS)
+    days = np.asarray(histogram["days"], dtype=np.int64)
+    counts = np.asarray(histogram["counts"], dtype=np.int64)
+    if time_of_day and day in days:
+        return None
+    return int(counts[days > day].sum() + (0 if time_of_day else counts[days == day].sum()))
+
+class StatisticsStore:
+    """SQLite store of per-partition column aggregates.
+
+    Each row holds the mergeable aggregates of one partition (row, null,
+    valid, accurate and consistent counts, distinct-value sets or sketches,
+    and per-day counts of datetime columns for timeliness) as JSON, keyed by
+    dataset name and partition fingerprint. Nothing stored is executable.
+    """
+
+    def __init__(self, path="quality_stats.sqlite"):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        # Stores written before the JSON format held pickles, which are never loaded
+        self._connection.execute("DROP TABLE IF EXISTS partition_stats")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS partition_aggregates (
+                dataset TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                rows INTEGER NOT NULL,
+                aggregates TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (dataset, fingerprint)
+            )
+        """)
+        self._connection.commit()
+
+    def get(self, dataset, fingerprint):
+        """Return ``(rows, aggregates)`` of a stored partition, or ``None``.
+
+        ``aggregates`` are as ``put`` received them: the ``timely`` entry of a
+        datetime column is its ``day_histogram``.
+        """
+        row = self._connection.execute(
+            "SELECT rows, aggregates FROM partition_aggregates WHERE dataset = ? AND fingerprint = ?",
+            (dataset, fingerprint),
+        ).fetchone()
+        if row is None:
+            return None
+        aggregates = {}
+        for col, column_aggregates in json.loads(row[1]):
+            column_aggregates["distinct"] = _decode_distinct(column_aggregates["distinct"])
+            aggregates[_decode_value(col)] = column_aggregates
+        return row[0], aggregates
+
+    def put(self, dataset, fingerprint, rows, aggregates):
+        encoded = [[_encode_value(col), {**column_aggregates, "distinct": _encode_distinct(column_aggregates["distinct"])}]
+                   for col, column_aggregates in aggregates.items()]
+        self._connection.execute(
+            "INSERT OR REPLACE INTO partition_aggregates VALUES (?, ?, ?, ?, ?)",
+            (dataset, fingerprint, rows, json.dumps(encoded, allow_nan=False), time.time()),
+        )
+        self._connection.commit()
+
+    def prune(self, dataset, keep):
+        """Delete the stored partitions of ``dataset`` whose fingerprint is not in ``keep``."""
+        keep = list(keep)
+        placeholders = ",".join("?" * len(keep)) or "''"
+        self._connection.execute(
+            f"DELETE FROM partition_aggregates WHERE dataset = ? AND fingerprint NOT IN ({placeholders})",
+            [dataset, *keep],
+        )
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def file_fingerprint(path):
+    """Identify a partition file by name, size and modification time, without reading it."""
+    stat = os.stat(path)
+    return f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+def frame_fingerprint(df):
+    """Content fingerprint of a DataFrame (e.g. the reference frame)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _describe(value):
+    """A stable description of a scoring option, including compiled rules."""
+    if isinstance(value, partial):
+        return [value.func.__module__, value.func.__qualname__, _describe(value.keywords)]
+    if isinstance(value, dict):
+        return {str(key): _describe(item) for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_describe(item) for item in value]
+    if hasattr(value, "pattern"):
+        return value.pattern
+    return value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+
+def _partition_fingerprint(path, options, reference_fingerprint, offset):
+    payload = json.dumps([file_fingerprint(path), options, reference_fingerprint, offset], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _with_threshold(aggregates, threshold_date):
+    """Stored aggregates with the day histograms turned into timely counts, or ``None`` if one cannot be."""
+    resolved = {}
+    for col, column_aggregates in aggregates.items():
+        if column_aggregates["timely"] is not None:
+            timely = timely_from_histogram(column_aggregates["timely"], threshold_date)
+            if timely is None:
+                return None
+            column_aggregates = {**column_aggregates, "timely": timely}
+        resolved[col] = column_aggregates
+    return resolved
+
+def calculate_scores_incremental(partitions, reference, store, dataset, threshold_date=None, key_columns=None,
+                                 rules=None, uniqueness="exact", hll_precision=14, block_size=64,
+                                 load=load_dataset, reference_fingerprint=None):
+    """Calculates ``calculate_scores`` over partition files, reusing stored aggregates.
+
+    ``partitions`` is the ordered list of files making up the dataset (e.g. one
+    CSV per daily append), read with ``load``. A partition whose file,
+    scoring options and reference are unchanged since a previous run is not
+    read again: its aggregates come from ``store`` and are merged with those
+    of the new or changed partitions. Stored partitions no longer in the list
+    are dropped. Changing ``load`` is not detected; use a new ``dataset`` name.
+
+    Without ``key_columns`` each partition is compared with the reference rows
+    at the same position in the concatenated dataset. The threshold date
+    (default: the start of today) is not part of the fingerprint: datetime
+    columns are stored as per-day counts (see ``day_histogram``), so timeliness
+    follows the threshold without reading cached partitions again, except a
+    threshold with a time of day that falls on a day holding values. Use
+    ``uniqueness="approx"`` to keep stored distinct state small.
+
+    Returns:
+        pd.DataFrame: ``scores_df``; ``scores_df.attrs["partitions"]`` counts the
+        partitions that were scored and the ones read from the store.
+    """
+    if threshold_date is None:
+        threshold_date = pd.Timestamp.today().normalize()
+    if reference_fingerprint is None:
+        reference_fingerprint = frame_fingerprint(reference)
+    options = _describe({
+        "key_columns": key_columns,
+        "rules": rules,
+        "uniqueness": uniqueness,
+        "hll_precision": hll_precision,
+    })
+
+    aggregates = {}
+    fingerprints = []
+    offset = 0
+    scored = cached = 0
+    for path in partitions:
+        fingerprint = _partition_fingerprint(path, options, reference_fingerprint, None if key_columns else offset)
+        fingerprints.append(fingerprint)
+        stored = store.get(dataset, fingerprint)
+        partition_aggregates = None if stored is None else _with_threshold(stored[1], threshold_date)
+        if partition_aggregates is None:
+            df = load(path)
+            if key_columns is not None:
+                ref_part, _ = align_reference(df, reference, key_columns)
+            else:
+                ref_part = reference.iloc[offset:offset + len(df)]
+            plan = scoring_plan(df.columns, threshold_date, rules, uniqueness, hll_precision, distinct_values=True)
+            partition_aggregates = frame_aggregates(df, ref_part, block_size, plan)
+            stored = (len(df), {col: {**column_aggregates, "timely": day_histogram(df[col])}
+                                if column_aggregates["timely"] is not None else column_aggregates
+                                for col, column_aggregates in partition_aggregates.items()})
+            store.put(dataset, fingerprint, *stored)
+            scored += 1
+        else:
+            cached += 1
+        rows = stored[0]
+        aggregates = merge_aggregates(aggregates, partition_aggregates)
+        offset += rows
+
+    store.prune(dataset, fingerprints)
+    scores_df = scores_from_aggregates(aggregates)
+    scores_df.attrs["partitions"] = {"scored": scored, "cached": cached}
+    return scores_df
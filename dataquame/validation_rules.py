@@ -0,0 +1,137 @@
+import re
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+EMAIL_PATTERN = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+RULE_TYPES = ("regex", "range", "allowed", "length", "date", "not_null")
+
+class ColumnViews:
+    """Lazily computed views of a column shared by every rule run against it.
+
+    The string conversion, numeric coercion and string lengths are each
+    computed at most once, however many rules use them, and rule results are
+    cached by rule so a repeated rule is not evaluated twice.
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self._views = {}
+        self.results = {}
+
+    def _view(self, name, build):
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+
+    @property
+    def text(self):
+        return self._view("text", lambda: self.column.astype(str))
+
+    @property
+    def numeric(self):
+        return self._view("numeric", lambda: pd.to_numeric(self.column, errors="coerce"))
+
+    @property
+    def lengths(self):
+        return self._view("lengths", lambda: self.text.str.len())
+
+def _as_mask(values):
+    return np.asarray(values.to_numpy(dtype=bool, na_value=False) if hasattr(values, "to_numpy") else values, dtype=bool)
+
+def _between(values, minimum, maximum):
+    mask = values.notna()
+    if minimum is not None:
+        mask &= values >= minimum
+    if maximum is not None:
+        mask &= values <= maximum
+    return _as_mask(mask)
+
+def _regex_rule(views, pattern):
+    return _as_mask(views.text.str.match(pattern, na=False))
+
+def _range_rule(views, minimum, maximum):
+    return _between(views.numeric, minimum, maximum)
+
+def _allowed_rule(views, values):
+    return _as_mask(views.column.isin(values))
+
+def _length_rule(views, minimum, maximum):
+    return _between(views.lengths, minimum, maximum)
+
+def _date_rule(views, date_format):
+    return _as_mask(pd.to_datetime(views.text, format=date_format, errors="coerce").notna())
+
+def _not_null_rule(views):
+    return _as_mask(views.column.notna())
+
+# Rule functions by spec type, so compiled rules can be told apart (e.g. to translate them to SQL)
+RULE_FUNCTIONS = {"regex": _regex_rule, "range": _range_rule, "allowed": _allowed_rule, "length": _length_rule,
+                  "date": _date_rule, "not_null": _not_null_rule}
+
+def describe_rule(rule):
+    """The spec type of a compiled rule and its options, or ``(None, {})`` for a custom callable."""
+    func = getattr(rule, "func", None)
+    for rule_type, rule_func in RULE_FUNCTIONS.items():
+        if func is rule_func:
+            return rule_type, dict(rule.keywords)
+    return None, {}
+
+def compile_rule(rule):
+    """Compile a declarative rule spec into a function of ``ColumnViews``.
+
+    Supported specs:
+        {"type": "regex", "pattern": r"^...$"}          value (as text) matches the pattern
+        {"type": "range", "min": 0, "max": 5}           numeric value within the bounds
+        {"type": "allowed", "values": ["a", "b"]}       value is one of the listed values
+        {"type": "length", "min": 1, "max": 64}         text length within the bounds
+        {"type": "date", "format": "%Y-%m-%d"}          text parses with the date format
+        {"type": "not_null"}                            value is present
+
+    Either bound of ``range`` and ``length`` may be omitted. Compiled rules are
+    plain partials, so they can be pickled to process-pool workers.
+    """
+    if callable(rule):
+        return rule
+
+    rule_type = rule.get("type")
+    if rule_type == "regex":
+        return partial(_regex_rule, pattern=re.compile(rule["pattern"]))
+    if rule_type == "range":
+        return partial(_range_rule, minimum=rule.get("min"), maximum=rule.get("max"))
+    if rule_type == "allowed":
+        return partial(_allowed_rule, values=list(rule["values"]))
+    if rule_type == "length":
+        return partial(_length_rule, minimum=rule.get("min"), maximum=rule.get("max"))
+    if rule_type == "date":
+        return partial(_date_rule, date_format=rule["format"])
+    if rule_type == "not_null":
+        return partial(_not_null_rule)
+    raise ValueError(f"Unknown rule type '{rule_type}'. Expected one of {RULE_TYPES}.")
+
+def compile_rules(rules):
+    """Compile a ``{column: [rule, ...]}`` mapping; a single rule may be given instead of a list."""
+    compiled = {}
+    for col, column_rules in rules.items():
+        if isinstance(column_rules, dict) or callable(column_rules):
+            column_rules = [column_rules]
+        compiled[col] = [compile_rule(rule) for rule in column_rules]
+    return compiled
+
+def default_rules(columns):
+    """The built-in rule set: every column whose name mentions "email" must hold an email address."""
+    email_rule = partial(_regex_rule, pattern=EMAIL_PATTERN)
+    return {col: [email_rule] for col in columns if "email" in str(col).lower()}
+
+def validity_mask(column, rules, views=None):
+    """Row mask of the entries of ``column`` that pass every rule."""
+    views = views or ColumnViews(column)
+    mask = np.ones(len(column), dtype=bool)
+    for rule in rules:
+        rule = compile_rule(rule)
+        if rule not in views.results:
+            views.results[rule] = rule(views)
+        mask &= views.results[rule]
+    return mask
@@ -0,0 +1,371 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from databatch.batch_runner import ReferenceCache, _render_report
+from dataProfrep.data_profiling_report import PROFILE_MODES
+from dataloD.data_loader import load_dataset
+from dataquame.data_quality_metrics import align_reference, calculate_scores, overall_quality_score
+from dataquame.validation_rules import compile_rules
+
+DEFAULT_PORT = 8765
+
+# Request bodies larger than this are refused with 413
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Columns scored per streamed chunk of /scores
+STREAM_COLUMNS = 8
+
+# Bytes per chunk when streaming a report file
+REPORT_CHUNK_BYTES = 64 * 1024
+
+# References used by path (not registered by name) kept loaded at once; the least recently used go first
+MAX_CACHED_REFERENCES = 8
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    """An error answered with ``status`` and a JSON ``{"error": message}`` body."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _rules_key(rules):
+    return json.dumps(rules, sort_keys=True, default=str)
+
+def _request_frame(request, data_path):
+    """The dataset of a request: a ``dataset`` path (resolved by ``data_path``), inline ``csv`` text, or ``records``."""
+    if "csv" in request:
+        df = pd.read_csv(io.StringIO(request["csv"]))
+        df.columns = df.columns.str.strip()
+        return df
+    if "records" in request:
+        return pd.DataFrame.from_records(request["records"])
+    if "dataset" in request:
+        return load_dataset(data_path(request["dataset"]))
+    raise ValueError("The request needs a 'dataset' path, 'csv' text or 'records'.")
+
+class ScoringService:
+    """Scores datasets against reference datasets that stay loaded between requests.
+
+    References are registered by name (or used by path) and loaded once
+    through a ``ReferenceCache``; validation rules are compiled once per
+    distinct spec. Loading, scoring and report rendering run on a pool of
+    ``max_workers`` threads, so the event loop keeps accepting requests while
+    others are being scored.
+
+    Paths sent by clients are resolved inside ``data_dir`` (see ``data_path``).
+    Named references stay loaded; at most ``max_references`` references used
+    by path are kept besides them.
+    """
+
+    def __init__(self, max_workers=4, load=load_dataset, data_dir=".", max_references=MAX_CACHED_REFERENCES):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dq-service")
+        self.max_workers = max_workers
+        self.data_dir = os.path.realpath(data_dir)
+        self.cache = ReferenceCache(load, max_entries=max_references)
+        self.references = {}
+        self._rules = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+
+    def compiled_rules(self, rules):
+        """Compile a rule spec mapping, reusing the compiled rules of an identical earlier spec."""
+        if rules is None:
+            return None
+        key = _rules_key(rules)
+        with self._lock:
+            compiled = self._rules.get(key)
+        if compiled is None:
+            compiled = compile_rules(rules)
+            with self._lock:
+                self._rules[key] = compiled
+        return compiled
+
+    def data_path(self, path):
+        """Resolve a path sent by a client inside ``data_dir``; paths leading outside it are refused."""
+        resolved = os.path.realpath(os.path.join(self.data_dir, path))
+        if os.path.commonpath([resolved, self.data_dir]) != self.data_dir:
+            raise HTTPError(403, f"'{path}' is outside the service's data directory.")
+        return resolved
+
+    def add_reference(self, name, path, rules=None, reload=False):
+        """Register (and load) a named reference; ``rules`` become the default rules of requests against it."""
+        if reload:
+            self.cache.discard(path)
+        compiled = self.compiled_rules(rules)
+        frame = self.cache.get(path, pin=True)
+        with self._lock:
+            previous = self.references.get(name)
+            self.references[name] = {"path": path, "rules": rules, "compiled_rules": compiled}
+            still_used = any(entry["path"] == previous["path"] for entry in self.references.values()) if previous else True
+        if not still_used:
+            self.cache.discard(previous["path"])
+        return self.describe_reference(name, frame)
+
+    def describe_reference(self, name, frame=None):
+        entry = self.references[name]
+        if frame is None:
+            frame = self.cache.get(entry["path"])
+        return {"name": name, "path": entry["path"], "rows": len(frame), "columns": [str(col) for col in frame.columns],
+                "rules": entry["rules"], "memory_bytes": int(frame.memory_usage(deep=False).sum())}
+
+    def list_references(self):
+        with self._lock:
+            names = list(self.references)
+        return [self.describe_reference(name) for name in names]
+
+    def prepare(self, request):
+        """Load the request's dataset and resolve its reference, rules and options."""
+        reference = request.get("reference")
+        if reference is None:
+            raise ValueError("The request needs a 'reference' name or path.")
+        with self._lock:
+            entry = self.references.get(reference)
+        path = entry["path"] if entry else self.data_path(reference)
+        try:
+            df2 = self.cache.get(path, pin=entry is not None)
+        except Exception:
+            # Do not keep the failure, so a request after the file is fixed loads it again
+            self.cache.discard(path)
+            raise
+        if "rules" in request:
+            rules = self.compiled_rules(request["rules"])
+        else:
+            rules = entry["compiled_rules"] if entry else None
+
+        df = _request_frame(request, self.data_path)
+        if df.empty:
+            raise ValueError("The dataset is empty.")
+        alignment = None
+        if request.get("key_columns"):
+            df2, alignment = align_reference(df, df2, request["key_columns"])
+        options = {
+            # Resolved once, so every chunk of a streamed request uses the same date
+            "threshold_date": pd.to_datetime(request.get("threshold_date") or "today"),
+            "rules": rules,
+            "uniqueness": request.get("uniqueness", "exact"),
+        }
+        return df, df2, options, alignment
+
+    def score(self, df, df2, options):
+        return calculate_scores(df, df2, **options)
+
+    async def run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+def _score_lines(scores_df):
+    return "".join(json.dumps({"column": str(col), **{metric: float(value) for metric, value in row.items()}}) + "\n"
+                   for col, row in scores_df.iterrows()).encode("utf-8")
+
+async def _read_request(reader):
+    """Read one HTTP/1.1 request; returns ``None`` once the client has closed the connection."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"Request bodies are limited to {MAX_BODY_BYTES} bytes.")
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    return method.upper(), target.split("?", 1)[0], body, keep_alive
+
+def _head(status, content_type, keep_alive, length=None):
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}", f"Content-Type: {content_type}",
+             "Connection: keep-alive" if keep_alive else "Connection: close"]
+    lines.append(f"Content-Length: {length}" if length is not None else "Transfer-Encoding: chunked")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+async def _send_json(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(_head(status, "application/json", keep_alive, len(body)) + body)
+    await writer.drain()
+
+async def _send_chunk(writer, data):
+    if data:
+        writer.write(f"{len(data):X}\r\n".encode("latin-1") + data + b"\r\n")
+        await writer.drain()
+
+async def _end_chunks(writer):
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+def _json_body(body):
+    try:
+        request = json.loads(body or b"{}")
+    except ValueError as e:
+        raise HTTPError(400, f"The request body is not valid JSON: {e}")
+    if not isinstance(request, dict):
+        raise HTTPError(400, "The request body must be a JSON object.")
+    return request
+
+async def _handle_scores(service, writer, request, keep_alive):
+    """Stream the scores as NDJSON: one line per column as each chunk of columns is scored, then a summary line."""
+    started = time.perf_counter()
+    df, df2, options, alignment = await service.run(service.prepare, request)
+    step = int(request.get("stream_columns", STREAM_COLUMNS))
+    writer.write(_head(200, "application/x-ndjson", keep_alive))
+    chunks = []
+    try:
+        for start in range(0, len(df.columns), step):
+            scores_df = await service.run(service.score, df.iloc[:, start:start + step], df2, options)
+            chunks.append(scores_df)
+            await _send_chunk(writer, _score_lines(scores_df))
+        summary = {"overall_score": float(overall_quality_score(pd.concat(chunks))), "rows": len(df),
+                   "columns": len(df.columns), "alignment": alignment, "seconds": time.perf_counter() - started}
+    except Exception as e:
+        # The status line is already sent, so a failure is reported as the last line
+        summary = {"error": f"{type(e).__name__}: {e}"}
+    await _send_chunk(writer, (json.dumps(summary) + "\n").encode("utf-8"))
+    await _end_chunks(writer)
+
+def _report(service, request, output_path):
+    df, df2, options, _ = service.prepare(request)
+    scores_df = service.score(df, df2, options)
+    overall_score = overall_quality_score(scores_df)
+    job = {"output": output_path, "profile_mode": request.get("profile_mode", "off"),
+           "chart_format": request.get("chart_format", "svg")}
+    if job["profile_mode"] not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{job['profile_mode']}'. Expected one of {PROFILE_MODES}.")
+    try:
+        _render_report(job, df, scores_df, overall_score)
+    except Exception as e:
+        # A failed render leaves any previous report at the output in place
+        raise HTTPError(500, f"The report could not be generated: {type(e).__name__}: {e}") from e
+    return float(overall_score)
+
+async def _handle_report(service, writer, request, keep_alive):
+    """Render the merged report; write it to ``output`` if given, else stream the HTML back."""
+    if request.get("output"):
+        overall_score = await service.run(_report, service, request, service.data_path(request["output"]))
+        await _send_json(writer, 200, {"output": request["output"], "overall_score": overall_score}, keep_alive)
+        return
+
+    fd, output_path = tempfile.mkstemp(suffix=".html")
+    os.close(fd)
+    try:
+        await service.run(_report, service, request, output_path)
+        writer.write(_head(200, "text/html; charset=utf-8", keep_alive))
+        with open(output_path, "rb") as f:
+            while True:
+                data = await service.run(f.read, REPORT_CHUNK_BYTES)
+                if not data:
+                    break
+                await _send_chunk(writer, data)
+        await _end_chunks(writer)
+    finally:
+        os.remove(output_path)
+
+async def _dispatch(service, writer, method, path, body, keep_alive):
+    routes = {"/health": ("GET",), "/references": ("GET", "POST"), "/scores": ("POST",), "/report": ("POST",)}
+    if path not in routes:
+        raise HTTPError(404, f"Unknown path '{path}'. Expected one of {sorted(routes)}.")
+    if method not in routes[path]:
+        raise HTTPError(405, f"{path} accepts {', '.join(routes[path])}.")
+
+    if path == "/health":
+        await _send_json(writer, 200, {"status": "ok", "uptime_seconds": time.time() - service.started,
+                                       "references": len(service.references), "workers": service.max_workers,
+                                       "requests": service.requests}, keep_alive)
+    elif path == "/references" and method == "GET":
+        references = await service.run(service.list_references)
+        await _send_json(writer, 200, {"references": references}, keep_alive)
+    elif path == "/references":
+        request = _json_body(body)
+        missing = [key for key in ("name", "path") if key not in request]
+        if missing:
+            raise HTTPError(400, f"The reference is missing {missing}.")
+        reference = await service.run(service.add_reference, request["name"], service.data_path(request["path"]),
+                                      request.get("rules"), bool(request.get("reload")))
+        await _send_json(writer, 200, reference, keep_alive)
+    elif path == "/scores":
+        await _handle_scores(service, writer, _json_body(body), keep_alive)
+    else:
+        await _handle_report(service, writer, _json_body(body), keep_alive)
+
+async def handle_connection(service, reader, writer):
+    """Serve the requests of one connection until the client closes it or asks to."""
+    try:
+        while True:
+            keep_alive = False
+            try:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                service.requests += 1
+                await _dispatch(service, writer, method, path, body, keep_alive)
+            except HTTPError as e:
+                await _send_json(writer, e.status, {"error": str(e)}, keep_alive)
+            except (ValueError, KeyError, TypeError) as e:
+                await _send_json(writer, 400, {"error": str(e)}, keep_alive)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                break
+            except Exception as e:
+                await _send_json(writer, 500, {"error": f"{type(e).__name__}: {e}"}, keep_alive)
+            if not keep_alive:
+                break
+    finally:
+        writer.close()
+
+async def serve(service, host="127.0.0.1", port=DEFAULT_PORT):
+    server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer), host, port)
+    addresses = ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+    print(f"Serving data quality scores on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+def run_service(host="127.0.0.1", port=DEFAULT_PORT, max_workers=4, references=None, data_dir=".",
+                max_references=MAX_CACHED_REFERENCES):
+    """Run the scoring service until interrupted.
+
+    Endpoints (JSON bodies):
+        GET  /health      liveness, uptime and counters
+        GET  /references  the resident reference datasets
+        POST /references  {"name", "path", "rules"?, "reload"?} load a reference and keep it resident
+        POST /scores      {"reference", "dataset" | "csv" | "records", "rules"?, "threshold_date"?,
+                          "key_columns"?, "uniqueness"?} stream per-column scores as NDJSON
+        POST /report      the /scores fields plus "profile_mode" (default "off"), "chart_format"
+                          (default "svg") and "output"?; without "output" the HTML is streamed back
+
+    Paths in requests ("dataset", "reference", "path", "output") are relative
+    to ``data_dir`` and may not lead outside it. ``references`` maps names to
+    paths (or to ``{"path", "rules"}``) loaded before the first request is
+    accepted; these come from the operator and are not restricted.
+    """
+    service = ScoringService(max_workers, data_dir=data_dir, max_references=max_references)
+    try:
+        for name, reference in (references or {}).items():
+            if isinstance(reference, str):
+                reference = {"path": reference}
+            described = service.add_reference(name, reference["path"], reference.get("rules"))
+            print(f"Loaded reference '{name}' from '{described['path']}' ({described['rows']} rows).")
+        asyncio.run(serve(service, host, port))
+    except KeyboardInterrupt:
+        print("Service stopped.")
+    finally:
+        service.close()
@@ -1,44 +1,215 @@
 from dataloD.data_loader import load_dataset
 from dataquame.data_quality_metrics import calculate_scores, overall_quality_score
-from datadetairep.detailed_report import generate_detailed_report
-from dataquaclms.quality_summary import generate_quality_summary
-from dataProfrep.data_profiling_report import generate_ydata_profiling_report 
-import matplotlib
+from datainstr.instrumentation import RunRecorder
+from dataloD.columnar_io import write_column_statistics, write_scores
+import argparse
+import json
+import os
+import sys
 
-# Ensure matplotlib works in headless environments
-matplotlib.use("Agg")
+# Report, batch and service modules (matplotlib, seaborn, ydata_profiling, asyncio)
+# are imported inside the stage or command that uses them, so scoring alone starts fast.
 
-if __name__ == "__main__":
+def run_single(run_record=None, prometheus=None, trace_memory=False, scores_output=None, stats_output=None):
+    recorder = RunRecorder("single", trace_memory=trace_memory)
     try:
         # Step 1: Load the dataset
         dataset_path = "Ds'S\\amazon.csv"
         dataset_path2="Ds'S\\Amazon2.csv"
-        df = load_dataset(dataset_path)
-        df2= load_dataset(dataset_path2)
+        with recorder.stage("load"):
+            df = load_dataset(dataset_path)
+            df2= load_dataset(dataset_path2)
+        for path, frame in ((dataset_path, df), (dataset_path2, df2)):
+            if frame.attrs.get("skipped_bad_lines"):
+                print(f"Skipped {frame.attrs['skipped_bad_lines']} malformed lines in '{path}'.")
 
         # Validate if the dataset is loaded properly
         if df is None or df.empty:
             raise ValueError("The dataset is empty or failed to load. Check the file path and content.")
 
         # Step 2: Calculate detailed scores for each column
-        detailed_scores_df = calculate_scores(df,df2)
+        with recorder.stage("score"):
+            detailed_scores_df = calculate_scores(df,df2, recorder=recorder)
+
+            # Step 3: Calculate the overall data quality score
+            overall_score = overall_quality_score(detailed_scores_df)
 
-        # Step 3: Calculate the overall data quality score
-        overall_score = overall_quality_score(detailed_scores_df)
+        # Also write the scores and per-column statistics for downstream systems
+        if scores_output:
+            write_scores(detailed_scores_df, scores_output)
+        if stats_output:
+            write_column_statistics(df, stats_output)
 
         # Step 4: Generate the detailed report content
-        detailed_report_content = generate_detailed_report(df, detailed_scores_df, overall_score)
+        with recorder.stage("detailed_report"):
+            import matplotlib
+
+            # Ensure matplotlib works in headless environments
+            matplotlib.use("Agg")
+            from datadetairep.detailed_report import generate_detailed_report
+
+            detailed_report_content = generate_detailed_report(df, detailed_scores_df, overall_score)
 
         # Step 5: Generate the quality summary content
-        quality_summary_content = generate_quality_summary(df, detailed_scores_df)
+        with recorder.stage("quality_summary"):
+            from dataquaclms.quality_summary import generate_quality_summary
+
+            quality_summary_content = generate_quality_summary(df, detailed_scores_df)
 
         # Step 6: Generate the full YData Profiling report
         output_path = "data_quality_report.html"
-        generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path)
+        with recorder.stage("profiling_report"):
+            from dataProfrep.data_profiling_report import generate_ydata_profiling_report
+
+            generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path)
 
         print(f"Data quality report generated successfully and saved as '{output_path}'!")
 
     except FileNotFoundError as e:
         print(f"Error: {e}. Check if the file '{dataset_path}' exists.")
     except Exception as e:
-        print(f"An error occurred: {e}")
\ No newline at end of file
+        print(f"An error occurred: {e}")
+    finally:
+        recorder.close()
+        print("Stage timings: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in recorder.stage_seconds().items()))
+        if run_record:
+            recorder.write_json(run_record)
+        if prometheus:
+            recorder.write_prometheus(prometheus)
+
+def run_scores(dataset_path, reference_path, threshold_date=None, rules_path=None, key_columns=None,
+               output=None, fail_under=None, near_duplicates=None, drift=False, drift_profile=None,
+               failures_path=None):
+    """Scores-only mode: score a dataset against a reference and emit the scores as JSON.
+
+    Writes ``{"overall_quality_score", "scores": {column: {metric: score}}, ...}``
+    to ``output`` or stdout; none of the report dependencies are imported.
+    Returns 1 if the overall score is below ``fail_under``, 2 on errors.
+
+    With ``drift``, distribution drift against the reference is added. With
+    ``drift_profile``, drift is scored against the reference profile saved at
+    that path, which is built from the reference and saved first if missing.
+
+    With ``failures_path``, the rows failing each metric are saved there as
+    ``FailureBitmaps`` (see ``dataquame.failure_bitmaps``) for later drill-down.
+    """
+    try:
+        df = load_dataset(dataset_path)
+        df2 = load_dataset(reference_path)
+        rules = None
+        if rules_path:
+            with open(rules_path, "r", encoding="utf-8") as f:
+                rules = json.load(f)
+        if drift_profile:
+            from dataquame.drift import DatasetProfile
+
+            if not os.path.exists(drift_profile):
+                DatasetProfile.from_frames(df2).save(drift_profile)
+            drift = DatasetProfile.load(drift_profile)
+        failures = None
+        if failures_path:
+            from dataquame.failure_bitmaps import FailureBitmaps
+
+            failures = FailureBitmaps(len(df))
+        scores_df = calculate_scores(df, df2, threshold_date=threshold_date, key_columns=key_columns, rules=rules,
+                                     near_duplicates=near_duplicates, drift=drift or None, failures=failures)
+        if failures is not None:
+            failures.save(failures_path)
+    except (OSError, ValueError) as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return 2
+
+    overall_score = float(overall_quality_score(scores_df))
+    result = {
+        "dataset": dataset_path,
+        "reference": reference_path,
+        "rows": len(df),
+        "skipped_bad_lines": df.attrs.get("skipped_bad_lines", 0),
+        "overall_quality_score": overall_score,
+        "scores": json.loads(scores_df.to_json(orient="index")),
+    }
+    for key in ("alignment", "near_duplicates", "drift"):
+        if key in scores_df.attrs:
+            result[key] = scores_df.attrs[key]
+    if failures_path:
+        result["failures"] = failures_path
+    text = json.dumps(result, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if fail_under is not None and overall_score < fail_under:
+        print(f"Overall quality score {overall_score:.2f} is below {fail_under:.2f}.", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Data quality validation and reporting.")
+    subparsers = parser.add_subparsers(dest="command")
+    batch = subparsers.add_parser("batch", help="Run a manifest of (dataset, reference, rules) jobs.")
+    batch.add_argument("manifest", help="JSON manifest of jobs (see databatch.batch_runner.load_manifest).")
+    batch.add_argument("--workers", type=int, default=4, help="Jobs scored and reported at once.")
+    batch.add_argument("--prefetch", type=int, default=1, help="Datasets loaded ahead of the running jobs.")
+    batch.add_argument("--status", default="batch_status.jsonl", help="JSON-lines file receiving one status record per job.")
+    scores = subparsers.add_parser("scores", help="Scores-only mode: print the scores and overall score as JSON, without reports.")
+    scores.add_argument("dataset", help="CSV, Parquet or Arrow IPC file to score.")
+    scores.add_argument("reference", help="Reference dataset compared against.")
+    scores.add_argument("--threshold-date", help="Timeliness threshold date (default: today).")
+    scores.add_argument("--rules", help="JSON file of validation rules per column (see dataquame.validation_rules).")
+    scores.add_argument("--key-columns", nargs="+", help="Match reference rows by these columns instead of by position.")
+    scores.add_argument("--duplicate-text", nargs="+", metavar="COLUMN",
+                        help="Also report row-level uniqueness, matching rows whose text in these columns is near-identical.")
+    scores.add_argument("--duplicate-keys", nargs="+", metavar="COLUMN",
+                        help="Also report row-level uniqueness, matching rows with equal values in these columns.")
+    scores.add_argument("--drift", action="store_true", help="Also score the distribution drift of each column against the reference.")
+    scores.add_argument("--drift-profile", help="Score drift against the reference profile saved at this path, saving it first if missing.")
+    scores.add_argument("--failures", metavar="PATH",
+                        help="Save the rows failing each metric of each column as compressed bitmaps (.npz) to this file.")
+    scores.add_argument("--output", help="Write the JSON to this file instead of stdout.")
+    scores.add_argument("--fail-under", type=float, help="Exit with status 1 if the overall score is below this value.")
+    serve = subparsers.add_parser("serve", help="Serve scores and reports over HTTP with references kept in memory.")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, help="Port to listen on (default: dataserv.service.DEFAULT_PORT).")
+    serve.add_argument("--workers", type=int, default=4, help="Requests scored or reported at once.")
+    serve.add_argument("--reference", action="append", default=[], metavar="NAME=PATH",
+                       help="Load a reference dataset at startup under NAME; may be repeated.")
+    serve.add_argument("--data-dir", default=".",
+                       help="Directory that dataset, reference and output paths in requests are confined to.")
+    serve.add_argument("--max-references", type=int,
+                       help="References used by path (not by name) kept loaded at once (default: dataserv.service.MAX_CACHED_REFERENCES).")
+    parser.add_argument("--run-record", help="Write the JSON run record (stage, metric and memory figures) of a single run to this file.")
+    parser.add_argument("--prometheus", help="Also write the run record as Prometheus text to this file.")
+    parser.add_argument("--scores-output", help="Write the scores of a single run to this Parquet or Arrow IPC file.")
+    parser.add_argument("--stats-output", help="Write per-column statistics of a single run to this Parquet or Arrow IPC file.")
+    parser.add_argument("--trace-memory", action="store_true", help="Record tracemalloc peaks and top allocation sites per stage.")
+    args = parser.parse_args(argv)
+
+    if args.command == "scores":
+        near_duplicates = None
+        if args.duplicate_text or args.duplicate_keys:
+            near_duplicates = {"text_columns": args.duplicate_text or [], "key_columns": args.duplicate_keys}
+        return run_scores(args.dataset, args.reference, args.threshold_date, args.rules, args.key_columns,
+                          args.output, args.fail_under, near_duplicates, args.drift, args.drift_profile,
+                          args.failures)
+    if args.command == "batch":
+        from databatch.batch_runner import load_manifest, run_batch
+
+        records = run_batch(load_manifest(args.manifest), max_workers=args.workers, prefetch=args.prefetch,
+                            status_path=args.status)
+        failed = sum(record["status"] != "ok" for record in records)
+        print(f"{len(records) - failed} of {len(records)} jobs succeeded; status written to '{args.status}'.")
+        return 1 if failed else 0
+    if args.command == "serve":
+        from dataserv.service import DEFAULT_PORT, MAX_CACHED_REFERENCES, run_service
+
+        references = dict(reference.split("=", 1) for reference in args.reference)
+        max_references = MAX_CACHED_REFERENCES if args.max_references is None else args.max_references
+        run_service(args.host, args.port or DEFAULT_PORT, args.workers, references, args.data_dir, max_references)
+        return 0
+    run_single(args.run_record, args.prometheus, args.trace_memory, args.scores_output, args.stats_output)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
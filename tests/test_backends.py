@@ -0,0 +1,80 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+pa = pytest.importorskip("pyarrow")
+
+from dataloD.columnar_io import write_columnar
+from dataquame.backends import calculate_scores_backend, compare_backends
+
+THRESHOLD = "2024-06-01"
+
+def assert_backends_agree(dataset, reference, rules=None):
+    results, mismatches = compare_backends(dataset, reference, threshold_date=THRESHOLD, rules=rules)
+    assert mismatches == []
+    return results["duckdb"]
+
+@pytest.fixture
+def typed_frame():
+    return pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-01", "2024-07-01", None, "2025-01-01"]),
+        "stamp": pd.to_datetime(["2024-01-01 10:00", "2024-07-01", None, "2025-01-01"], format="ISO8601"),
+        "aware": pd.to_datetime(["2024-01-01", "2024-07-01", None, "2025-01-01"]).tz_localize("Europe/Paris"),
+        "count": [1, None, 3, 4],
+        "flag": [True, False, True, True],
+        "email": [np.nan] * 4,
+        "name": ["a", "b", None, "d"],
+    })
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+def test_date_and_timezone_columns_match_themselves(tmp_path, extension):
+    table = pa.table({
+        "day": pa.array([dt.date(2024, 1, 1), dt.date(2025, 1, 1), None]),
+        "aware": pa.array(pd.to_datetime(["2024-01-01", "2026-01-01", None]).tz_localize("UTC")),
+    })
+    path = tmp_path / f"dates{extension}"
+    write_columnar(table.to_pandas(date_as_object=False), path)
+    scores = assert_backends_agree(path, path)
+    assert (scores["Accuracy"] == 100).all()
+    assert (scores["Consistency"] == 100).all()
+    assert scores.loc["day", "Timeliness"] == pytest.approx(100 / 3)
+
+def test_bundled_csvs_agree():
+    assert_backends_agree("Ds'S/dataset_with_issues.csv", "Ds'S/detail_ds.csv")
+
+def test_all_null_text_column_with_regex_rule(tmp_path):
+    path = tmp_path / "empty_emails.csv"
+    pd.DataFrame({"id": [1, 2, 3], "email": [None, None, None]}).to_csv(path, index=False)
+    scores = assert_backends_agree(path, path)
+    assert scores.loc["email", "Validity"] == 0
+
+def test_text_rules_on_typed_columns(typed_frame):
+    rules = {
+        "email": [{"type": "regex", "pattern": r"^[a-z]+@"}],
+        "count": [{"type": "regex", "pattern": r"\d\.0$"}, {"type": "length", "min": 3}],
+        "flag": [{"type": "regex", "pattern": "True"}],
+        "date": [{"type": "regex", "pattern": r"\d{4}-\d\d-\d\d$"}],
+        "stamp": [{"type": "date", "format": "%Y-%m-%d %H:%M:%S"}],
+        "name": [{"type": "allowed", "values": ["a", "b", None]}, {"type": "not_null"}],
+    }
+    assert_backends_agree(typed_frame, typed_frame, rules)
+    assert_backends_agree(typed_frame, typed_frame.iloc[::-1].reset_index(drop=True), rules)
+
+def test_timezone_aware_never_equals_naive(typed_frame):
+    reference = typed_frame.assign(aware=typed_frame["aware"].dt.tz_localize(None))
+    scores = assert_backends_agree(typed_frame, reference)
+    assert scores.loc["aware", "Accuracy"] == 0
+
+def test_reference_shorter_than_dataset(typed_frame):
+    assert_backends_agree(typed_frame, typed_frame.iloc[:2])
+
+def test_scores_match_calculate_scores(typed_frame):
+    from dataquame.data_quality_metrics import calculate_scores
+
+    expected = calculate_scores(typed_frame, typed_frame.iloc[::-1].reset_index(drop=True), threshold_date=THRESHOLD)
+    actual = calculate_scores_backend(typed_frame, typed_frame.iloc[::-1].reset_index(drop=True), "duckdb",
+                                      threshold_date=THRESHOLD)
+    pd.testing.assert_frame_equal(actual, expected)
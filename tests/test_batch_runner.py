@@ -0,0 +1,25 @@
+import json
+
+import pandas as pd
+import pytest
+
+from databatch.batch_runner import run_batch
+
+def test_failed_report_marks_job_as_error(tmp_path):
+    frame = pd.DataFrame({"a": [1, 2, 3]})
+    # A directory where the report should go makes the final replace fail
+    output = tmp_path / "report.html"
+    output.mkdir()
+    job = {"name": "job", "dataset": "data.csv", "reference": "ref.csv", "output": str(output), "profile_mode": "off"}
+    [record] = run_batch([job], max_workers=1, load=lambda path: frame)
+    assert record["status"] == "error"
+    assert record["error"]
+    assert "output" not in record
+
+def test_missing_overall_score_is_written_as_null(tmp_path):
+    status_path = tmp_path / "status.jsonl"
+    job = {"name": "job", "dataset": "data.csv", "reference": "ref.csv"}
+    run_batch([job], max_workers=1, status_path=str(status_path), load=lambda path: pd.DataFrame(index=range(3)))
+    record = json.loads(status_path.read_text(encoding="utf-8"), parse_constant=lambda token: pytest.fail(token))
+    assert record["status"] == "ok"
+    assert record["overall_score"] is None
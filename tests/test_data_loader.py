@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from dataloD.data_loader import load_dataset, load_dataset_chunks
+from dataquame.data_quality_metrics import calculate_scores, calculate_scores_chunked
+
+@pytest.fixture
+def bad_csv(tmp_path):
+    path = tmp_path / "bad.csv"
+    lines = ["a,b,c"] + [f"{i},{i + 1},{i + 2}" for i in range(0, 30, 3)]
+    lines[3:3] = ["11,12,13,14,15"]
+    lines[8:8] = ["21,22,23,24"]
+    # A short row is padded with nulls by load_dataset and load_dataset_chunks alike
+    lines[5:5] = ["31,32"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 4, 100])
+def test_chunks_skip_and_count_bad_lines_like_load_dataset(bad_csv, chunksize):
+    whole = load_dataset(bad_csv)
+    chunks = list(load_dataset_chunks(bad_csv, chunksize))
+    assert chunks[-1].attrs["skipped_bad_lines"] == whole.attrs["skipped_bad_lines"] == 2
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole, check_dtype=False)
+
+    expected = calculate_scores(whole, whole, threshold_date="2024-01-01")
+    chunked = calculate_scores_chunked(load_dataset_chunks(bad_csv, chunksize), load_dataset_chunks(bad_csv, chunksize),
+                                       threshold_date="2024-01-01")
+    pd.testing.assert_frame_equal(chunked, expected)
+
+@pytest.mark.parametrize("chunksize", [7, 100])
+def test_chunked_scores_match_in_memory_scores(chunksize):
+    path, ref_path = "Ds'S/amazon.csv", "Ds'S/Amazon2.csv"
+    expected = calculate_scores(load_dataset(path), load_dataset(ref_path))
+    chunked = calculate_scores_chunked(load_dataset_chunks(path, chunksize), load_dataset_chunks(ref_path, chunksize))
+    pd.testing.assert_frame_equal(chunked, expected)
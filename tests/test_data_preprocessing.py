@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataprec.data_preprocessing import STRING_DTYPE, optimize_column, parse_dates
+
+pytest.importorskip("pyarrow")
+
+@pytest.mark.parametrize("values, date_format", [
+    (["24-01-14 10:00", "2024-01-14 10:00", "024-01-14 10:00", "0024-01-14 10:00", "1999-12-31 23:59", None],
+     "%Y-%m-%d %H:%M"),
+    (["4-01-14", "04-01-14", "24-01-14", "99-12-31", "2024-01-14", None], "%y-%m-%d"),
+])
+def test_mixed_width_years_parse_like_pandas(values, date_format):
+    column = pd.Series(values)
+    expected = pd.to_datetime(column, format=date_format, errors="coerce")
+    pd.testing.assert_series_equal(parse_dates(column, date_format), expected)
+
+def test_optimize_column_keeps_missing_values_as_nan():
+    values = [f"id-{i}" for i in range(10)] + [None]
+    text = pd.Series(values, dtype=STRING_DTYPE)
+    assert optimize_column(text) is text
+    optimized = optimize_column(pd.Series(values, dtype=object))
+    assert optimized.isna().tolist() == [False] * 10 + [True]
+    assert (optimized == "id-1").tolist() == [value == "id-1" for value in values]
+    assert optimized.iloc[-1] is np.nan
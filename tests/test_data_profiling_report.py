@@ -0,0 +1,18 @@
+import pandas as pd
+
+from dataProfrep.data_profiling_report import generate_ydata_profiling_report
+
+def failing_section():
+    yield "<p>first</p>"
+    raise RuntimeError("chart rendering failed")
+
+def test_failed_section_keeps_previous_report(tmp_path):
+    output = tmp_path / "report.html"
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    generate_ydata_profiling_report(df, "<p>detail</p>", "<p>summary</p>", str(output), profile_mode="off")
+    previous = output.read_text(encoding="utf-8")
+    assert "<p>detail</p>" in previous
+
+    generate_ydata_profiling_report(df, failing_section(), "<p>summary</p>", str(output), profile_mode="off")
+    assert output.read_text(encoding="utf-8") == previous
+    assert [path.name for path in tmp_path.iterdir()] == ["report.html"]
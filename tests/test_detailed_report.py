@@ -0,0 +1,28 @@
+import os
+
+from datadetairep import detailed_report
+from datadetairep.detailed_report import METRICS, render_all_charts
+
+def fake_render(col, values, metrics):
+    return {"bar_chart": f"bar-{col}", "heatmap": f"heat-{col}"}
+
+def test_chart_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(detailed_report, "render_charts", fake_render)
+    values = {col: [float(i)] * len(METRICS) for i, col in enumerate("abcd")}
+
+    def entry(col):
+        return tmp_path / f"{detailed_report._chart_cache_key(col, values[col], METRICS)}.json"
+
+    def render(col):
+        render_all_charts({col: values[col]}, cache_dir=str(tmp_path), max_workers=1, max_cache_entries=2)
+
+    for step, col in enumerate("abc"):
+        render(col)
+        # Spread the modification times, whatever the filesystem's resolution
+        os.utime(entry(col), (step, step))
+    assert [entry(col).exists() for col in "abc"] == [False, True, True]
+
+    # Reading "b" from the cache marks it as recently used, so "c" goes when "d" is added
+    render("b")
+    render("d")
+    assert [entry(col).exists() for col in "abcd"] == [False, True, False, True]
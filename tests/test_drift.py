@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataloD.data_loader import load_dataset_chunks
+from dataquame.data_quality_metrics import calculate_scores, calculate_scores_chunked
+from dataquame.drift import DatasetProfile, drift_scores
+
+@pytest.fixture
+def sparse_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 400
+    note = np.where(np.arange(n) >= 150, rng.choice(["late", "ok", "early"], n), None)
+    df = pd.DataFrame({"amount": rng.normal(size=n).round(2), "note": note})
+    path = tmp_path / "sparse.csv"
+    df.to_csv(path, index=False)
+    return path
+
+def test_all_missing_first_chunk_leaves_the_kind_open(sparse_csv):
+    # Types inferred per chunk make the all-missing first chunk numeric
+    chunks = list(load_dataset_chunks(sparse_csv, chunksize=100, infer_sample_rows=None))
+    assert chunks[0]["note"].dtype == "float64"
+    profile = DatasetProfile.from_frames(chunks)
+    assert profile.columns["note"]["kind"] == "categorical"
+    assert profile.columns["note"]["nulls"] == 150
+
+    restored = DatasetProfile.from_dict(json.loads(json.dumps(profile.to_dict())))
+    merged = DatasetProfile.from_frames(chunks[:1]).merge(DatasetProfile.from_frames(chunks[1:]))
+    for other in (restored, merged):
+        assert other.columns["note"]["kind"] == "categorical"
+        assert other.columns["note"]["nulls"] == 150
+
+def test_chunked_drift(sparse_csv):
+    scores_df = calculate_scores_chunked(load_dataset_chunks(sparse_csv, chunksize=100),
+                                         load_dataset_chunks(sparse_csv, chunksize=70), drift=True)
+    drift = scores_df.attrs["drift"]
+    assert drift["note"]["psi"] == pytest.approx(0, abs=1e-9)
+    assert drift["amount"]["distance"] == pytest.approx(0, abs=1e-9)
+
+def test_missing_drift_values_are_json_null():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [np.nan] * 3})
+    scores_df = calculate_scores(df, df.assign(b=["x", "y", "z"]), drift=True)
+    drift = json.loads(json.dumps(scores_df.attrs["drift"], allow_nan=False))
+    assert drift["b"]["psi"] is None and drift["b"]["distance"] is None
+    assert drift_scores(df, df).loc["b", "kind"] == "empty"
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataloD.data_loader import load_dataset
+from dataquame.data_quality_metrics import METRICS, calculate_scores
+from dataquame.failure_bitmaps import FailureBitmaps
+
+PAIRS = [
+    ("Ds'S/dataset_with_issues.csv", "Ds'S/detail_ds.csv"),
+    ("Ds'S/amazon.csv", "Ds'S/Amazon2.csv"),
+    ("Ds'S/sample.csv", "Ds'S/second_dataset.csv"),
+]
+
+def scores_from_bitmaps(failures, columns):
+    """Rebuild the percentages of ``scores_df`` from the failing rows alone."""
+    rows = failures.rows
+    scores = 100 * (1 - failures.summary().reindex(columns) / rows)
+    # Accuracy is scored over the non-missing rows only
+    for col in columns:
+        non_null = rows - failures.count(col, "Completeness")
+        inaccurate = failures.count(col, "Accuracy") - len(failures.intersect([(col, "Accuracy"), (col, "Completeness")]))
+        scores.loc[col, "Accuracy"] = 100 * (1 - inaccurate / non_null) if non_null else 100.0
+    return scores[METRICS]
+
+@pytest.mark.parametrize("dataset, reference", PAIRS)
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_bitmaps_reproduce_scores(dataset, reference, executor):
+    df, df2 = load_dataset(dataset), load_dataset(reference)
+    failures = FailureBitmaps()
+    scores_df = calculate_scores(df, df2, threshold_date="2024-01-01", executor=executor, max_workers=2,
+                                 failures=failures)
+    rebuilt = scores_from_bitmaps(failures, scores_df.index)
+    pd.testing.assert_frame_equal(rebuilt, scores_df, check_names=False, atol=1e-9)
+
+def test_missing_values_fail_accuracy():
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0, np.nan]})
+    df2 = pd.DataFrame({"a": [1.0, 2.0, 4.0, np.nan]})
+    failures = FailureBitmaps()
+    calculate_scores(df, df2, failures=failures)
+    assert failures.failing_rows("a", "Accuracy").tolist() == [1, 2, 3]
+    assert failures.failing_rows("a", "Consistency").tolist() == [1, 2]
+
+def test_queries_and_round_trip(tmp_path):
+    failures = FailureBitmaps()
+    failures.add("a", "Completeness", [True, False, True, False, True, False, False, False, True])
+    failures.add("b", "Validity", [True, True, False, False, True, False, False, False, True])
+    assert failures.intersect([("a", "Completeness"), ("b", "Validity")]).tolist() == [0, 4, 8]
+    assert failures.union([("a", "Completeness"), ("b", "Validity")]).tolist() == [0, 1, 2, 4, 8]
+    assert failures.failing_rows("a", "Timeliness").tolist() == []
+    assert failures.nbytes == 4
+
+    loaded = FailureBitmaps.load(failures.save(tmp_path / "failures.npz"))
+    assert loaded.rows == 9
+    pd.testing.assert_frame_equal(loaded.summary(), failures.summary())
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from databatch.batch_runner import ReferenceCache
+from dataserv.service import HTTPError, ScoringService, _report
+
+def test_data_path_stays_inside_data_dir(tmp_path):
+    service = ScoringService(max_workers=1, data_dir=tmp_path)
+    try:
+        assert service.data_path("ref.csv") == str(tmp_path.resolve() / "ref.csv")
+        for path in ["../outside.csv", "/etc/passwd", "sub/../../outside.csv"]:
+            with pytest.raises(HTTPError) as error:
+                service.data_path(path)
+            assert error.value.status == 403
+    finally:
+        service.pool.shutdown()
+
+def test_reference_cache_evicts_least_recently_used_unpinned():
+    loads = []
+
+    def load(path):
+        loads.append(path)
+        return pd.DataFrame({"path": [path]})
+
+    cache = ReferenceCache(load, max_entries=2)
+    cache.get("named", pin=True)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+    assert set(cache.loaded()) == {"named", "a", "c"}
+    cache.get("named")
+    cache.get("b")
+    assert loads == ["named", "a", "b", "c", "b"]
+
+def test_failed_report_is_an_error(tmp_path):
+    frame = pd.DataFrame({"a": [1, 2, 3]})
+    service = ScoringService(max_workers=1, load=lambda path: frame, data_dir=tmp_path)
+    output = str(tmp_path / "report.html")
+    request = {"csv": "a\n1\n2\n3\n", "reference": "ref.csv", "profile_mode": "off", "chart_format": "svg"}
+    try:
+        assert _report(service, request, output) == 100.0
+        with open(output, encoding="utf-8") as f:
+            previous = f.read()
+        with pytest.raises(HTTPError) as error:
+            _report(service, dict(request, chart_format="bmp"), output)
+        assert error.value.status == 500
+        with open(output, encoding="utf-8") as f:
+            assert f.read() == previous
+    finally:
+        service.pool.shutdown()
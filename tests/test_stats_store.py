@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from dataloD.columnar_io import write_columnar
+from dataloD.data_loader import load_dataset
+from dataquame.data_quality_metrics import calculate_scores
+from dataquame.stats_store import StatisticsStore, calculate_scores_incremental
+
+@pytest.fixture
+def partitions(tmp_path):
+    rng = np.random.default_rng(0)
+    frames = []
+    for day in range(3):
+        n = 50
+        frames.append(pd.DataFrame({
+            "id": np.arange(day * n, (day + 1) * n),
+            "name": rng.choice(["a", "b", None], n),
+            "amount": rng.normal(size=n).round(1),
+            "updated": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 200 * 24, n), unit="h"),
+            "stamped": pd.Timestamp("2024-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 200, n), unit="D"),
+        }))
+    paths = []
+    for i, frame in enumerate(frames):
+        frame.loc[frame.sample(5, random_state=i).index, "updated"] = pd.NaT
+        paths.append(tmp_path / f"part_{i}.parquet")
+        write_columnar(frame, paths[-1])
+    dataset = pd.concat([load_dataset(path) for path in paths], ignore_index=True)
+    reference = dataset.sample(frac=1, random_state=1).reset_index(drop=True)
+    return paths, dataset, reference
+
+@pytest.mark.parametrize("uniqueness", ["exact", "approx"])
+def test_threshold_changes_reuse_stored_partitions(tmp_path, partitions, uniqueness):
+    paths, dataset, reference = partitions
+    with StatisticsStore(str(tmp_path / "stats.sqlite")) as store:
+        for threshold, scored in [("2024-03-01", 3), ("2024-05-17", 0), ("2024-05-17 12:00", None)]:
+            scores_df = calculate_scores_incremental(paths, reference, store, "sales", threshold_date=threshold,
+                                                     uniqueness=uniqueness)
+            expected = calculate_scores(dataset, reference, threshold_date=threshold, uniqueness=uniqueness)
+            pd.testing.assert_frame_equal(scores_df, expected)
+            if scored is not None:
+                assert scores_df.attrs["partitions"]["scored"] == scored
+
+def test_store_holds_no_pickles(tmp_path, partitions):
+    paths, _, reference = partitions
+    with StatisticsStore(str(tmp_path / "stats.sqlite")) as store:
+        calculate_scores_incremental(paths, reference, store, "sales", threshold_date="2024-03-01")
+        blobs = store._connection.execute("SELECT aggregates FROM partition_aggregates").fetchall()
+    assert all(isinstance(blob, str) and blob.startswith("[") for blob, in blobs)